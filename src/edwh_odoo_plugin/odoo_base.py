@@ -13,10 +13,13 @@ Date: August 2025
 import os
 import re
 import base64
+import functools
 import html
 import secrets
+import threading
 import hashlib
 import logging
+from html.parser import HTMLParser
 from pathlib import Path
 from dotenv import load_dotenv
 from openerp_proxy import Client
@@ -34,6 +37,146 @@ warnings.filterwarnings("ignore",
                       category=UserWarning)
 
 
+# HTML tag -> (prefix, suffix) written around the tag's content by html_to_markdown
+MARKDOWN_TAGS = {
+    # Headers
+    'h1': ('# ', '\n'),
+    'h2': ('## ', '\n'),
+    'h3': ('### ', '\n'),
+    'h4': ('#### ', '\n'),
+    'h5': ('##### ', '\n'),
+    'h6': ('###### ', '\n'),
+
+    # Text formatting
+    'strong': ('**', '**'),
+    'b': ('**', '**'),
+    'em': ('*', '*'),
+    'i': ('*', '*'),
+    'u': ('_', '_'),
+    'code': ('`', '`'),
+
+    # Lists
+    'ul': ('\n', ''),  # a nested list starts on its own line
+    'ol': ('\n', ''),
+    'li': ('- ', '\n'),
+
+    # Paragraphs and blocks
+    'p': ('', '\n'),
+    'div': ('', '\n'),
+    'blockquote': ('> ', '\n'),
+}
+
+# Tags whose content is never shown as text
+MARKDOWN_SKIPPED_TAGS = frozenset({'script', 'style', 'head', 'title'})
+
+# Tags that an unclosed previous one of the same kind ends (like HTML does), unless one of
+# the container tags was opened in between: <li>a<li>b is two items, not one nested in the other
+MARKDOWN_IMPLICITLY_CLOSED_TAGS = {
+    'li': frozenset({'ul', 'ol'}),
+    'p': frozenset({'div', 'blockquote', 'li', 'ul', 'ol'}),
+}
+
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Config and filename sanitizing, compiled once instead of on every call
+UNSAFE_CONFIG_CHARS_RE = re.compile(r'[^a-zA-Z0-9.\-_@]')
+HOST_RE = re.compile(r'^[a-zA-Z0-9.\-]+$')
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+REPEATED_DOTS_RE = re.compile(r'\.\.+')
+
+# Base64 characters decoded per chunk when writing attachments (a multiple of 4, ~192KB decoded)
+BASE64_CHUNK_SIZE = 64 * 1024 * 4
+# Well-formed base64 without whitespace: padding only at the end, checked before any chunk is decoded
+BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+
+@functools.lru_cache(maxsize=1024)
+def terminal_link(url, text):
+    """Clickable terminal hyperlink, cached because many results link to the same project or task"""
+    # ANSI escape sequence for hyperlinks: \033]8;;URL\033\\TEXT\033]8;;\033\\
+    # Use \x1b instead of \033 for better compatibility
+    return f"\x1b]8;;{url}\x1b\\{text}\x1b]8;;\x1b\\"
+
+
+class MarkdownConverter(HTMLParser):
+    """
+    Convert HTML to markdown-like text in a single pass over the document
+
+    Entities are decoded as part of the text and never parsed as markup, so ``&lt;b&gt;``
+    comes out as a literal ``<b>``.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.open_tags = []  # stack of (tag, suffix) still waiting for their end tag
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in MARKDOWN_SKIPPED_TAGS:
+            self.skip_depth += 1
+            return
+
+        if tag == 'br':
+            self.parts.append('\n')
+            return
+
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.parts.append('[')
+                self.open_tags.append((tag, f']({href})'))
+            else:
+                self.open_tags.append((tag, ''))
+            return
+
+        containers = MARKDOWN_IMPLICITLY_CLOSED_TAGS.get(tag)
+        if containers:
+            for index in range(len(self.open_tags) - 1, -1, -1):
+                open_tag = self.open_tags[index][0]
+                if open_tag in containers:
+                    break
+                if open_tag == tag:
+                    self._close_from(index)
+                    break
+
+        markup = MARKDOWN_TAGS.get(tag)
+        if markup:
+            prefix, suffix = markup
+            self.parts.append(prefix)
+            self.open_tags.append((tag, suffix))
+
+    def handle_endtag(self, tag):
+        if tag in MARKDOWN_SKIPPED_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+
+        # Close the matching tag, and anything left unclosed inside it
+        for index in range(len(self.open_tags) - 1, -1, -1):
+            if self.open_tags[index][0] == tag:
+                self._close_from(index)
+                break
+
+    def _close_from(self, index):
+        """Close the open tag at index and every tag opened after it"""
+        for _, suffix in reversed(self.open_tags[index:]):
+            self.parts.append(suffix)
+        del self.open_tags[index:]
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+    def convert(self, html_content):
+        """Feed the whole document and return the collected text"""
+        self.feed(html_content)
+        self.close()
+        for _, suffix in reversed(self.open_tags):
+            self.parts.append(suffix)
+        self.open_tags = []
+        return ''.join(self.parts)
+
+
 class ConfigManager:
     """Centralized configuration management with security hardening"""
     
@@ -65,13 +208,13 @@ class ConfigManager:
         # Remove any potential injection characters
         if key in ['host', 'database', 'user']:
             # Allow only alphanumeric, dots, hyphens, underscores
-            sanitized = re.sub(r'[^a-zA-Z0-9.\-_@]', '', str(value))
+            sanitized = UNSAFE_CONFIG_CHARS_RE.sub('', str(value))
             if sanitized != value:
                 logger.warning(f"Sanitized config value for {key}")
             return sanitized
         elif key == 'protocol':
             # Only allow known protocols
-            if value not in ['xml-rpc', 'xml-rpcs']:
+            if value not in ['xml-rpc', 'xml-rpcs', 'json-rpc', 'json-rpcs']:
                 logger.error(f"Invalid protocol: {value}")
                 return 'xml-rpcs'  # Default to secure
         elif key == 'port':
@@ -135,7 +278,7 @@ class ConfigManager:
             raise ValueError(f"Missing required configuration variables: {', '.join(missing)}. Run 'edwh odoo.setup' to configure.")
         
         # Validate host format
-        if config['host'] and not re.match(r'^[a-zA-Z0-9.\-]+$', config['host']):
+        if config['host'] and not HOST_RE.match(config['host']):
             logger.error("Invalid host format")
             raise ValueError("Invalid host format")
         
@@ -148,45 +291,85 @@ class DomainBuilder:
     @staticmethod
     def combine_with_and(base_domain, *additional_conditions):
         """Combine domain with additional conditions using AND"""
-        domain = base_domain[:]
-        for condition in additional_conditions:
-            if condition:
-                domain = ['&'] + domain + [condition]
-        return domain
+        return DomainBuilder.and_domains(base_domain, *[[condition] for condition in additional_conditions if condition])
     
     @staticmethod
     def combine_with_or(*domains):
         """Combine multiple domains with OR"""
-        valid_domains = [d for d in domains if d]
-        if len(valid_domains) == 1:
-            return valid_domains[0]
-        elif len(valid_domains) == 2:
-            return ['|'] + valid_domains[0] + valid_domains[1]
-        elif len(valid_domains) > 2:
-            # Build nested OR structure
-            result = valid_domains[0]
-            for domain in valid_domains[1:]:
-                result = ['|'] + result + domain
-            return result
-        return []
+        return DomainBuilder.or_domains(*domains)
     
+    @staticmethod
+    def normalize_domain(domain):
+        """Make implicit ANDs explicit so a domain is in plain prefix notation"""
+        if not domain:
+            return []
+
+        arity = {'!': 1, '&': 2, '|': 2}
+        result = []
+        expected = 1  # number of terms still needed to complete the expression
+        for token in domain:
+            if expected == 0:
+                # A complete expression followed by more terms is an implicit AND
+                result.insert(0, '&')
+                expected = 1
+            if isinstance(token, (list, tuple)):
+                expected -= 1
+            else:
+                expected += arity.get(token, 0) - 1
+            result.append(token)
+        return result
+
+    @staticmethod
+    def and_domains(*domains):
+        """Combine domains into one normalized AND (like Odoo's expression.AND), skipping empty ones"""
+        normalized = [DomainBuilder.normalize_domain(domain) for domain in domains if domain]
+        if not normalized:
+            return []
+        return ['&'] * (len(normalized) - 1) + [token for domain in normalized for token in domain]
+
+    @staticmethod
+    def or_domains(*domains):
+        """Combine domains into one normalized OR (like Odoo's expression.OR), skipping empty ones"""
+        normalized = [DomainBuilder.normalize_domain(domain) for domain in domains if domain]
+        if not normalized:
+            return []
+        return ['|'] * (len(normalized) - 1) + [token for domain in normalized for token in domain]
+
+    @staticmethod
+    def search_terms(search_term):
+        """Alternative search terms as a list; search_term is one string or a list of strings"""
+        if not search_term:
+            return []
+        if isinstance(search_term, str):
+            return [search_term]
+        return [term for term in search_term if term]
+
     @staticmethod
     def text_search_domain(search_term, fields, include_descriptions=True):
-        """Build text search domain for multiple fields"""
+        """Build text search domain for multiple fields, matching any of the search terms"""
         if not include_descriptions:
             fields = [f for f in fields if 'description' not in f]
         
-        if len(fields) == 1:
-            return [(fields[0], 'ilike', search_term)]
+        conditions = [(field, 'ilike', term) for field in fields for term in DomainBuilder.search_terms(search_term)]
+        if len(conditions) == 1:
+            return conditions
         else:
-            conditions = [(field, 'ilike', search_term) for field in fields]
             return ['|'] * (len(conditions) - 1) + conditions
     
+    @staticmethod
+    def format_datetime(value):
+        """Format a datetime for a domain; strings are taken as already formatted"""
+        if not value:
+            return None
+        if isinstance(value, str):
+            return value
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+
     @staticmethod
     def date_filter_domain(since_date, date_field='write_date'):
-        """Build date filter domain"""
+        """Build date filter domain from a datetime or a pre-formatted datetime string"""
         if since_date:
-            return [(date_field, '>=', since_date.strftime('%Y-%m-%d %H:%M:%S'))]
+            return [(date_field, '>=', DomainBuilder.format_datetime(since_date))]
         return []
 
 
@@ -194,21 +377,21 @@ class ErrorHandler:
     """Standardized error handling"""
     
     @staticmethod
-    def handle_search_error(operation, error, verbose=False):
+    def handle_search_error(operation, error, verbose=False, out=None):
         """Standard error handling for search operations"""
-        print(f"❌ Error in {operation}: {error}")
+        print(f"❌ Error in {operation}: {error}", file=out)
         if verbose:
             import traceback
-            print(f"   Traceback: {traceback.format_exc()}")
+            print(f"   Traceback: {traceback.format_exc()}", file=out)
         return []
     
     @staticmethod
-    def handle_connection_error(error, verbose=False):
+    def handle_connection_error(error, verbose=False, out=None):
         """Standard error handling for connection issues"""
-        print(f"❌ Connection failed: {error}")
+        print(f"❌ Connection failed: {error}", file=out)
         if verbose:
             import traceback
-            print(f"   Traceback: {traceback.format_exc()}")
+            print(f"   Traceback: {traceback.format_exc()}", file=out)
         raise
 
 
@@ -228,6 +411,8 @@ class OdooBase:
     def __init__(self, verbose=False):
         """Initialize with .env configuration"""
         self.verbose = verbose
+        # Per-thread stream for progress output, so concurrent searches can each buffer theirs
+        self._output = threading.local()
         
         # Load configuration using centralized manager
         config = ConfigManager.load_config(verbose)
@@ -245,17 +430,24 @@ class OdooBase:
         # Simple in-memory caches
         self._user_name_cache = {}  # user_id -> (ts, name)
         self._user_name_ttl = 300   # seconds
+        # Download directories already created, so batch downloads don't mkdir per file
+        self._download_dirs = set()
 
         self._connect()
 
+    @property
+    def out(self):
+        """Stream this thread's progress output goes to; None (sys.stdout) unless a worker buffers it"""
+        return getattr(self._output, 'stream', None)
+
     def _connect(self):
         """Connect to Odoo with improved error handling"""
         try:
             if self.verbose:
-                print(f"🔌 Connecting to Odoo...")
-                print(f"   Host: {self.host}")
-                print(f"   Database: {self.database}")
-                print(f"   User: {self.user}")
+                print(f"🔌 Connecting to Odoo...", file=self.out)
+                print(f"   Host: {self.host}", file=self.out)
+                print(f"   Database: {self.database}", file=self.out)
+                print(f"   User: {self.user}", file=self.out)
 
             # Add connection timeout and retry logic
             import socket
@@ -271,7 +463,7 @@ class OdooBase:
             )
 
             if self.verbose:
-                print(f"✅ Connected as: {self.client.user.name} (ID: {self.client.uid})")
+                print(f"✅ Connected as: {self.client.user.name} (ID: {self.client.uid})", file=self.out)
 
             # Model shortcuts with error handling
             try:
@@ -284,7 +476,7 @@ class OdooBase:
                 raise
 
         except Exception as e:
-            ErrorHandler.handle_connection_error(e, self.verbose)
+            ErrorHandler.handle_connection_error(e, self.verbose, self.out)
 
     def extract_user_from_task(self, task):
         """Extract user ID and name from task using safe field access"""
@@ -349,66 +541,82 @@ class OdooBase:
         
         return user_id, user_name
 
-    def enrich_task_data(self, task, search_term=None):
-        """Unified task data enrichment"""
-        # Handle functools.partial objects
-        if hasattr(task, 'id') and not hasattr(task, 'name'):
-            task = self.tasks.browse(task.id)
-        
-        # Extract user info
-        user_id, user_name = self.extract_user_from_task(task)
-        
-        # Extract project info
-        project_name = 'No project'
-        project_id = None
-        if hasattr(task, 'project_id') and task.project_id:
-            try:
-                project_name = task.project_id.name if hasattr(task.project_id, 'name') else f'Project {task.project_id.id}'
-                project_id = task.project_id.id if hasattr(task.project_id, 'id') else task.project_id
-            except:
-                project_name = 'Project (unavailable)'
-        
-        # Extract stage info
-        stage_name = 'No stage'
-        stage_id = None
-        if hasattr(task, 'stage_id') and task.stage_id:
-            try:
-                if hasattr(task.stage_id, 'name'):
-                    stage_name = task.stage_id.name
-                    stage_id = task.stage_id.id if hasattr(task.stage_id, 'id') else task.stage_id
-                else:
-                    stage_id = task.stage_id
-                    stage_name = f'Stage {stage_id}'
-            except:
-                stage_name = 'Stage (unavailable)'
+    @staticmethod
+    def lower_terms(search_term):
+        """Lowercased search terms, to match many texts against without lowercasing the terms again"""
+        return tuple(term.lower() for term in DomainBuilder.search_terms(search_term))
+
+    @staticmethod
+    def matches_terms(text, terms_lower):
+        """Whether text contains any of the lowercased search terms"""
+        text_lower = text.lower()
+        return any(term in text_lower for term in terms_lower)
+
+    @staticmethod
+    def m2o_id(value):
+        """Get the ID from a many2one value as returned by read()/search_read() ([id, name] or False)"""
+        if isinstance(value, (list, tuple)) and value:
+            return value[0]
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return None
+
+    @staticmethod
+    def m2o_name(value, default):
+        """Get the display name from a many2one value as returned by read()/search_read()"""
+        if isinstance(value, (list, tuple)) and len(value) > 1:
+            return value[1]
+        return default
+
+    def enrich_task_row(self, row, search_term=None, terms_lower=None):
+        """
+        Unified task data enrichment for plain dicts from read()/search_read()
         
+        Callers enriching many rows can pass terms_lower (see lower_terms) so the terms are lowercased only once.
+        """
+        # Extract user info - same field order as extract_user_from_task
+        user_id = None
+        user_name = 'Unassigned'
+        user_ids = row.get('user_ids') or []
+        if user_ids:
+            user_id = user_ids[0]
+            user_name = self._get_user_name(user_id)
+        else:
+            for field_name in ['user_id', 'create_uid', 'write_uid']:
+                user_id = self.m2o_id(row.get(field_name))
+                if user_id:
+                    user_name = self.m2o_name(row.get(field_name), f'User {user_id}')
+                    break
+
         # Convert description to markdown
-        raw_description = getattr(task, 'description', '') or ''
+        raw_description = row.get('description') or ''
         markdown_description = self.html_to_markdown(raw_description) if raw_description else ''
-        
+
         enriched_data = {
-            'id': task.id,
-            'name': getattr(task, 'name', f'Task {task.id}'),
+            'id': row['id'],
+            'name': row.get('name') or f"Task {row['id']}",
             'description': markdown_description,
-            'project_name': project_name,
-            'project_id': project_id,
-            'stage': stage_name,
-            'stage_id': stage_id,
+            'project_name': self.m2o_name(row.get('project_id'), 'No project'),
+            'project_id': self.m2o_id(row.get('project_id')),
+            'stage': self.m2o_name(row.get('stage_id'), 'No stage'),
+            'stage_id': self.m2o_id(row.get('stage_id')),
             'user': user_name,
             'user_id': user_id,
-            'priority': getattr(task, 'priority', '0'),
-            'create_date': str(getattr(task, 'create_date', '')) if getattr(task, 'create_date', None) else '',
-            'write_date': str(getattr(task, 'write_date', '')) if getattr(task, 'write_date', None) else '',
+            'priority': row.get('priority') or '0',
+            'create_date': row.get('create_date') or '',
+            'write_date': row.get('write_date') or '',
             'type': 'task'
         }
-        
+
         if search_term:
+            if terms_lower is None:
+                terms_lower = self.lower_terms(search_term)
             enriched_data.update({
                 'search_term': search_term,
-                'match_in_name': search_term.lower() in enriched_data['name'].lower(),
-                'match_in_description': search_term.lower() in enriched_data['description'].lower()
+                'match_in_name': self.matches_terms(enriched_data['name'], terms_lower),
+                'match_in_description': self.matches_terms(markdown_description, terms_lower)
             })
-        
+
         return enriched_data
 
     def _sanitize_filename(self, filename):
@@ -417,8 +625,8 @@ class OdooBase:
             return "unknown_file"
         
         # Remove path separators and dangerous characters
-        sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename)
-        sanitized = re.sub(r'\.\.+', '.', sanitized)  # Remove multiple dots
+        sanitized = UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
+        sanitized = REPEATED_DOTS_RE.sub('.', sanitized)  # Remove multiple dots
         sanitized = sanitized.strip('. ')  # Remove leading/trailing dots and spaces
         
         # Ensure filename is not empty and not a reserved name
@@ -466,7 +674,8 @@ class OdooBase:
                 logger.error(f"Invalid attachment ID: {attachment_id}")
                 return False
             
-            attachment_records = self.attachments.search_records([('id', '=', attachment_id)])
+            # Only the name and data, not every attachment field through a lazy record
+            attachment_records = self.attachments.search_read([('id', '=', attachment_id)], ['name', 'datas'])
             
             if not attachment_records:
                 logger.warning(f"File with ID {attachment_id} not found")
@@ -475,21 +684,13 @@ class OdooBase:
                 return False
             
             attachment = attachment_records[0]
-            file_name = getattr(attachment, 'name', f'file_{attachment_id}')
+            file_name = attachment.get('name') or f'file_{attachment_id}'
             
             # Sanitize filename
             safe_filename = self._sanitize_filename(file_name)
             
-            if not hasattr(attachment, 'datas'):
-                logger.warning(f"No data field available for file {safe_filename}")
-                if self.verbose:
-                    print(f"❌ No data field available for file {safe_filename}")
-                return False
-            
             # Get file data
-            file_data_b64 = attachment.datas
-            if hasattr(file_data_b64, '__call__'):
-                file_data_b64 = file_data_b64()
+            file_data_b64 = attachment.get('datas')
             
             if not file_data_b64:
                 logger.warning(f"No data available for file {safe_filename}")
@@ -497,18 +698,21 @@ class OdooBase:
                     print(f"❌ No data available for file {safe_filename}")
                 return False
             
-            try:
-                file_data = base64.b64decode(file_data_b64)
-            except Exception as e:
-                logger.error(f"Failed to decode file data: {e}")
+            # Decoded in chunks while writing, so the whole file is never held decoded in memory
+            file_data_b64 = self.normalize_base64(file_data_b64)
+            if not self.is_valid_base64(file_data_b64):
+                logger.error(f"Invalid file data for file {safe_filename}")
+                if self.verbose:
+                    print(f"❌ Invalid file data for file {safe_filename}")
                 return False
+            file_size = self.decoded_base64_size(file_data_b64)
             
             # Validate file size (max 100MB)
             max_size = 100 * 1024 * 1024  # 100MB
-            if len(file_data) > max_size:
-                logger.error(f"File too large: {len(file_data)} bytes (max: {max_size})")
+            if file_size > max_size:
+                logger.error(f"File too large: {file_size} bytes (max: {max_size})")
                 if self.verbose:
-                    print(f"❌ File too large: {self.format_file_size(len(file_data))} (max: {self.format_file_size(max_size)})")
+                    print(f"❌ File too large: {self.format_file_size(file_size)} (max: {self.format_file_size(max_size)})")
                 return False
             
             # Validate and secure output path
@@ -519,29 +723,34 @@ class OdooBase:
             
             secure_path = self._validate_download_path(output_path)
             
-            # Create directory securely
-            try:
-                secure_path.parent.mkdir(parents=True, exist_ok=True, mode=0o755)
-            except Exception as e:
-                logger.error(f"Failed to create directory: {e}")
-                return False
+            # Create directory securely, once per directory
+            if secure_path.parent not in self._download_dirs:
+                try:
+                    secure_path.parent.mkdir(parents=True, exist_ok=True, mode=0o755)
+                except Exception as e:
+                    logger.error(f"Failed to create directory: {e}")
+                    return False
+                self._download_dirs.add(secure_path.parent)
             
             # Write file securely
             try:
                 with open(secure_path, 'wb') as f:
-                    f.write(file_data)
+                    for chunk in self.iter_base64_chunks(file_data_b64):
+                        f.write(chunk)
                 
                 # Set secure file permissions
                 secure_path.chmod(0o644)
                 
             except Exception as e:
                 logger.error(f"Failed to write file: {e}")
+                # Don't leave a partially decoded file behind
+                secure_path.unlink(missing_ok=True)
                 return False
             
             if self.verbose:
                 print(f"✅ Downloaded: {safe_filename}")
                 print(f"   To: {secure_path}")
-                print(f"   Size: {len(file_data)} bytes")
+                print(f"   Size: {file_size} bytes")
             
             logger.info(f"File downloaded successfully: {safe_filename}")
             return True
@@ -556,6 +765,10 @@ class OdooBase:
         """
         Convert HTML content to readable markdown-like text
         
+        Entities are decoded as text after parsing, so escaped markup such as
+        ``&lt;script&gt;`` is kept as the literal text ``<script>`` instead of being stripped.
+        CSV exports and pins carry that text as is.
+        
         Args:
             html_content: HTML string to convert
             
@@ -565,72 +778,16 @@ class OdooBase:
         if not html_content:
             return ""
         
-        try:
-            # First try to convert any markdown content back to HTML for consistency
-            import markdown2
-            # But since we're getting HTML from Odoo, we'll just strip tags
-            # and keep the existing logic for now
-            pass
-        except ImportError:
-            if self.verbose:
-                print("Warning: markdown2 not available")
-        
-        # Unescape HTML entities first
-        text = html.unescape(html_content)
-        
-        # Convert common HTML tags to markdown equivalents
-        conversions = [
-            # Headers
-            (r'<h1[^>]*>(.*?)</h1>', r'# \1'),
-            (r'<h2[^>]*>(.*?)</h2>', r'## \1'),
-            (r'<h3[^>]*>(.*?)</h3>', r'### \1'),
-            (r'<h4[^>]*>(.*?)</h4>', r'#### \1'),
-            (r'<h5[^>]*>(.*?)</h5>', r'##### \1'),
-            (r'<h6[^>]*>(.*?)</h6>', r'###### \1'),
-            
-            # Text formatting
-            (r'<strong[^>]*>(.*?)</strong>', r'**\1**'),
-            (r'<b[^>]*>(.*?)</b>', r'**\1**'),
-            (r'<em[^>]*>(.*?)</em>', r'*\1*'),
-            (r'<i[^>]*>(.*?)</i>', r'*\1*'),
-            (r'<u[^>]*>(.*?)</u>', r'_\1_'),
-            (r'<code[^>]*>(.*?)</code>', r'`\1`'),
-            
-            # Links
-            (r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', r'[\2](\1)'),
-            
-            # Lists
-            (r'<ul[^>]*>', r''),
-            (r'</ul>', r''),
-            (r'<ol[^>]*>', r''),
-            (r'</ol>', r''),
-            (r'<li[^>]*>(.*?)</li>', r'- \1'),
-            
-            # Paragraphs and breaks
-            (r'<p[^>]*>', r''),
-            (r'</p>', r'\n'),
-            (r'<br[^>]*/?>', r'\n'),
-            (r'<div[^>]*>', r''),
-            (r'</div>', r'\n'),
-            
-            # Blockquotes
-            (r'<blockquote[^>]*>(.*?)</blockquote>', r'> \1'),
-            
-            # Remove remaining HTML tags
-            (r'<[^>]+>', r''),
-            
-            # Clean up whitespace
-            (r'\n\s*\n\s*\n', r'\n\n'),  # Multiple newlines to double
-            (r'^\s+', r''),  # Leading whitespace
-            (r'\s+$', r''),  # Trailing whitespace
-        ]
-        
-        # Apply conversions
-        for pattern, replacement in conversions:
-            text = re.sub(pattern, replacement, text, flags=re.DOTALL | re.IGNORECASE)
+        # Plain text (no tags at all) only needs its entities unescaped, if it has any
+        if '<' not in html_content:
+            text = html.unescape(html_content) if '&' in html_content else html_content
+        else:
+            # Walk the document once; entities are unescaped by the parser
+            text = MarkdownConverter().convert(html_content)
         
         # Final cleanup
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
+        if '\n' in text:
+            text = BLANK_LINES_RE.sub('\n\n', text)  # Max 2 consecutive newlines
         text = text.strip()
         
         return text
@@ -682,9 +839,10 @@ class OdooBase:
         
         # Fetch from server on miss
         try:
-            user_records = self.client['res.users'].search_records([('id', '=', user_id)])
-            if user_records:
-                name = user_records[0].name
+            # One search_read with just the name, not a search plus a lazy read per attribute
+            user_rows = self.client['res.users'].search_read([('id', '=', user_id)], ['name'])
+            if user_rows:
+                name = user_rows[0]['name']
                 # Store in cache
                 try:
                     self._user_name_cache[user_id] = (time.time(), name)
@@ -708,9 +866,7 @@ class OdooBase:
         Returns:
             Formatted string with terminal hyperlink
         """
-        # ANSI escape sequence for hyperlinks: \033]8;;URL\033\\TEXT\033]8;;\033\\
-        # Use \x1b instead of \033 for better compatibility
-        return f"\x1b]8;;{url}\x1b\\{text}\x1b]8;;\x1b\\"
+        return terminal_link(url, text)
 
     def get_project_url(self, project_id):
         """Get the URL for a project"""
@@ -728,6 +884,30 @@ class OdooBase:
         """Get the URL for a file/attachment"""
         return f"{self.base_url}/web/content/{file_id}"
 
+    @staticmethod
+    def normalize_base64(data_b64):
+        """Base64 text without line breaks (older Odoo versions wrap binary fields every 76 characters)"""
+        if isinstance(data_b64, bytes):
+            data_b64 = data_b64.decode('ascii')
+        # Any stray whitespace would shift the 4 character alignment the chunked decoding relies on
+        return ''.join(data_b64.split())
+
+    @staticmethod
+    def is_valid_base64(data_b64):
+        """Whether normalized base64 text decodes cleanly, so chunked decoding can't fail halfway"""
+        return len(data_b64) % 4 == 0 and BASE64_RE.fullmatch(data_b64) is not None
+
+    @staticmethod
+    def decoded_base64_size(data_b64):
+        """Size in bytes of normalized base64 text once decoded, without decoding it"""
+        return len(data_b64) * 3 // 4 - data_b64[-2:].count('=')
+
+    @staticmethod
+    def iter_base64_chunks(data_b64, chunk_size=BASE64_CHUNK_SIZE):
+        """Decode normalized base64 text piece by piece; chunk_size must be a multiple of 4"""
+        for start in range(0, len(data_b64), chunk_size):
+            yield base64.b64decode(data_b64[start:start + chunk_size], validate=True)
+
     def format_file_size(self, size_bytes):
         """Format file size in human readable format"""
         if not size_bytes:
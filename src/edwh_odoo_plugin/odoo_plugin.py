@@ -255,9 +255,9 @@ def setup(c: Context,
         odoo_protocol = edwh.check_env(
             key="ODOO_PROTOCOL",
             default="xml-rpcs",
-            comment="Odoo protocol (xml-rpcs for HTTPS, xml-rpc for HTTP)",
+            comment="Odoo protocol (xml-rpcs for HTTPS, xml-rpc for HTTP; json-rpcs/json-rpc parse faster but open a connection per call)",
             env_path=dotenv_path,
-            allowed_values=("xml-rpc", "xml-rpcs")
+            allowed_values=("xml-rpc", "xml-rpcs", "json-rpc", "json-rpcs")
         )
         
         odoo_database = edwh.check_env(
@@ -28,12 +28,18 @@ Datum: Augustus 2025
 """
 
 import os
+import io
+import sys
 import base64
+import contextlib
 import csv
+import heapq
 import time
+from collections import defaultdict
 from functools import wraps
+from itertools import islice
 from datetime import datetime, timedelta
-from .odoo_base import OdooBase
+from .odoo_base import OdooBase, DomainBuilder
 import warnings
 
 # Suppress the pkg_resources deprecation warning from odoo_rpc_client globally
@@ -41,6 +47,14 @@ warnings.filterwarnings("ignore",
                       message="pkg_resources is deprecated as an API.*",
                       category=UserWarning)
 
+# Bestandsvelden die in één search_read opgehaald worden, in plaats van per attribuut
+BESTAND_VELDEN = ['name', 'mimetype', 'file_size', 'create_date', 'write_date', 'public', 'res_model', 'res_id']
+
+# Bestanden van projecten en/of taken, gefilterd door de server op res_model in plaats van een IN met alle ids
+PROJECT_BESTANDEN_DOMEIN = [('res_model', '=', 'project.project')]
+TAAK_BESTANDEN_DOMEIN = [('res_model', '=', 'project.task')]
+ALLE_BESTANDEN_DOMEIN = [('res_model', 'in', ['project.project', 'project.task'])]
+
 def timing_decorator(operation_name):
     """Decorator to time operations and log them"""
     def decorator(func):
@@ -110,14 +124,8 @@ class OdooProjectFileSearchFinal(OdooBase):
             task_condition = ['&', ('res_model', '=', 'project.task'), ('res_id', 'in', limited_task_ids)]
             conditions.append(task_condition)
 
-        # Combineer met OR - PLATTE STRUCTUUR
-        if len(conditions) == 1:
-            return conditions[0]
-        elif len(conditions) == 2:
-            # Platte OR structuur: ['|', condition1, condition2]
-            return ['|'] + conditions[0] + conditions[1]
-        else:
-            return []
+        # Combineer met OR - platte structuur: ['|', condition1, condition2]
+        return DomainBuilder.or_domains(*conditions)
 
     def _add_filters(self, base_domain, zoek_term=None, bestandstype=None, date_from=None):
         """
@@ -126,20 +134,13 @@ class OdooProjectFileSearchFinal(OdooBase):
         if not base_domain:
             return []
 
-        domain = base_domain[:]
-
-        # Voeg filters toe met AND - platte structuur
-        if zoek_term:
-            domain = ['&'] + domain + [('name', 'ilike', zoek_term)]
-
-        if bestandstype:
-            domain = ['&'] + domain + [('mimetype', 'ilike', bestandstype)]
-
-        if date_from:
-            date_str = date_from.strftime('%Y-%m-%d %H:%M:%S')
-            domain = ['&'] + domain + [('create_date', '>=', date_str)]
-
-        return domain
+        # Voeg filters toe met AND - platte structuur, in één keer opgebouwd
+        return DomainBuilder.and_domains(
+            base_domain,
+            [('name', 'ilike', zoek_term)] if zoek_term else [],
+            [('mimetype', 'ilike', bestandstype)] if bestandstype else [],
+            DomainBuilder.date_filter_domain(date_from, 'create_date')
+        )
 
     @timing_decorator("All Project Files Search")
     def zoek_alle_project_bestanden(self, zoek_term=None, bestandstype=None):
@@ -150,30 +151,16 @@ class OdooProjectFileSearchFinal(OdooBase):
         print("🔍 Zoeken naar alle project bestanden...")
 
         try:
-            # Haal ALLE project en task IDs op
-            query_start = time.time()
-            alle_projecten = self.projects.search_records([])
-            alle_taken = self.tasks.search_records([])
-            log_timing(self, "Project/Task ID query", query_start, f"({len(alle_projecten)} projects, {len(alle_taken)} tasks)")
-
-            project_ids = [p.id for p in alle_projecten]
-            task_ids = [t.id for t in alle_taken]
-
-            print(f"📊 Data overzicht:")
-            print(f"   Projecten: {len(project_ids)}")
-            print(f"   Taken: {len(task_ids)}")
-
             # Bouw werkend domein
             domain_start = time.time()
-            base_domain = self._build_working_domain(project_ids, task_ids)
-            final_domain = self._add_filters(base_domain, zoek_term, bestandstype)
+            final_domain = self._add_filters(ALLE_BESTANDEN_DOMEIN, zoek_term, bestandstype)
             log_timing(self, "Domain building", domain_start)
 
             print(f"🔧 Domein: {final_domain}")
 
             # Zoek bestanden
             search_start = time.time()
-            bestanden = self.attachments.search_records(final_domain)
+            bestanden = self.attachments.search_read(final_domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
 
             print(f"📄 {len(bestanden)} bestanden gevonden")
@@ -201,24 +188,15 @@ class OdooProjectFileSearchFinal(OdooBase):
         print("🔍 Zoeken naar project bestanden (geen taken)...")
 
         try:
-            query_start = time.time()
-            alle_projecten = self.projects.search_records([])
-            log_timing(self, "Project query", query_start, f"({len(alle_projecten)} projects)")
-            
-            project_ids = [p.id for p in alle_projecten]
-
-            print(f"📂 {len(project_ids)} projecten")
-
             # Simpel domein: alleen project bestanden
             domain_start = time.time()
-            base_domain = ['&', ('res_model', '=', 'project.project'), ('res_id', 'in', project_ids)]
-            final_domain = self._add_filters(base_domain, zoek_term, bestandstype)
+            final_domain = self._add_filters(PROJECT_BESTANDEN_DOMEIN, zoek_term, bestandstype)
             log_timing(self, "Domain building", domain_start)
 
             print(f"🔧 Domein: {final_domain}")
 
             search_start = time.time()
-            bestanden = self.attachments.search_records(final_domain)
+            bestanden = self.attachments.search_read(final_domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
             
             print(f"📄 {len(bestanden)} project bestanden gevonden")
@@ -244,24 +222,15 @@ class OdooProjectFileSearchFinal(OdooBase):
         print("🔍 Zoeken naar taak bestanden...")
 
         try:
-            query_start = time.time()
-            alle_taken = self.tasks.search_records([])
-            log_timing(self, "Task query", query_start, f"({len(alle_taken)} tasks)")
-            
-            task_ids = [t.id for t in alle_taken]
-
-            print(f"📋 {len(task_ids)} taken")
-
             # Simpel domein: alleen taak bestanden
             domain_start = time.time()
-            base_domain = ['&', ('res_model', '=', 'project.task'), ('res_id', 'in', task_ids)]
-            final_domain = self._add_filters(base_domain, zoek_term, bestandstype)
+            final_domain = self._add_filters(TAAK_BESTANDEN_DOMEIN, zoek_term, bestandstype)
             log_timing(self, "Domain building", domain_start)
 
             print(f"🔧 Domein: {final_domain}")
 
             search_start = time.time()
-            bestanden = self.attachments.search_records(final_domain)
+            bestanden = self.attachments.search_read(final_domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
             
             print(f"📄 {len(bestanden)} taak bestanden gevonden")
@@ -300,8 +269,8 @@ class OdooProjectFileSearchFinal(OdooBase):
 
             # Zoek taken in dit project
             task_start = time.time()
-            taken = self.tasks.search_records([('project_id', '=', project.id)])
-            task_ids = [t.id for t in taken] if taken else []
+            # Alleen de ids, zonder records met al hun velden te lezen
+            task_ids = self.tasks.search([('project_id', '=', project.id)])
             log_timing(self, "Task query", task_start, f"({len(task_ids)} tasks)")
 
             print(f"📋 {len(task_ids)} taken in dit project")
@@ -319,7 +288,7 @@ class OdooProjectFileSearchFinal(OdooBase):
             print(f"🔧 Domein: {domain}")
 
             search_start = time.time()
-            bestanden = self.attachments.search_records(domain)
+            bestanden = self.attachments.search_read(domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
             
             print(f"📄 {len(bestanden)} bestanden gevonden")
@@ -347,22 +316,15 @@ class OdooProjectFileSearchFinal(OdooBase):
         try:
             cutoff_date = datetime.now() - timedelta(days=dagen)
 
-            # Alle project/task IDs
-            query_start = time.time()
-            project_ids = [p.id for p in self.projects.search_records([])]
-            task_ids = [t.id for t in self.tasks.search_records([])]
-            log_timing(self, "Project/Task ID query", query_start, f"({len(project_ids)} projects, {len(task_ids)} tasks)")
-
             # Bouw domein met datum filter
             domain_start = time.time()
-            base_domain = self._build_working_domain(project_ids, task_ids)
-            final_domain = self._add_filters(base_domain, date_from=cutoff_date)
+            final_domain = self._add_filters(ALLE_BESTANDEN_DOMEIN, date_from=cutoff_date)
             log_timing(self, "Domain building", domain_start)
 
             print(f"🔧 Domein: {final_domain}")
 
             search_start = time.time()
-            bestanden = self.attachments.search_records(final_domain)
+            bestanden = self.attachments.search_read(final_domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
             
             print(f"📄 {len(bestanden)} recente bestanden gevonden")
@@ -388,20 +350,14 @@ class OdooProjectFileSearchFinal(OdooBase):
         print(f"🔍 Zoeken naar bestanden van type: {mime_type}")
 
         try:
-            query_start = time.time()
-            project_ids = [p.id for p in self.projects.search_records([])]
-            task_ids = [t.id for t in self.tasks.search_records([])]
-            log_timing(self, "Project/Task ID query", query_start, f"({len(project_ids)} projects, {len(task_ids)} tasks)")
-
             domain_start = time.time()
-            base_domain = self._build_working_domain(project_ids, task_ids)
-            final_domain = self._add_filters(base_domain, bestandstype=mime_type)
+            final_domain = self._add_filters(ALLE_BESTANDEN_DOMEIN, bestandstype=mime_type)
             log_timing(self, "Domain building", domain_start)
 
             print(f"🔧 Domein: {final_domain}")
 
             search_start = time.time()
-            bestanden = self.attachments.search_records(final_domain)
+            bestanden = self.attachments.search_read(final_domain, BESTAND_VELDEN)
             log_timing(self, "File search", search_start, f"({len(bestanden)} files)")
             
             print(f"📄 {len(bestanden)} bestanden van type {mime_type} gevonden")
@@ -418,6 +374,37 @@ class OdooProjectFileSearchFinal(OdooBase):
             print(f"❌ Fout: {e}")
             return []
 
+    def _lees_gekoppelde_records(self, model, bestanden, res_model, velden):
+        """
+        Lees de records waar bestanden aan gekoppeld zijn in één search_read, als {id: rij} en eventuele fout
+        """
+        ids = list({bestand['res_id'] for bestand in bestanden if bestand['res_model'] == res_model and bestand['res_id']})
+        if not ids:
+            return {}, None
+        try:
+            # Alleen velden die dit model (in deze Odoo versie) heeft
+            velden = [veld for veld in velden if veld in model.columns_info]
+            # search_read slaat verwijderde records over waar read() zou falen; ook gearchiveerde meenemen
+            rijen = model.search_read([('id', 'in', ids)], velden, context={'active_test': False})
+            return {rij['id']: rij for rij in rijen}, None
+        except Exception as e:
+            return {}, e
+
+    def _lees_toegewezen_gebruikers(self, taken):
+        """
+        Lees de namen van de eerste toegewezen gebruiker van alle taken zonder user_id in één search_read
+        """
+        ids = list({taak['user_ids'][0] for taak in taken.values() if not taak.get('user_id') and taak.get('user_ids')})
+        if not ids:
+            return {}
+        try:
+            rijen = self.client['res.users'].search_read([('id', 'in', ids)], ['name'], context={'active_test': False})
+            return {rij['id']: rij['name'] for rij in rijen}
+        except Exception as e:
+            if self.verbose:
+                print(f"⚠️  Gebruikers konden niet in één keer gelezen worden: {e}")
+            return {}
+
     @timing_decorator("File Enrichment")
     def _verrijk_bestanden(self, bestanden):
         """
@@ -426,42 +413,59 @@ class OdooProjectFileSearchFinal(OdooBase):
         start_time = time.time()
         verrijkte_bestanden = []
 
+        # Lees alle gekoppelde projecten en taken in één keer per model, niet één browse() per bestand
+        projecten, project_fout = self._lees_gekoppelde_records(
+            self.projects, bestanden, 'project.project', ['name', 'partner_id'])
+        taken, taak_fout = self._lees_gekoppelde_records(
+            self.tasks, bestanden, 'project.task', ['name', 'project_id', 'user_id', 'user_ids'])
+        gebruikers = self._lees_toegewezen_gebruikers(taken)
+
         for i, bestand in enumerate(bestanden):
             if self.verbose and i % 50 == 0:
                 print(f"   Processing file {i+1}/{len(bestanden)}")
             
             try:
-                verrijkt = {'id': bestand.id, 'naam': bestand.name, 'type_mime': bestand.mimetype or 'Onbekend', 'grootte': bestand.file_size or 0,
-                    'grootte_human': self.format_file_size(bestand.file_size or 0),
-                    'aangemaakt': str(bestand.create_date) if bestand.create_date else 'Onbekend',
-                    'gewijzigd': str(bestand.write_date) if bestand.write_date else 'Onbekend', 'publiek': bestand.public, 'model': bestand.res_model,
-                    'record_id': bestand.res_id, }
+                res_model = bestand.get('res_model')
+                res_id = bestand.get('res_id')
+                grootte = bestand.get('file_size') or 0
+                verrijkt = {'id': bestand['id'], 'naam': bestand.get('name'), 'type_mime': bestand.get('mimetype') or 'Onbekend', 'grootte': grootte,
+                    'grootte_human': self.format_file_size(grootte),
+                    'aangemaakt': bestand.get('create_date') or 'Onbekend',
+                    'gewijzigd': bestand.get('write_date') or 'Onbekend', 'publiek': bestand.get('public'), 'model': res_model,
+                    'record_id': res_id, }
 
                 # Voeg model-specifieke informatie toe
-                if bestand.res_model == 'project.project':
-                    try:
-                        project = self.projects.browse(bestand.res_id)
-                        verrijkt.update({'type': 'Project', 'project_naam': project.name, 'project_id': project.id,
-                            'klant': project.partner_id.name if project.partner_id else 'Geen klant', })
-                    except Exception as e:
-                        verrijkt.update({'type': 'Project', 'project_naam': f'Project {bestand.res_id}', 'fout': f'Project info niet beschikbaar: {e}'})
-
-                elif bestand.res_model == 'project.task':
-                    try:
-                        taak = self.tasks.browse(bestand.res_id)
-                        verrijkt.update({'type': 'Taak', 'taak_naam': taak.name, 'taak_id': taak.id,
-                            'project_naam': taak.project_id.name if taak.project_id else 'Geen project',
-                            'project_id': taak.project_id.id if taak.project_id else None,
-                            'toegewezen': taak.user_id.name if taak.user_id else 'Niet toegewezen', })
-                    except Exception as e:
-                        verrijkt.update({'type': 'Taak', 'taak_naam': f'Taak {bestand.res_id}', 'fout': f'Taak info niet beschikbaar: {e}'})
+                if res_model == 'project.project':
+                    project = projecten.get(res_id)
+                    if project:
+                        verrijkt.update({'type': 'Project', 'project_naam': project['name'], 'project_id': project['id'],
+                            'klant': self.m2o_name(project.get('partner_id'), 'Geen klant'), })
+                    else:
+                        verrijkt.update({'type': 'Project', 'project_naam': f'Project {res_id}',
+                            'fout': f'Project info niet beschikbaar: {project_fout or "niet gevonden"}'})
+
+                elif res_model == 'project.task':
+                    taak = taken.get(res_id)
+                    if taak:
+                        # Oudere Odoo versies hebben user_id, nieuwere user_ids
+                        toegewezen = self.m2o_name(taak.get('user_id'), None)
+                        if not toegewezen and taak.get('user_ids'):
+                            gebruiker_id = taak['user_ids'][0]
+                            toegewezen = gebruikers.get(gebruiker_id) or self._get_user_name(gebruiker_id)
+                        verrijkt.update({'type': 'Taak', 'taak_naam': taak['name'], 'taak_id': taak['id'],
+                            'project_naam': self.m2o_name(taak.get('project_id'), 'Geen project'),
+                            'project_id': self.m2o_id(taak.get('project_id')),
+                            'toegewezen': toegewezen or 'Niet toegewezen', })
+                    else:
+                        verrijkt.update({'type': 'Taak', 'taak_naam': f'Taak {res_id}',
+                            'fout': f'Taak info niet beschikbaar: {taak_fout or "niet gevonden"}'})
 
                 verrijkte_bestanden.append(verrijkt)
 
             except Exception as e:
-                print(f"⚠️  Fout bij verrijken bestand {bestand.id}: {e}")
+                print(f"⚠️  Fout bij verrijken bestand {bestand.get('id')}: {e}")
                 # Voeg minimale info toe
-                verrijkte_bestanden.append({'id': bestand.id, 'naam': getattr(bestand, 'name', 'Onbekend'), 'fout': f'Verrijking gefaald: {e}'})
+                verrijkte_bestanden.append({'id': bestand.get('id'), 'naam': bestand.get('name') or 'Onbekend', 'fout': f'Verrijking gefaald: {e}'})
                 continue
 
         log_timing(self, "File enrichment processing", start_time, f"({len(verrijkte_bestanden)} files)")
@@ -484,6 +488,23 @@ class OdooProjectFileSearchFinal(OdooBase):
             print(f"✅ Gedownload naar: {output_path}")
         return success
 
+    @staticmethod
+    def _veilig_bestand(bestand):
+        """
+        Kopie van een bestand dict met eventuele Odoo objecten vervangen door hun id of tekst
+        """
+        safe_bestand = {}
+        for k, v in bestand.items():
+            if hasattr(v, '__class__') and 'odoo' in str(v.__class__).lower():
+                # Handle Odoo objects
+                if hasattr(v, 'id'):
+                    safe_bestand[k] = v.id
+                else:
+                    safe_bestand[k] = str(v)
+            else:
+                safe_bestand[k] = v
+        return safe_bestand
+
     def export_naar_csv(self, bestanden, filename='project_bestanden.csv'):
         """
         Exporteer naar CSV
@@ -494,30 +515,16 @@ class OdooProjectFileSearchFinal(OdooBase):
 
         try:
             # Convert data to strings for CSV export
-            safe_bestanden = []
-            for bestand in bestanden:
-                safe_bestand = {}
-                for k, v in bestand.items():
-                    if hasattr(v, '__class__') and 'odoo' in str(v.__class__).lower():
-                        # Handle Odoo objects
-                        if hasattr(v, 'id'):
-                            safe_bestand[k] = v.id
-                        else:
-                            safe_bestand[k] = str(v)
-                    else:
-                        safe_bestand[k] = v
-                safe_bestanden.append(safe_bestand)
+            safe_bestanden = [self._veilig_bestand(bestand) for bestand in bestanden]
             
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                # Bepaal velden uit eerste bestand
-                fieldnames = safe_bestanden[0].keys()
+                # Bepaal velden uit alle bestanden in volgorde van voorkomen (projecten en taken hebben andere velden)
+                fieldnames = list(dict.fromkeys(k for bestand in safe_bestanden for k in bestand))
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
 
                 writer.writeheader()
-                for bestand in safe_bestanden:
-                    # Converteer alle waarden naar strings voor CSV
-                    csv_row = {k: str(v) if v is not None else '' for k, v in bestand.items()}
-                    writer.writerow(csv_row)
+                # Converteer alle waarden naar strings voor CSV, in één writerows aanroep
+                writer.writerows({k: str(v) if v is not None else '' for k, v in bestand.items()} for bestand in safe_bestanden)
 
             print(f"✅ {len(safe_bestanden)} bestanden geëxporteerd naar {filename}")
 
@@ -532,12 +539,9 @@ class OdooProjectFileSearchFinal(OdooBase):
         print("=" * 60)
 
         try:
-            # Basis aantallen
-            projecten = self.projects.search_records([])
-            taken = self.tasks.search_records([])
-
-            print(f"📂 Totaal projecten: {len(projecten)}")
-            print(f"📋 Totaal taken: {len(taken)}")
+            # Basis aantallen, geteld door de server
+            print(f"📂 Totaal projecten: {self.projects.search_count([])}")
+            print(f"📋 Totaal taken: {self.tasks.search_count([])}")
 
             # Test verschillende zoektypes
             print(f"\n📄 BESTAND AANTALLEN:")
@@ -568,28 +572,25 @@ class OdooProjectFileSearchFinal(OdooBase):
         """
         print(f"\n📊 TYPE VERDELING:")
 
-        type_stats = {}
+        type_stats = defaultdict(lambda: {'count': 0, 'size': 0})
         grootte_totaal = 0
 
         for bestand in bestanden:
-            mime_type = bestand.get('type_mime', 'Onbekend')
             grootte = bestand.get('grootte', 0) or 0
 
             grootte_totaal += grootte
 
-            if mime_type in type_stats:
-                type_stats[mime_type]['count'] += 1
-                type_stats[mime_type]['size'] += grootte
-            else:
-                type_stats[mime_type] = {'count': 1, 'size': grootte}
+            stats = type_stats[bestand.get('type_mime', 'Onbekend')]
+            stats['count'] += 1
+            stats['size'] += grootte
 
         print(f"💾 Totale grootte: {self.format_file_size(grootte_totaal)}")
         print(f"\n📈 Top bestandstypes:")
 
-        # Sorteer op aantal
-        sorted_types = sorted(type_stats.items(), key=lambda x: x[1]['count'], reverse=True)
+        # Top 10 op aantal, zonder alle types te sorteren
+        top_types = heapq.nlargest(10, type_stats.items(), key=lambda x: x[1]['count'])
 
-        for i, (mime_type, stats) in enumerate(sorted_types[:10], 1):
+        for i, (mime_type, stats) in enumerate(top_types, 1):
             count = stats['count']
             size = self.format_file_size(stats['size'])
             percentage = (count / len(bestanden)) * 100
@@ -600,34 +601,32 @@ class OdooProjectFileSearchFinal(OdooBase):
         """
         Print resultaten in mooie opmaak
         """
+        # Schrijf alles eerst naar een buffer en dan in één keer naar stdout, in plaats van per print()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            self._toon_resultaten(bestanden, limit)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+    def _toon_resultaten(self, bestanden, limit):
+        """
+        Print de resultaten lijst
+        """
         if not bestanden:
             print("📭 Geen bestanden gevonden.")
             return
 
-        # Convert data for safe printing
-        safe_bestanden = []
-        for bestand in bestanden:
-            safe_bestand = {}
-            for k, v in bestand.items():
-                if hasattr(v, '__class__') and 'odoo' in str(v.__class__).lower():
-                    # Handle Odoo objects
-                    if hasattr(v, 'id'):
-                        safe_bestand[k] = v.id
-                    else:
-                        safe_bestand[k] = str(v)
-                else:
-                    safe_bestand[k] = v
-            safe_bestanden.append(safe_bestand)
-
-        if limit and len(safe_bestanden) > limit:
-            print(f"\n📁 Eerste {limit} van {len(safe_bestanden)} bestanden:")
-            safe_bestanden = safe_bestanden[:limit]
+        if limit and len(bestanden) > limit:
+            print(f"\n📁 Eerste {limit} van {len(bestanden)} bestanden:")
+            # Alleen de getoonde bestanden doorlopen, zonder de lijst te kopiëren
+            bestanden = islice(bestanden, limit)
         else:
-            print(f"\n📁 {len(safe_bestanden)} bestand(en) gevonden:")
+            print(f"\n📁 {len(bestanden)} bestand(en) gevonden:")
 
         print("=" * 90)
 
-        for i, bestand in enumerate(safe_bestanden, 1):
+        # Convert data for safe printing, only for the files that are shown
+        for i, bestand in enumerate(map(self._veilig_bestand, bestanden), 1):
             print(f"\n{i:2}. 📄 {bestand['naam']}")
             print(f"      🆔 ID: {bestand['id']}")
 
@@ -19,6 +19,9 @@ import time
 from .odoo_base import OdooBase
 from .text_search import OdooTextSearch
 
+# Stage names used when a task has no real stage, checked once per task when printing
+PLACEHOLDER_STAGE_NAMES = frozenset({'No stage', 'Unknown'})
+
 
 class TaskManager(OdooBase):
     """
@@ -1144,7 +1147,7 @@ class TaskManager(OdooBase):
         
         # Try alternative stage field names
         for stage_field in ['task_stage_id', 'project_task_stage_id', 'kanban_stage_id']:
-            if task_dict['stage_name'] in ['No stage', 'Unknown'] and hasattr(task, stage_field):
+            if task_dict['stage_name'] in PLACEHOLDER_STAGE_NAMES and hasattr(task, stage_field):
                 try:
                     stage_value = getattr(task, stage_field)
                     if stage_value and hasattr(stage_value, 'name'):
@@ -1254,7 +1257,7 @@ class TaskManager(OdooBase):
             if task.get('user') and task['user'] != 'Unassigned':
                 status_parts.append(f"👤 {task['user']}")
             
-            if task.get('stage_name') and task['stage_name'] not in ['Unknown', 'No stage']:
+            if task.get('stage_name') and task['stage_name'] not in PLACEHOLDER_STAGE_NAMES:
                 status_parts.append(f"📊 {task['stage_name']}")
             
             priority_value = task.get('priority', '0')
@@ -1306,7 +1309,7 @@ class TaskManager(OdooBase):
             if task.get('user') and task['user'] != 'Unassigned':
                 print(f"{indent}👤 Assigned: {task['user']}")
             
-            if task.get('stage_name') and task['stage_name'] not in ['Unknown', 'No stage']:
+            if task.get('stage_name') and task['stage_name'] not in PLACEHOLDER_STAGE_NAMES:
                 print(f"{indent}📊 Stage: {task['stage_name']}")
             
             priority_value = task.get('priority', '0')
@@ -1356,7 +1359,7 @@ class TaskManager(OdooBase):
                 user_id_info = f" (ID: {task['user_id']})" if task.get('user_id') else ""
                 print(f"{indent}👤 Assigned: {task['user']}{user_id_info}")
             
-            if task.get('stage_name') and task['stage_name'] not in ['Unknown', 'No stage']:
+            if task.get('stage_name') and task['stage_name'] not in PLACEHOLDER_STAGE_NAMES:
                 stage_id_info = f" (ID: {task['stage_id']})" if task.get('stage_id') else ""
                 print(f"{indent}📊 Stage: {task['stage_name']}{stage_id_info}")
             
@@ -20,19 +20,110 @@ Date: August 2025
 """
 
 import os
+import io
+import sys
+import copy
 import argparse
+import contextlib
+import functools
+import heapq
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime, timedelta
 import re
 import csv
+import string
+import time
 import html
 import base64
 import textwrap
 import logging
-from .odoo_base import OdooBase
+from .odoo_base import OdooBase, DomainBuilder
 
 # Configure secure logging
 logger = logging.getLogger(__name__)
 
+# Fields fetched per model in a single search_read()/read() round trip
+PROJECT_FIELDS = ['name', 'description', 'partner_id', 'user_id', 'stage_id', 'create_date', 'write_date']
+TASK_FIELDS = ['name', 'description', 'project_id', 'stage_id', 'user_ids', 'create_uid', 'write_uid',
+               'priority', 'create_date', 'write_date']
+MESSAGE_FIELDS = ['subject', 'body', 'author_id', 'date', 'model', 'res_id']
+FILE_FIELDS = ['name', 'mimetype', 'file_size', 'create_date', 'write_date', 'public', 'res_model', 'res_id']
+# Related records of files and messages only need names, not (HTML) descriptions
+PROJECT_CACHE_FIELDS = [field for field in PROJECT_FIELDS if field != 'description']
+FILE_TASK_FIELDS = ['name', 'project_id', 'user_ids']
+
+# Time reference parsing: allowed characters, and unit -> (days per unit, maximum number)
+TIME_REFERENCE_CHARS = frozenset(string.ascii_lowercase + string.digits + string.whitespace)
+TIME_UNITS = {
+    # English and Dutch day units, max 1 year in days
+    'day': (1, 365), 'days': (1, 365), 'dag': (1, 365), 'dagen': (1, 365),
+    # English and Dutch week units, max 1 year in weeks
+    'week': (7, 52), 'weeks': (7, 52), 'weken': (7, 52),
+    # English and Dutch month units, max 1 year in months (approximate)
+    'month': (30, 12), 'months': (30, 12), 'maand': (30, 12), 'maanden': (30, 12),
+    # English and Dutch year units, max 10 years (approximate)
+    'year': (365, 10), 'years': (365, 10), 'jaar': (365, 10), 'jaren': (365, 10),
+}
+
+# Keys of each enriched result type, used as CSV export columns
+EXPORT_COLUMNS = {
+    'projects': ('id', 'name', 'description', 'partner', 'stage', 'user', 'create_date', 'write_date',
+                 'type', 'search_term', 'match_in_name', 'match_in_description'),
+    'tasks': ('id', 'name', 'description', 'project_name', 'project_id', 'stage', 'stage_id', 'user', 'user_id',
+              'priority', 'create_date', 'write_date', 'type', 'search_term', 'match_in_name', 'match_in_description'),
+    'messages': ('id', 'subject', 'body', 'author', 'date', 'model', 'res_id', 'related_name', 'related_type',
+                 'type', 'search_term'),
+    'files': ('id', 'name', 'mimetype', 'file_size', 'file_size_human', 'create_date', 'write_date', 'public',
+              'res_model', 'res_id', 'type', 'search_term', 'related_type', 'related_name', 'related_id',
+              'project_name', 'project_id', 'client', 'task_name', 'task_id', 'assigned_user', 'model_name', 'error'),
+}
+
+# Related record type (message model or file label) -> method building its URL
+RELATED_URL_BUILDERS = {
+    'project.project': 'get_project_url',
+    'project.task': 'get_task_url',
+    'Project': 'get_project_url',
+    'Task': 'get_task_url',
+}
+
+# Rows per search_read call, so a noisy mailbox is never fetched in one response
+SEARCH_PAGE_SIZE = 1000
+
+# Search term sanitizing, compiled once instead of on every search
+UNSAFE_SEARCH_CHARS_RE = re.compile(r'[^\w\s\-.,!?@#$%^&*()+=\[\]{}|;:\'\"<>/\\`~]')
+SQL_INJECTION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION|SCRIPT)\b)',
+    r'(--|/\*|\*/)',
+    r'(\bOR\b.*\b=\b)',
+    r'(\bAND\b.*\b=\b)',
+    r'(\'.*\')',
+    r'(;.*)',
+])
+
+
+@functools.lru_cache(maxsize=128)
+def _time_reference_to_timedelta(time_ref):
+    """Turn a sanitized time reference into how far back it reaches (cached per reference)"""
+    # Format: number + unit (English and Dutch), the space between them is optional
+    unit = time_ref.lstrip('0123456789')
+    digits = time_ref[:len(time_ref) - len(unit)]
+    unit = unit.strip()
+    
+    if not digits or len(digits) > 3 or unit not in TIME_UNITS:
+        logger.warning(f"Invalid time reference format: {time_ref}")
+        return None
+    
+    days_per_unit, maximum = TIME_UNITS[unit]
+    return timedelta(days=min(int(digits), maximum) * days_per_unit)
+
+
+def describe_terms(search_term):
+    """Search term(s) as one line for progress output"""
+    return ' | '.join(DomainBuilder.search_terms(search_term))
+
 
 class OdooTextSearch(OdooBase):
     """
@@ -59,6 +150,14 @@ class OdooTextSearch(OdooBase):
         self.project_task_map = {}  # Map project_id -> [task_ids]
         self.task_project_map = {}  # Map task_id -> project_id
         self.attachment_cache = {}  # Cache attachment metadata
+        self.model_fields_cache = {}  # Map model name -> available field names
+        self.related_name_cache = {}  # Map (model, id) -> (ts, name), oldest first
+        self.related_name_ttl = 300  # seconds
+        self.related_name_cache_size = 4096
+        self.related_name_lock = threading.Lock()  # Searches running concurrently all fill the cache
+        self.connection_pool = []  # Idle worker searchers that each keep their own connection alive
+        self.truncated_results = {}  # result key -> whether its last search hit the limit, shared with workers
+        self.connection_pool_lock = threading.Lock()
         
         # Cache initialization flags
         self._user_cache_built = False
@@ -79,20 +178,11 @@ class OdooTextSearch(OdooBase):
         
         # Remove potentially dangerous characters for SQL injection
         # Keep alphanumeric, spaces, and common punctuation
-        sanitized = re.sub(r'[^\w\s\-.,!?@#$%^&*()+=\[\]{}|;:\'\"<>/\\`~]', '', search_term)
+        sanitized = UNSAFE_SEARCH_CHARS_RE.sub('', search_term)
         
         # Remove SQL injection patterns
-        sql_patterns = [
-            r'(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION|SCRIPT)\b)',
-            r'(--|/\*|\*/)',
-            r'(\bOR\b.*\b=\b)',
-            r'(\bAND\b.*\b=\b)',
-            r'(\'.*\')',
-            r'(;.*)',
-        ]
-        
-        for pattern in sql_patterns:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+        for pattern in SQL_INJECTION_RES:
+            sanitized = pattern.sub('', sanitized)
         
         # Trim whitespace
         sanitized = sanitized.strip()
@@ -113,63 +203,29 @@ class OdooTextSearch(OdooBase):
         time_ref = str(time_ref).lower().strip()[:50]  # Limit length
         
         # Only allow safe characters
-        if not re.match(r'^[a-z0-9\s]+$', time_ref):
+        if not TIME_REFERENCE_CHARS.issuperset(time_ref):
             logger.warning(f"Invalid characters in time reference: {time_ref}")
             return None
         
-        # Pattern: number + unit (English and Dutch)
-        pattern = r'^(\d{1,3})\s*(day|days|dag|dagen|week|weeks|weken|month|months|maand|maanden|year|years|jaar|jaren)$'
-        match = re.match(pattern, time_ref)
-        
-        if not match:
-            logger.warning(f"Invalid time reference format: {time_ref}")
+        delta = _time_reference_to_timedelta(time_ref)
+        if delta is None:
             return None
         
-        number = int(match.group(1))
-        unit = match.group(2)
-        
-        # Validate reasonable limits
-        if number > 999:
-            logger.warning(f"Time reference number too large: {number}")
-            return None
-        
-        now = datetime.now()
-        
-        # English and Dutch day units
-        if unit in ['day', 'days', 'dag', 'dagen']:
-            if number > 365:  # Max 1 year in days
-                number = 365
-            return now - timedelta(days=number)
-        # English and Dutch week units
-        elif unit in ['week', 'weeks', 'weken']:
-            if number > 52:  # Max 1 year in weeks
-                number = 52
-            return now - timedelta(weeks=number)
-        # English and Dutch month units
-        elif unit in ['month', 'months', 'maand', 'maanden']:
-            if number > 12:  # Max 1 year in months
-                number = 12
-            return now - timedelta(days=number * 30)  # Approximate
-        # English and Dutch year units
-        elif unit in ['year', 'years', 'jaar', 'jaren']:
-            if number > 10:  # Max 10 years
-                number = 10
-            return now - timedelta(days=number * 365)  # Approximate
-        
-        return None
+        # Round to the minute so repeated searches within a minute build the same domain
+        return datetime.now().replace(second=0, microsecond=0) - delta
 
     def search_projects(self, search_term, since=None, include_descriptions=True, limit=None):
         """
         Search in project names and descriptions using safe database queries
         
         Args:
-            search_term: Text to search for
-            since: Datetime to limit search from
+            search_term: Text to search for, or a list of texts to match any of
+            since: Datetime (or pre-formatted datetime string) to limit search from
             include_descriptions: Whether to search in descriptions
             limit: Maximum number of results to return
         """
-        # Sanitize search term
-        sanitized_term = self._sanitize_search_term(search_term)
+        # Sanitize search terms
+        sanitized_term = [term for term in map(self._sanitize_search_term, DomainBuilder.search_terms(search_term)) if term]
         if not sanitized_term:
             logger.warning("Empty search term after sanitization")
             return []
@@ -179,352 +235,184 @@ class OdooTextSearch(OdooBase):
             limit = self.max_results_per_query
         
         if self.verbose:
-            print(f"🔍 Searching projects for: '{sanitized_term[:50]}...'")
+            print(f"🔍 Searching projects for: '{describe_terms(sanitized_term)[:50]}...'", file=self.out)
         else:
-            print(f"🔍 Searching projects...", end="", flush=True)
+            print(f"🔍 Searching projects...", end="", flush=True, file=self.out)
         
         try:
-            # Build simple, safe domain
-            domain = []
-            
-            # Text search - use simple structure
-            if include_descriptions:
-                domain = ['|', ('name', 'ilike', sanitized_term), ('description', 'ilike', sanitized_term)]
-            else:
-                domain = [('name', 'ilike', sanitized_term)]
-            
-            # Add time filter if specified
-            if since:
-                date_condition = ('write_date', '>=', since.strftime('%Y-%m-%d %H:%M:%S'))
-                if domain:
-                    domain = ['&'] + domain + [date_condition]
-                else:
-                    domain = [date_condition]
+            # Build simple, safe domain: time filter AND text search
+            text_fields = ['name', 'description'] if include_descriptions else ['name']
+            domain = DomainBuilder.and_domains(
+                DomainBuilder.date_filter_domain(since),
+                DomainBuilder.text_search_domain(sanitized_term, text_fields, include_descriptions)
+            )
             
             if self.verbose:
-                print(f"🔧 Project domain: {domain}")
+                print(f"🔧 Project domain: {domain}", file=self.out)
             
             # Search with safe parameters
-            search_kwargs = {
-                'limit': min(limit, 1000),  # Hard limit to prevent server overload
-                'order': 'write_date desc'
-            }
-            
-            projects = self.projects.search_records(domain, **search_kwargs)
+            limit = min(limit, 1000)  # Hard limit to prevent server overload
+            rows = self._search_read_paged(self.projects, domain, self._read_fields(self.projects, PROJECT_FIELDS),
+                                           limit, 'write_date desc')
             
             if self.verbose:
-                print(f"📂 Found {len(projects)} matching projects")
+                print(f"📂 Found {self._found_count(self.projects, domain, len(rows), limit, 'projects')} matching projects", file=self.out)
             else:
-                print(f" {len(projects)} found", flush=True)
-            
-            # Process projects with safe field access
-            enriched_projects = []
-            for project in projects:
-                try:
-                    # Safe field access with fallbacks
-                    project_data = {
-                        'id': project.id,
-                        'name': getattr(project, 'name', f'Project {project.id}'),
-                        'description': '',
-                        'partner_id': None,
-                        'partner_name': 'No client',
-                        'user_id': None,
-                        'user_name': 'Unassigned',
-                        'create_date': '',
-                        'write_date': '',
-                        'stage_id': None
-                    }
-                    
-                    # Safe description access
-                    try:
-                        raw_description = getattr(project, 'description', '') or ''
-                        project_data['description'] = self.html_to_markdown(raw_description) if raw_description else ''
-                    except Exception:
-                        project_data['description'] = ''
-                    
-                    # Safe partner access
-                    try:
-                        if hasattr(project, 'partner_id') and project.partner_id:
-                            project_data['partner_id'] = project.partner_id.id if hasattr(project.partner_id, 'id') else None
-                            project_data['partner_name'] = project.partner_id.name if hasattr(project.partner_id, 'name') else 'No client'
-                    except Exception:
-                        pass
-                    
-                    # Safe user access
-                    try:
-                        if hasattr(project, 'user_id') and project.user_id:
-                            project_data['user_id'] = project.user_id.id if hasattr(project.user_id, 'id') else None
-                            project_data['user_name'] = project.user_id.name if hasattr(project.user_id, 'name') else 'Unassigned'
-                    except Exception:
-                        pass
-                    
-                    # Safe date access
-                    try:
-                        project_data['create_date'] = str(project.create_date) if hasattr(project, 'create_date') and project.create_date else ''
-                        project_data['write_date'] = str(project.write_date) if hasattr(project, 'write_date') and project.write_date else ''
-                    except Exception:
-                        pass
-                    
-                    # Safe stage access
-                    try:
-                        project_data['stage_id'] = getattr(project, 'stage_id', None)
-                    except Exception:
-                        pass
-                    
-                    # Cache this project for future lookups
-                    self.project_cache[project.id] = project_data
-                    
-                    # Create enriched result
-                    enriched_project = {
-                        'id': project_data['id'],
-                        'name': project_data['name'],
-                        'description': project_data['description'],
-                        'partner': project_data['partner_name'],
-                        'stage': project_data['stage_id'],
-                        'user': project_data['user_name'],
-                        'create_date': project_data['create_date'],
-                        'write_date': project_data['write_date'],
-                        'type': 'project',
-                        'search_term': search_term,
-                        'match_in_name': search_term.lower() in project_data['name'].lower(),
-                        'match_in_description': search_term.lower() in project_data['description'].lower()
-                    }
-                    enriched_projects.append(enriched_project)
-                    
-                except Exception as project_error:
-                    if self.verbose:
-                        print(f"⚠️ Error processing project {getattr(project, 'id', 'unknown')}: {project_error}")
-                    continue
+                print(f" {self._found_count(self.projects, domain, len(rows), limit, 'projects')} found", flush=True, file=self.out)
+            
+            terms_lower = self.lower_terms(search_term)  # once, not per record
+            
+            def enrich_project(row):
+                project_data = self._project_data_from_row(row)
+                raw_description = project_data['description']
+                project_data['description'] = self.html_to_markdown(raw_description) if raw_description else ''
+                
+                # Cache this project for future lookups
+                self.project_cache[project_data['id']] = project_data
+                self._cache_related_name(('project.project', project_data['id']), project_data['name'])
+                return self._project_result(project_data, search_term, terms_lower)
             
-            return enriched_projects
+            return self._enrich_rows(rows, enrich_project, 'project')
             
         except Exception as e:
             from .odoo_base import ErrorHandler
-            return ErrorHandler.handle_search_error("project search", e, self.verbose)
+            return ErrorHandler.handle_search_error("project search", e, self.verbose, self.out)
 
     def search_tasks(self, search_term, since=None, include_descriptions=True, project_ids=None, limit=None):
         """
         Search in task names and descriptions using direct database queries
         
         Args:
-            search_term: Text to search for
-            since: Datetime to limit search from
+            search_term: Text to search for, or a list of texts to match any of
+            since: Datetime (or pre-formatted datetime string) to limit search from
             include_descriptions: Whether to search in descriptions
             project_ids: Limit to specific projects
             limit: Maximum number of results to return
         """
         if self.verbose:
-            print(f"🔍 Searching tasks for: '{search_term}'")
+            print(f"🔍 Searching tasks for: '{describe_terms(search_term)}'", file=self.out)
         else:
-            print(f"🔍 Searching tasks...", end="", flush=True)
+            print(f"🔍 Searching tasks...", end="", flush=True, file=self.out)
         
         try:
-            # Build domain using DomainBuilder
-            from .odoo_base import DomainBuilder
-            
-            domain_parts = []
-            
-            # Time filter
-            if since:
-                domain_parts.append(DomainBuilder.date_filter_domain(since))
-            
-            # Project filter
-            if project_ids:
-                domain_parts.append([('project_id', 'in', project_ids)])
-            
-            # Text search
+            # Build domain using DomainBuilder: time filter AND project filter AND text search
             text_fields = ['name', 'description'] if include_descriptions else ['name']
-            text_domain = DomainBuilder.text_search_domain(search_term, text_fields, include_descriptions)
-            
-            # Combine all domains
-            final_domain = text_domain
-            for domain_part in domain_parts:
-                if domain_part:
-                    final_domain = DomainBuilder.combine_with_and(final_domain, *domain_part)
+            final_domain = DomainBuilder.and_domains(
+                DomainBuilder.date_filter_domain(since),
+                [('project_id', 'in', project_ids)] if project_ids else [],
+                DomainBuilder.text_search_domain(search_term, text_fields, include_descriptions)
+            )
             
             if self.verbose:
-                print(f"🔧 Task domain: {final_domain}")
+                print(f"🔧 Task domain: {final_domain}", file=self.out)
             
             # Apply limit at database level
-            search_kwargs = {}
-            if limit:
-                search_kwargs['limit'] = limit
-                search_kwargs['order'] = 'write_date desc'
+            if not limit or limit > self.max_results_per_query:
+                limit = self.max_results_per_query
+            fields = self._read_fields(self.tasks, TASK_FIELDS)
             
-            tasks = self.tasks.search_records(final_domain, **search_kwargs)
+            # Use unified task enrichment, page by page so only one page of raw HTML is held at a time
+            terms_lower = self.lower_terms(search_term)  # once, not per record
+            enriched_tasks = []
+            for page in self._iter_search_read_pages(self.tasks, final_domain, fields, limit, 'write_date desc'):
+                for row in page:
+                    enriched_task = self.enrich_task_row(row, search_term, terms_lower)
+                    task_id = enriched_task['id']
+                    self._cache_related_name(('project.task', task_id), enriched_task['name'])
+                    
+                    # Build project-task mapping (but don't cache task data since it changes frequently)
+                    if enriched_task['project_id']:
+                        if enriched_task['project_id'] not in self.project_task_map:
+                            self.project_task_map[enriched_task['project_id']] = []
+                        if task_id not in self.project_task_map[enriched_task['project_id']]:
+                            self.project_task_map[enriched_task['project_id']].append(task_id)
+                        self.task_project_map[task_id] = enriched_task['project_id']
+                    
+                    enriched_tasks.append(enriched_task)
             
             if self.verbose:
-                print(f"📋 Found {len(tasks)} matching tasks")
+                print(f"📋 Found {self._found_count(self.tasks, final_domain, len(enriched_tasks), limit, 'tasks')} matching tasks", file=self.out)
             else:
-                print(f" {len(tasks)} found", flush=True)
-            
-            # Use unified task enrichment
-            enriched_tasks = []
-            for task in tasks:
-                enriched_task = self.enrich_task_data(task, search_term)
-                
-                # Build project-task mapping (but don't cache task data since it changes frequently)
-                if enriched_task['project_id']:
-                    if enriched_task['project_id'] not in self.project_task_map:
-                        self.project_task_map[enriched_task['project_id']] = []
-                    if task.id not in self.project_task_map[enriched_task['project_id']]:
-                        self.project_task_map[enriched_task['project_id']].append(task.id)
-                    self.task_project_map[task.id] = enriched_task['project_id']
-                
-                enriched_tasks.append(enriched_task)
+                print(f" {self._found_count(self.tasks, final_domain, len(enriched_tasks), limit, 'tasks')} found", flush=True, file=self.out)
             
             return enriched_tasks
             
         except Exception as e:
             from .odoo_base import ErrorHandler
-            return ErrorHandler.handle_search_error("task search", e, self.verbose)
+            return ErrorHandler.handle_search_error("task search", e, self.verbose, self.out)
 
     def search_messages(self, search_term, since=None, model_type='both', limit=None):
         """
         Search in mail messages (logs) for projects and tasks using cached data
         
         Args:
-            search_term: Text to search for
-            since: Datetime to limit search from
+            search_term: Text to search for, or a list of texts to match any of
+            since: Datetime (or pre-formatted datetime string) to limit search from
             model_type: 'projects', 'tasks', or 'both'
             limit: Maximum number of results to return
         """
         if self.verbose:
-            print(f"🔍 Searching messages for: '{search_term}'")
+            print(f"🔍 Searching messages for: '{describe_terms(search_term)}'", file=self.out)
         else:
-            print(f"🔍 Searching messages...", end="", flush=True)
+            print(f"🔍 Searching messages...", end="", flush=True, file=self.out)
         
         try:
             # Ensure message cache is initialized
             if not self._message_cache_built:
                 self._build_message_cache()
             
-            # Build domain for message search
-            domain = []
-            
-            # Time filter
-            if since:
-                domain.append(('date', '>=', since.strftime('%Y-%m-%d %H:%M:%S')))
-            
-            # Model filter
-            model_conditions = []
-            if model_type in ['projects', 'both']:
-                model_conditions.append(('model', '=', 'project.project'))
-            if model_type in ['tasks', 'both']:
-                model_conditions.append(('model', '=', 'project.task'))
-            
-            if len(model_conditions) == 2:
-                model_domain = ['|'] + model_conditions
-            else:
-                model_domain = model_conditions
-            
-            # Text search in message body
-            text_domain = [('body', 'ilike', search_term)]
-            
-            # Combine all domains
-            if domain and model_domain:
-                final_domain = ['&'] + domain + ['&'] + model_domain + text_domain
-            elif domain:
-                final_domain = ['&'] + domain + text_domain
-            elif model_domain:
-                final_domain = ['&'] + model_domain + text_domain
-            else:
-                final_domain = text_domain
+            # Model filter, as one condition instead of an OR per model
+            models = {
+                'projects': ['project.project'],
+                'tasks': ['project.task'],
+                'both': ['project.project', 'project.task'],
+            }.get(model_type)
+            model_domain = [('model', 'in', models)] if models else []
+            
+            # Time filter AND model filter AND text search in message body. The body ilike is a full
+            # scan of mail_message unless the server has a pg_trgm index on it (see README)
+            final_domain = DomainBuilder.and_domains(
+                DomainBuilder.date_filter_domain(since, 'date'),
+                model_domain,
+                DomainBuilder.text_search_domain(search_term, ['body'])
+            )
             
             if self.verbose:
-                print(f"🔧 Message domain: {final_domain}")
+                print(f"🔧 Message domain: {final_domain}", file=self.out)
             
             # Apply limit at database level
-            search_kwargs = {}
-            if limit:
-                search_kwargs['limit'] = limit
-                search_kwargs['order'] = 'date desc'
-            
-            messages = self.messages.search_records(final_domain, **search_kwargs)
+            if not limit or limit > self.max_results_per_query:
+                limit = self.max_results_per_query
+            # Cache found messages for future use, converting each page as it arrives so
+            # only one page of raw HTML bodies is held at a time
+            matching_messages = []
+            for page in self._iter_search_read_pages(self.messages, final_domain, MESSAGE_FIELDS, limit, 'date desc'):
+                for row in page:
+                    message_data = self._message_data_from_row(row)
+                    # Convert body to markdown
+                    raw_body = message_data['body']
+                    message_data['body'] = self.html_to_markdown(raw_body) if raw_body else ''
+                    # Cache this message for future searches
+                    self.message_cache[message_data['id']] = message_data
+                    matching_messages.append(message_data)
             
             if self.verbose:
-                print(f"💬 Found {len(messages)} matching messages")
+                print(f"💬 Found {self._found_count(self.messages, final_domain, len(matching_messages), limit, 'messages')} matching messages", file=self.out)
             else:
-                print(f" {len(messages)} found", flush=True)
+                print(f" {self._found_count(self.messages, final_domain, len(matching_messages), limit, 'messages')} found", flush=True, file=self.out)
             
-            # Cache found messages for future use
-            matching_messages = []
-            for message in messages:
-                # Convert body to markdown
-                raw_body = getattr(message, 'body', '') or ''
-                markdown_body = self.html_to_markdown(raw_body) if raw_body else ''
-                
-                message_data = {
-                    'id': message.id,
-                    'subject': getattr(message, 'subject', '') or 'No subject',
-                    'body': markdown_body,
-                    'author': message.author_id.name if message.author_id else 'System',
-                    'date': str(message.date) if message.date else '',
-                    'model': message.model,
-                    'res_id': message.res_id
-                }
-                # Cache this message for future searches
-                self.message_cache[message.id] = message_data
-                matching_messages.append(message_data)
-            
-            # Enrich messages with related record info
-            enriched_messages = []
-            
-            # Collect all unique task IDs that we need to look up
-            task_ids_needed = set()
-            for message_data in matching_messages:
-                if message_data['model'] == 'project.task' and message_data['res_id']:
-                    task_ids_needed.add(message_data['res_id'])
-            
-            # Batch lookup all needed tasks at once
-            task_name_cache = {}
-            if task_ids_needed:
-                try:
-                    task_records = self.tasks.search_records([('id', 'in', list(task_ids_needed))])
-                    for task in task_records:
-                        task_name_cache[task.id] = task.name
-                except Exception as e:
-                    if self.verbose:
-                        print(f"⚠️ Could not batch lookup tasks: {e}")
-            
-            for message_data in matching_messages:
-                # Get related record info with caching
-                related_name = "Unknown"
-                related_type = message_data['model']
-                
-                if message_data['model'] == 'project.project' and message_data['res_id']:
-                    project_data = self._get_cached_project(message_data['res_id'])
-                    if project_data:
-                        related_name = project_data['name']
-                    else:
-                        related_name = f"Project {message_data['res_id']}"
-                        
-                elif message_data['model'] == 'project.task' and message_data['res_id']:
-                    # Use batch-loaded task names
-                    if message_data['res_id'] in task_name_cache:
-                        related_name = task_name_cache[message_data['res_id']]
-                    else:
-                        related_name = f"Task {message_data['res_id']}"
-                
-                enriched_message = {
-                    'id': message_data['id'],
-                    'subject': message_data['subject'],
-                    'body': message_data['body'],
-                    'author': message_data['author'],
-                    'date': message_data['date'],
-                    'model': message_data['model'],
-                    'res_id': message_data['res_id'],
-                    'related_name': related_name,
-                    'related_type': related_type,
-                    'type': 'message',
-                    'search_term': search_term
-                }
-                enriched_messages.append(enriched_message)
+            # Batch lookup all related project/task names at once
+            related_names = self._batch_related_names(matching_messages)
+            
+            enriched_messages = [
+                self._message_result(message_data, related_names, search_term)
+                for message_data in matching_messages
+            ]
             
             return enriched_messages
             
         except Exception as e:
-            print(f"❌ Error searching messages: {e}")
+            print(f"❌ Error searching messages: {e}", file=self.out)
             return []
 
     def search_files(self, search_term, since=None, file_types=None, model_type='both', limit=None):
@@ -532,109 +420,59 @@ class OdooTextSearch(OdooBase):
         Search in file names and metadata for all attachments with optimized queries
         
         Args:
-            search_term: Text to search for in filenames
-            since: Datetime to limit search from
+            search_term: Text to search for in filenames, or a list of texts to match any of
+            since: Datetime (or pre-formatted datetime string) to limit search from
             file_types: List of file extensions to filter by (e.g., ['pdf', 'docx'])
             model_type: 'projects', 'tasks', 'both', or 'all' (all includes any model)
             limit: Maximum number of results to return
         """
         if self.verbose:
-            print(f"🔍 Searching files for: '{search_term}'")
+            print(f"🔍 Searching files for: '{describe_terms(search_term)}'", file=self.out)
         else:
-            print(f"🔍 Searching files...", end="", flush=True)
+            print(f"🔍 Searching files...", end="", flush=True, file=self.out)
         
         try:
-            # Build domain for file search
-            domain = []
-            
-            # Time filter
-            if since:
-                domain.append(('create_date', '>=', since.strftime('%Y-%m-%d %H:%M:%S')))
-            
-            # Model filter - get IDs from database for efficiency
-            if model_type != 'all':
-                # Get all project and task IDs directly from database
-                all_projects = self.projects.search_records([])
-                all_tasks = self.tasks.search_records([])
-                
-                project_ids = [p.id for p in all_projects]
-                task_ids = [t.id for t in all_tasks]
-                
-                model_conditions = []
-                if model_type in ['projects', 'both'] and project_ids:
-                    model_conditions.append(['&', ('res_model', '=', 'project.project'), ('res_id', 'in', project_ids)])
-                if model_type in ['tasks', 'both'] and task_ids:
-                    model_conditions.append(['&', ('res_model', '=', 'project.task'), ('res_id', 'in', task_ids)])
-                
-                if len(model_conditions) == 2:
-                    model_domain = ['|'] + model_conditions[0] + model_conditions[1]
-                elif len(model_conditions) == 1:
-                    model_domain = model_conditions[0]
-                else:
-                    model_domain = []
-            else:
-                # Search all attachments regardless of model
-                model_domain = []
-            
-            # Text search in filename
-            text_domain = [('name', 'ilike', search_term)]
-            
-            # File type filter
-            if file_types:
-                type_conditions = []
-                for file_type in file_types:
-                    # Handle both with and without dot
-                    ext = file_type.lower().lstrip('.')
-                    type_conditions.append(('name', 'ilike', f'.{ext}'))
-                
-                if len(type_conditions) > 1:
-                    type_domain = ['|'] * (len(type_conditions) - 1) + type_conditions
-                else:
-                    type_domain = type_conditions
-            else:
-                type_domain = []
-            
-            # Combine all domains
-            final_domain = []
-            if domain:
-                final_domain.extend(domain)
-            if model_domain:
-                if final_domain:
-                    final_domain = ['&'] + final_domain + model_domain
-                else:
-                    final_domain = model_domain
-            if text_domain:
-                if final_domain:
-                    final_domain = ['&'] + final_domain + text_domain
-                else:
-                    final_domain = text_domain
-            if type_domain:
-                if final_domain:
-                    final_domain = ['&'] + final_domain + type_domain
-                else:
-                    final_domain = type_domain
+            # Model filter, evaluated by the server instead of shipping every project/task id
+            res_models = {
+                'projects': ['project.project'],
+                'tasks': ['project.task'],
+                'both': ['project.project', 'project.task'],
+            }.get(model_type)
+            model_domain = [('res_model', 'in', res_models)] if res_models else []
+            
+            # File type filter on the name's extension (given with or without leading dot); =ilike
+            # anchors the pattern, so 'pdf' no longer matches 'pdf_report.docx'
+            type_domain = DomainBuilder.or_domains(*[
+                [('name', '=ilike', f"%.{file_type.lower().lstrip('.')}")] for file_type in file_types or []
+            ])
+            
+            # Time filter AND model filter AND filename text AND file type
+            final_domain = DomainBuilder.and_domains(
+                DomainBuilder.date_filter_domain(since, 'create_date'),
+                model_domain,
+                DomainBuilder.text_search_domain(search_term, ['name']),
+                type_domain
+            )
             
             if self.verbose:
-                print(f"🔧 File domain: {final_domain}")
+                print(f"🔧 File domain: {final_domain}", file=self.out)
             
-            # Apply limit at database level
-            search_kwargs = {}
-            if limit:
-                search_kwargs['limit'] = limit
-                search_kwargs['order'] = 'create_date desc'
+            # Apply limit at database level, counting on the server only when it cuts results off
+            if not limit or limit > self.max_results_per_query:
+                limit = self.max_results_per_query
             
             # Fetch files
-            files = self.attachments.search_records(final_domain, **search_kwargs)
+            files = self._search_read_paged(self.attachments, final_domain, FILE_FIELDS, limit, 'create_date desc')
             
             if self.verbose:
-                print(f"📁 Found {len(files)} matching files")
+                print(f"📁 Found {self._found_count(self.attachments, final_domain, len(files), limit, 'files')} matching files", file=self.out)
             else:
-                print(f" {len(files)} found", flush=True)
+                print(f" {self._found_count(self.attachments, final_domain, len(files), limit, 'files')} found", flush=True, file=self.out)
             
             return self._enrich_files_optimized(files, search_term)
             
         except Exception as e:
-            print(f"❌ Error searching files: {e}")
+            print(f"❌ Error searching files: {e}", file=self.out)
             return []
 
     def _build_user_cache(self):
@@ -643,20 +481,20 @@ class OdooTextSearch(OdooBase):
             return
             
         if self.verbose:
-            print("👥 Building user cache...")
+            print("👥 Building user cache...", file=self.out)
         
         try:
             # Get all users
-            users = self.client['res.users'].search_records([])
-            self.user_cache = {user.id: user.name for user in users}
+            users = self.client['res.users'].search_read([], ['name'])
+            self.user_cache = {user['id']: user['name'] for user in users}
             self._user_cache_built = True
             
             if self.verbose:
-                print(f"👥 Cached {len(self.user_cache)} users")
+                print(f"👥 Cached {len(self.user_cache)} users", file=self.out)
                 
         except Exception as e:
             if self.verbose:
-                print(f"⚠️ Could not build user cache: {e}")
+                print(f"⚠️ Could not build user cache: {e}", file=self.out)
             self.user_cache = {}
 
     def _build_project_cache(self):
@@ -665,35 +503,25 @@ class OdooTextSearch(OdooBase):
             return
             
         if self.verbose:
-            print("📂 Building project cache...")
+            print("📂 Building project cache...", file=self.out)
         
         try:
-            # Get all projects with limited fields for efficiency
-            projects = self.projects.search_records([])
-            
-            for project in projects:
-                project_data = {
-                    'id': project.id,
-                    'name': project.name,
-                    'description': getattr(project, 'description', '') or '',
-                    'partner_id': project.partner_id.id if project.partner_id else None,
-                    'partner_name': project.partner_id.name if project.partner_id else 'No client',
-                    'user_id': project.user_id.id if project.user_id else None,
-                    'user_name': project.user_id.name if project.user_id else 'Unassigned',
-                    'create_date': str(project.create_date) if project.create_date else '',
-                    'write_date': str(project.write_date) if project.write_date else '',
-                    'stage_id': getattr(project, 'stage_id', None)
-                }
-                self.project_cache[project.id] = project_data
+            # Get all projects with limited fields in a single round trip. The cache is only used
+            # for names and clients, so leave out the (HTML) descriptions that dominate the response.
+            rows = self.projects.search_read([], self._read_fields(self.projects, PROJECT_CACHE_FIELDS))
+            
+            for row in rows:
+                # Keep full entries cached by an earlier project search
+                self.project_cache.setdefault(row['id'], self._project_data_from_row(row))
             
             self._project_cache_built = True
             
             if self.verbose:
-                print(f"📂 Cached {len(self.project_cache)} projects")
+                print(f"📂 Cached {len(self.project_cache)} projects", file=self.out)
                 
         except Exception as e:
             if self.verbose:
-                print(f"⚠️ Could not build project cache: {e}")
+                print(f"⚠️ Could not build project cache: {e}", file=self.out)
             self.project_cache = {}
 
     def _build_message_cache(self):
@@ -702,14 +530,14 @@ class OdooTextSearch(OdooBase):
             return
             
         if self.verbose:
-            print("💬 Initializing message cache (on-demand)...")
+            print("💬 Initializing message cache (on-demand)...", file=self.out)
         
         # Initialize empty cache - messages will be added as they're found during searches
         self.message_cache = {}
         self._message_cache_built = True
         
         if self.verbose:
-            print(f"💬 Message cache initialized (will populate during searches)")
+            print(f"💬 Message cache initialized (will populate during searches)", file=self.out)
     
     
     def _get_cached_project(self, project_id):
@@ -722,26 +550,14 @@ class OdooTextSearch(OdooBase):
         
         # Fallback: direct lookup and cache
         try:
-            project_records = self.projects.search_records([('id', '=', project_id)])
-            if project_records:
-                project = project_records[0]
-                project_data = {
-                    'id': project.id,
-                    'name': project.name,
-                    'description': getattr(project, 'description', '') or '',
-                    'partner_id': project.partner_id.id if project.partner_id else None,
-                    'partner_name': project.partner_id.name if project.partner_id else 'No client',
-                    'user_id': project.user_id.id if project.user_id else None,
-                    'user_name': project.user_id.name if project.user_id else 'Unassigned',
-                    'create_date': str(project.create_date) if project.create_date else '',
-                    'write_date': str(project.write_date) if project.write_date else '',
-                    'stage_id': getattr(project, 'stage_id', None)
-                }
+            rows = self.projects.read([project_id], self._read_fields(self.projects, PROJECT_FIELDS))
+            if rows:
+                project_data = self._project_data_from_row(rows[0])
                 self.project_cache[project_id] = project_data
                 return project_data
         except Exception as e:
             if self.verbose:
-                print(f"⚠️ Could not fetch project {project_id}: {e}")
+                print(f"⚠️ Could not fetch project {project_id}: {e}", file=self.out)
         
         return None
     
@@ -755,28 +571,204 @@ class OdooTextSearch(OdooBase):
         
         # Fallback: direct lookup and cache
         try:
-            message_records = self.messages.search_records([('id', '=', message_id)])
-            if message_records:
-                message = message_records[0]
-                
-                message_data = {
-                    'id': message.id,
-                    'subject': getattr(message, 'subject', '') or 'No subject',
-                    'body': getattr(message, 'body', '') or '',
-                    'author': message.author_id.name if message.author_id else 'System',
-                    'date': str(message.date) if message.date else '',
-                    'model': message.model,
-                    'res_id': message.res_id
-                }
-                
+            rows = self.messages.read([message_id], MESSAGE_FIELDS)
+            if rows:
+                message_data = self._message_data_from_row(rows[0])
                 self.message_cache[message_id] = message_data
                 return message_data
         except Exception as e:
             if self.verbose:
-                print(f"⚠️ Could not fetch message {message_id}: {e}")
+                print(f"⚠️ Could not fetch message {message_id}: {e}", file=self.out)
         
         return None
 
+    def _iter_search_read_pages(self, model, domain, fields, limit, order):
+        """Yield pages of up to SEARCH_PAGE_SIZE search_read rows, limit rows in total"""
+        # id as tie-breaker keeps the order stable between pages
+        order = f"{order}, id desc"
+        offset = 0
+        while offset < limit:
+            page_size = min(SEARCH_PAGE_SIZE, limit - offset)
+            page = model.search_read(domain, fields, offset=offset, limit=page_size, order=order)
+            if page:
+                yield page
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+    def _search_read_paged(self, model, domain, fields, limit, order):
+        """search_read up to limit rows, SEARCH_PAGE_SIZE rows per round trip"""
+        return [row for page in self._iter_search_read_pages(model, domain, fields, limit, order) for row in page]
+
+    def _read_existing(self, model, ids, fields):
+        """Read records by id in one round trip, skipping deleted ones instead of failing like read() does"""
+        # Attachments and messages can point at archived records too
+        return model.search_read([('id', 'in', list(ids))], fields, context={'active_test': False})
+
+    def _found_count(self, model, domain, found, limit, key):
+        """Describe how many records matched, only counting on the server when the limit cut the results off
+
+        Also records in truncated_results[key] whether more records matched than were fetched.
+        """
+        self.truncated_results[key] = False
+        if found >= limit:
+            # Without a count, assume a full page of results was cut off
+            self.truncated_results[key] = True
+            try:
+                total = model.search_count(domain)
+                self.truncated_results[key] = total > found
+                if total > found:
+                    return f"{found} of {total}"
+            except Exception as e:
+                if self.verbose:
+                    print(f"⚠️ Could not count matches: {e}", file=self.out)
+        return str(found)
+
+    def _enrich_rows(self, rows, enrich_one, label):
+        """Enrich rows in one unguarded pass; only if a row is malformed, redo them one by one and skip the bad ones"""
+        try:
+            return [enrich_one(row) for row in rows]
+        except Exception:
+            pass
+        
+        enriched = []
+        for row in rows:
+            try:
+                enriched.append(enrich_one(row))
+            except Exception as e:
+                print(f"⚠️ Error enriching {label} {row.get('id', 'unknown')}: {e}", file=self.out)
+        return enriched
+
+    def _read_fields(self, model, fields):
+        """Restrict a field list to fields that exist on the model (field info is cached per model)"""
+        try:
+            available = self.model_fields_cache.get(model.name)
+            if available is None:
+                available = self.model_fields_cache[model.name] = frozenset(model.columns_info)
+            return [field for field in fields if field in available]
+        except Exception:
+            return list(fields)
+
+    def _project_data_from_row(self, row):
+        """Build a project cache entry from a read()/search_read() row"""
+        return {
+            'id': row['id'],
+            'name': row.get('name') or f"Project {row['id']}",
+            'description': row.get('description') or '',
+            'partner_id': self.m2o_id(row.get('partner_id')),
+            'partner_name': self.m2o_name(row.get('partner_id'), 'No client'),
+            'user_id': self.m2o_id(row.get('user_id')),
+            'user_name': self.m2o_name(row.get('user_id'), 'Unassigned'),
+            'create_date': row.get('create_date') or '',
+            'write_date': row.get('write_date') or '',
+            'stage_id': self.m2o_id(row.get('stage_id')),
+            'stage_name': self.m2o_name(row.get('stage_id'), None)
+        }
+
+    def _project_result(self, project_data, search_term, terms_lower):
+        """Build a project search result from a project cache entry"""
+        description = project_data['description']
+        return {
+            'id': project_data['id'],
+            'name': project_data['name'],
+            'description': description,
+            'partner': project_data['partner_name'],
+            'stage': project_data['stage_name'],
+            'user': project_data['user_name'],
+            'create_date': project_data['create_date'],
+            'write_date': project_data['write_date'],
+            'type': 'project',
+            'search_term': search_term,
+            'match_in_name': self.matches_terms(project_data['name'], terms_lower),
+            'match_in_description': self.matches_terms(description, terms_lower)
+        }
+
+    def _message_data_from_row(self, row):
+        """Build a message cache entry from a read()/search_read() row"""
+        return {
+            'id': row['id'],
+            'subject': row.get('subject') or 'No subject',
+            'body': row.get('body') or '',
+            'author': self.m2o_name(row.get('author_id'), 'System'),
+            'date': row.get('date') or '',
+            'model': row.get('model'),
+            'res_id': row.get('res_id')
+        }
+
+    def _batch_related_names(self, messages):
+        """Resolve the projects/tasks messages are attached to with one read() per model"""
+        models = {'project.project': self.projects, 'project.task': self.tasks}
+        ids_by_model = {model_name: set() for model_name in models}
+        for message_data in messages:
+            if message_data['model'] in ids_by_model and message_data['res_id']:
+                ids_by_model[message_data['model']].add(message_data['res_id'])
+
+        related_names = {}
+
+        # Names resolved by earlier queries don't need a server call
+        now = time.time()
+        for model_name, ids in ids_by_model.items():
+            for record_id in list(ids):
+                entry = self.related_name_cache.get((model_name, record_id))
+                if entry and now - entry[0] <= self.related_name_ttl:
+                    related_names[(model_name, record_id)] = entry[1]
+                    ids.discard(record_id)
+
+        # Neither do projects we already have cached
+        for project_id in list(ids_by_model['project.project']):
+            if project_id in self.project_cache:
+                related_names[('project.project', project_id)] = self.project_cache[project_id]['name']
+                ids_by_model['project.project'].discard(project_id)
+
+        for model_name, ids in ids_by_model.items():
+            if not ids:
+                continue
+            try:
+                for row in models[model_name].read(list(ids), ['name']):
+                    related_names[(model_name, row['id'])] = row['name']
+                    self._cache_related_name((model_name, row['id']), row['name'])
+            except Exception as e:
+                if self.verbose:
+                    print(f"⚠️ Could not batch lookup {model_name} names: {e}", file=self.out)
+
+        return related_names
+
+    def _cache_related_name(self, key, name):
+        """Remember a (model, id) -> name lookup, evicting the oldest entry when the cache is full"""
+        with self.related_name_lock:
+            self.related_name_cache.pop(key, None)
+            self.related_name_cache[key] = (time.time(), name)
+            if len(self.related_name_cache) > self.related_name_cache_size:
+                self.related_name_cache.pop(next(iter(self.related_name_cache)), None)
+
+    def _message_result(self, message_data, related_names, search_term):
+        """Build a message search result, naming the related record from a batch lookup"""
+        model = message_data['model']
+        res_id = message_data['res_id']
+
+        related_name = related_names.get((model, res_id))
+        if not related_name:
+            if model == 'project.project' and res_id:
+                related_name = f"Project {res_id}"
+            elif model == 'project.task' and res_id:
+                related_name = f"Task {res_id}"
+            else:
+                related_name = "Unknown"
+
+        return {
+            'id': message_data['id'],
+            'subject': message_data['subject'],
+            'body': message_data['body'],
+            'author': message_data['author'],
+            'date': message_data['date'],
+            'model': model,
+            'res_id': res_id,
+            'related_name': related_name,
+            'related_type': model,
+            'type': 'message',
+            'search_term': search_term
+        }
+
 
     def _get_user_name(self, user_id):
         """Get user name from cache, with fallback"""
@@ -788,15 +780,15 @@ class OdooTextSearch(OdooBase):
         
         # Fallback: try to get user directly
         try:
-            user_records = self.client['res.users'].search_records([('id', '=', user_id)])
-            if user_records:
-                user_name = user_records[0].name
+            user_rows = self.client['res.users'].search_read([('id', '=', user_id)], ['name'])
+            if user_rows:
+                user_name = user_rows[0]['name']
                 # Cache for future use
                 self.user_cache[user_id] = user_name
                 return user_name
         except Exception as e:
             if self.verbose:
-                print(f"⚠️ Could not get user {user_id}: {e}")
+                print(f"⚠️ Could not get user {user_id}: {e}", file=self.out)
         
         return f'User {user_id} (not found)'
 
@@ -805,7 +797,7 @@ class OdooTextSearch(OdooBase):
         Comprehensive text search across projects, tasks, logs, and files
         
         Args:
-            search_term: Text to search for
+            search_term: Text to search for, or a list of texts to match any of (one server query per category)
             since: Time reference string (e.g., "1 week", "3 days")
             search_type: 'all', 'projects', 'tasks', 'logs', 'files'
             include_descriptions: Search in descriptions
@@ -819,16 +811,17 @@ class OdooTextSearch(OdooBase):
         if search_type not in valid_types:
             raise ValueError(f"Invalid search type '{search_type}'. Valid types are: {', '.join(valid_types)}")
         
+        # Parse and format the time reference once, for both the summary and all searches
+        since_date = self._parse_time_reference(since) if since else None
+        since_str = DomainBuilder.format_datetime(since_date)
+        
         if self.verbose:
             print(f"\n🚀 FULL TEXT SEARCH")
             print(f"=" * 60)
-            print(f"🔍 Search term: '{search_term}'")
+            print(f"🔍 Search term: '{describe_terms(search_term)}'")
             
-            # Parse time reference
-            since_date = None
             if since:
-                since_date = self._parse_time_reference(since)
-                print(f"📅 Since: {since} ({since_date.strftime('%Y-%m-%d %H:%M:%S') if since_date else 'Invalid'})")
+                print(f"📅 Since: {since} ({since_str or 'Invalid'})")
             
             print(f"🎯 Type: {search_type}")
             print(f"📝 Include descriptions: {include_descriptions}")
@@ -839,11 +832,6 @@ class OdooTextSearch(OdooBase):
             if limit:
                 print(f"🔢 Limit per category: {limit}")
             print()
-        else:
-            # Parse time reference
-            since_date = None
-            if since:
-                since_date = self._parse_time_reference(since)
         
         # Build user cache upfront and initialize message cache (messages cached on-demand)
         self._build_user_cache()
@@ -858,27 +846,37 @@ class OdooTextSearch(OdooBase):
         }
         
         try:
+            # Project, task, message and file searches are independent, so run them concurrently
+            searches = []
+            
             # Search projects
             if search_type in ['all', 'projects']:
-                results['projects'] = self.search_projects(search_term, since_date, include_descriptions, limit)
-            
-            if self.verbose:
-                print()  # Add white line between searches
+                searches.append(('projects', lambda searcher: searcher.search_projects(
+                    search_term, since_str, include_descriptions, limit)))
             
             # Search tasks
             if search_type in ['all', 'tasks']:
-                results['tasks'] = self.search_tasks(search_term, since_date, include_descriptions, None, limit)
+                searches.append(('tasks', lambda searcher: searcher.search_tasks(
+                    search_term, since_str, include_descriptions, None, limit)))
             
             # Search messages/logs
             if include_logs and search_type in ['all', 'logs']:
-                model_type = 'both' if search_type == 'all' else search_type
-                results['messages'] = self.search_messages(search_term, since_date, model_type, limit)
+                message_model_type = 'both' if search_type == 'all' else search_type
+                searches.append(('messages', lambda searcher: searcher.search_messages(
+                    search_term, since_str, message_model_type, limit)))
             
             # Search files
             if include_files or search_type == 'files':
                 # Use 'all' for comprehensive file search when searching all or files specifically
-                model_type = 'all' if search_type in ['all', 'files'] else search_type
-                results['files'] = self.search_files(search_term, since_date, file_types, model_type, limit)
+                file_model_type = 'all' if search_type in ['all', 'files'] else search_type
+                searches.append(('files', lambda searcher: searcher.search_files(
+                    search_term, since_str, file_types, file_model_type, limit)))
+            
+            self.truncated_results.clear()
+            results.update(self._run_concurrently(searches))
+            
+            # Categories whose search hit its effective limit, as reported by the searches themselves
+            results['truncated'] = [key for key, _ in searches if self.truncated_results.get(key)]
             
             return results
             
@@ -886,354 +884,255 @@ class OdooTextSearch(OdooBase):
             print(f"❌ Error in full text search: {e}")
             return results
 
+    def _on_own_connection(self):
+        """Shallow copy of this searcher with its own XML-RPC connection, sharing all caches"""
+        # The XML-RPC transport keeps a single keep-alive connection, which threads can't share.
+        # Idle workers are reused so later searches don't pay for another TLS handshake and login.
+        with self.connection_pool_lock:
+            if self.connection_pool:
+                return self.connection_pool.pop()
+        worker = copy.copy(self)
+        worker._connect()
+        return worker
+
+    def _release_connection(self, worker):
+        """Hand a worker from _on_own_connection back to the pool"""
+        with self.connection_pool_lock:
+            self.connection_pool.append(worker)
+
+    def _run_buffered(self, search, use_own_connection):
+        """Run one search in a worker thread, capturing its progress output in its own buffer"""
+        buffer = io.StringIO()
+        # Workers share self._output (a thread local), so this only redirects this thread's output
+        previous = getattr(self._output, 'stream', None)
+        self._output.stream = buffer
+        completed, result = False, None
+        searcher = self
+        try:
+            try:
+                if use_own_connection:
+                    searcher = self._on_own_connection()
+            except Exception as e:
+                print(f"⚠️ Could not open extra connection, searching sequentially: {e}", file=buffer)
+            else:
+                completed, result = True, search(searcher)
+        finally:
+            # Also when the search raised, so its connection isn't lost to the pool
+            if searcher is not self:
+                self._release_connection(searcher)
+            self._output.stream = previous
+        return buffer.getvalue(), completed, result
+
+    def _run_concurrently(self, searches):
+        """
+        Run (result key, search) pairs in parallel, printing their output in the original order
+        
+        The first search uses this searcher's connection, every other one gets its own.
+        """
+        if len(searches) < 2:
+            return {key: search(self) for key, search in searches}
+        
+        with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+            futures = [
+                (key, search, executor.submit(self._run_buffered, search, index > 0))
+                for index, (key, search) in enumerate(searches)
+            ]
+            outcomes = [(key, search, future.result()) for key, search, future in futures]
+        
+        results = {}
+        for index, (key, search, (output, completed, result)) in enumerate(outcomes):
+            if index and self.verbose:
+                print()  # Add white line between searches
+            sys.stdout.write(output)
+            results[key] = result if completed else search(self)
+        return results
+
     def _enrich_projects(self, projects, search_term):
         """Enrich project results with cached data - this method is now only used for message-related projects"""
         enriched = []
+        terms_lower = self.lower_terms(search_term)
         
-        for project in projects:
+        # Read all uncached projects in one round trip
+        missing_ids = [project.id for project in projects if project.id not in self.project_cache]
+        if missing_ids:
             try:
-                # Get project data from cache if available
-                project_data = self._get_cached_project(project.id)
-                if project_data:
-                    enriched_project = {
-                        'id': project_data['id'],
-                        'name': project_data['name'],
-                        'description': project_data['description'],
-                        'partner': project_data['partner_name'],
-                        'stage': project_data['stage_id'],
-                        'user': project_data['user_name'],
-                        'create_date': project_data['create_date'],
-                        'write_date': project_data['write_date'],
-                        'type': 'project',
-                        'search_term': search_term,
-                        'match_in_name': search_term.lower() in project_data['name'].lower(),
-                        'match_in_description': search_term.lower() in project_data['description'].lower()
-                    }
-                    enriched.append(enriched_project)
-                else:
-                    # Fallback to original method for uncached projects
-                    enriched_project = {
-                        'id': project.id,
-                        'name': project.name,
-                        'description': getattr(project, 'description', '') or '',
-                        'partner': project.partner_id.name if project.partner_id else 'No client',
-                        'stage': getattr(project, 'stage_id', None),
-                        'user': project.user_id.name if project.user_id else 'Unassigned',
-                        'create_date': str(project.create_date) if project.create_date else '',
-                        'write_date': str(project.write_date) if project.write_date else '',
-                        'type': 'project',
-                        'search_term': search_term,
-                        'match_in_name': search_term.lower() in project.name.lower(),
-                        'match_in_description': search_term.lower() in (getattr(project, 'description', '') or '').lower()
-                    }
-                    enriched.append(enriched_project)
-                
+                for row in self.projects.read(missing_ids, self._read_fields(self.projects, PROJECT_FIELDS)):
+                    self.project_cache[row['id']] = self._project_data_from_row(row)
             except Exception as e:
-                print(f"⚠️ Error enriching project {project.id}: {e}")
+                print(f"⚠️ Error reading projects {missing_ids}: {e}", file=self.out)
+        
+        for project in projects:
+            project_data = self.project_cache.get(project.id)
+            if not project_data:
+                print(f"⚠️ Error enriching project {project.id}: record not found", file=self.out)
                 continue
+            enriched.append(self._project_result(project_data, search_term, terms_lower))
         
         return enriched
 
     def _enrich_files_optimized(self, files, search_term):
-        """Enrich file results with cached data for optimal performance"""
-        enriched = []
+        """Enrich file results (search_read rows) with their project or task, read in bulk"""
+        project_ids = {f['res_id'] for f in files if f.get('res_model') == 'project.project' and f.get('res_id')}
+        task_ids = {f['res_id'] for f in files if f.get('res_model') == 'project.task' and f.get('res_id')}
         
-        for file in files:
+        # Read all uncached projects in one round trip
+        missing_ids = [project_id for project_id in project_ids if project_id not in self.project_cache]
+        if missing_ids:
             try:
-                enriched_file = {
-                    'id': file.id,
-                    'name': file.name,
-                    'mimetype': getattr(file, 'mimetype', '') or 'Unknown',
-                    'file_size': getattr(file, 'file_size', 0) or 0,
-                    'file_size_human': self.format_file_size(getattr(file, 'file_size', 0) or 0),
-                    'create_date': str(file.create_date) if file.create_date else '',
-                    'write_date': str(file.write_date) if file.write_date else '',
-                    'public': getattr(file, 'public', False),
-                    'res_model': file.res_model,
-                    'res_id': file.res_id,
-                    'type': 'file',
-                    'search_term': search_term
-                }
-                
-                # Add model-specific information using cached data
-                if file.res_model == 'project.project':
-                    project_data = self._get_cached_project(file.res_id)
-                    if project_data:
-                        enriched_file.update({
-                            'related_type': 'Project',
-                            'related_name': project_data['name'],
-                            'related_id': project_data['id'],
-                            'project_name': project_data['name'],
-                            'project_id': project_data['id'],
-                            'client': project_data['partner_name']
-                        })
-                    else:
-                        enriched_file.update({
-                            'related_type': 'Project',
-                            'related_name': f'Project {file.res_id}',
-                            'related_id': file.res_id,
-                            'error': 'Project record not found'
-                        })
-                
-                elif file.res_model == 'project.task':
-                    # Don't use cached task data since tasks change frequently
-                    try:
-                        task_records = self.tasks.search_records([('id', '=', file.res_id)])
-                        if task_records:
-                            task = task_records[0]
-                            
-                            # Extract user ID safely
-                            user_name = 'Unassigned'
-                            if hasattr(task, 'user_ids') and task.user_ids:
-                                try:
-                                    if hasattr(task.user_ids, '__len__') and len(task.user_ids) > 0:
-                                        first_user = task.user_ids[0]
-                                        if hasattr(first_user, 'name'):
-                                            user_name = first_user.name
-                                except:
-                                    pass
-                            
-                            enriched_file.update({
-                                'related_type': 'Task',
-                                'related_name': task.name,
-                                'related_id': task.id,
-                                'task_name': task.name,
-                                'task_id': task.id,
-                                'project_name': task.project_id.name if task.project_id else 'No project',
-                                'project_id': task.project_id.id if task.project_id else None,
-                                'assigned_user': user_name
-                            })
-                        else:
-                            enriched_file.update({
-                                'related_type': 'Task',
-                                'related_name': f'Task {file.res_id}',
-                                'related_id': file.res_id,
-                                'error': 'Task record not found'
-                            })
-                    except Exception as e:
-                        enriched_file.update({
-                            'related_type': 'Task',
-                            'related_name': f'Task {file.res_id}',
-                            'related_id': file.res_id,
-                            'error': f'Task lookup failed: {e}'
-                        })
-                
-                else:
-                    # Handle other models
-                    enriched_file.update({
-                        'related_type': file.res_model or 'Unknown',
-                        'related_name': f'{file.res_model} {file.res_id}' if file.res_model and file.res_id else 'No relation',
-                        'related_id': file.res_id,
-                        'model_name': file.res_model or 'Unknown'
-                    })
-                
-                enriched.append(enriched_file)
-                
+                fields = self._read_fields(self.projects, PROJECT_CACHE_FIELDS)
+                for row in self._read_existing(self.projects, missing_ids, fields):
+                    self.project_cache.setdefault(row['id'], self._project_data_from_row(row))
             except Exception as e:
-                print(f"⚠️ Error enriching file {file.id}: {e}")
-                continue
+                print(f"⚠️ Error reading projects {missing_ids}: {e}", file=self.out)
         
-        return enriched
-
-    def _enrich_files(self, files, search_term):
-        """Enrich file results with additional info"""
-        enriched = []
+        # Don't use cached task data since tasks change frequently, but read them all in one round trip
+        tasks_by_id = {}
+        task_error = None
+        if task_ids:
+            try:
+                tasks_by_id = {row['id']: row for row in self._read_existing(self.tasks, task_ids, FILE_TASK_FIELDS)}
+            except Exception as e:
+                task_error = e
         
-        for file in files:
+        # Read the names of assigned users the user cache doesn't know yet in one round trip
+        missing_user_ids = {
+            task['user_ids'][0] for task in tasks_by_id.values()
+            if task.get('user_ids') and task['user_ids'][0] not in self.user_cache
+        }
+        if missing_user_ids:
             try:
-                enriched_file = {
-                    'id': file.id,
-                    'name': file.name,
-                    'mimetype': getattr(file, 'mimetype', '') or 'Unknown',
-                    'file_size': getattr(file, 'file_size', 0) or 0,
-                    'file_size_human': self.format_file_size(getattr(file, 'file_size', 0) or 0),
-                    'create_date': str(file.create_date) if file.create_date else '',
-                    'write_date': str(file.write_date) if file.write_date else '',
-                    'public': getattr(file, 'public', False),
-                    'res_model': file.res_model,
-                    'res_id': file.res_id,
-                    'type': 'file',
-                    'search_term': search_term
-                }
-                
-                # Add model-specific information
-                if file.res_model == 'project.project':
-                    try:
-                        # First search for the project record to ensure we get a proper record
-                        project_records = self.projects.search_records([('id', '=', file.res_id)])
-                        if project_records:
-                            project = project_records[0]
-                            
-                            # Safely get project attributes
-                            project_name = getattr(project, 'name', f'Project {file.res_id}')
-                            
-                            # Handle client relationship safely
-                            client_name = 'No client'
-                            if hasattr(project, 'partner_id') and project.partner_id:
-                                try:
-                                    if hasattr(project.partner_id, 'name'):
-                                        client_name = project.partner_id.name
-                                    else:
-                                        client_name = f'Client {project.partner_id}'
-                                except:
-                                    client_name = 'Client (unavailable)'
-                            
-                            enriched_file.update({
-                                'related_type': 'Project',
-                                'related_name': project_name,
-                                'related_id': project.id,
-                                'project_name': project_name,
-                                'project_id': project.id,
-                                'client': client_name
-                            })
-                        else:
-                            enriched_file.update({
-                                'related_type': 'Project',
-                                'related_name': f'Project {file.res_id}',
-                                'related_id': file.res_id,
-                                'error': 'Project record not found'
-                            })
-                    except Exception as e:
-                        enriched_file.update({
-                            'related_type': 'Project',
-                            'related_name': f'Project {file.res_id}',
-                            'related_id': file.res_id,
-                            'error': f'Project info not available: {e}'
-                        })
-                
-                elif file.res_model == 'project.task':
-                    try:
-                        # First search for the task record to ensure we get a proper record
-                        task_records = self.tasks.search_records([('id', '=', file.res_id)])
-                        if task_records:
-                            task = task_records[0]
-                            
-                            # Safely get task attributes
-                            task_name = getattr(task, 'name', f'Task {file.res_id}')
-                            
-                            # Handle project relationship safely
-                            project_name = 'No project'
-                            project_id = None
-                            if hasattr(task, 'project_id') and task.project_id:
-                                try:
-                                    if hasattr(task.project_id, 'name'):
-                                        project_name = task.project_id.name
-                                        project_id = task.project_id.id
-                                    else:
-                                        # project_id might be just an ID
-                                        project_id = task.project_id
-                                        project_name = f'Project {project_id}'
-                                except:
-                                    project_name = 'Project (unavailable)'
-                            
-                            # Use shared user extraction method
-                            user_id, assigned_user = self.extract_user_from_task(task)
-                            
-                            enriched_file.update({
-                                'related_type': 'Task',
-                                'related_name': task_name,
-                                'related_id': task.id,
-                                'task_name': task_name,
-                                'task_id': task.id,
-                                'project_name': project_name,
-                                'project_id': project_id,
-                                'assigned_user': assigned_user
-                            })
-                        else:
-                            enriched_file.update({
-                                'related_type': 'Task',
-                                'related_name': f'Task {file.res_id}',
-                                'related_id': file.res_id,
-                                'error': 'Task record not found'
-                            })
-                    except Exception as e:
-                        enriched_file.update({
-                            'related_type': 'Task',
-                            'related_name': f'Task {file.res_id}',
-                            'related_id': file.res_id,
-                            'error': f'Task info not available: {e}'
-                        })
-                
-                else:
-                    # Handle other models (mail.message, res.partner, etc.)
-                    enriched_file.update({
-                        'related_type': file.res_model or 'Unknown',
-                        'related_name': f'{file.res_model} {file.res_id}' if file.res_model and file.res_id else 'No relation',
-                        'related_id': file.res_id,
-                        'model_name': file.res_model or 'Unknown'
-                    })
-                
-                enriched.append(enriched_file)
-                
+                users = self.client['res.users'].search_read([('id', 'in', list(missing_user_ids))], ['name'])
+                self.user_cache.update((user['id'], user['name']) for user in users)
             except Exception as e:
-                print(f"⚠️ Error enriching file {file.id}: {e}")
-                continue
+                if self.verbose:
+                    print(f"⚠️ Error reading users {sorted(missing_user_ids)}: {e}", file=self.out)
         
-        return enriched
+        # Remember what we read for message enrichment and hierarchy placement
+        for task in tasks_by_id.values():
+            self._cache_related_name(('project.task', task['id']), task['name'])
+            self.task_project_map[task['id']] = self.m2o_id(task.get('project_id'))
+        
+        return self._enrich_rows(files, lambda file: self._file_result(file, search_term, tasks_by_id, task_error), 'file')
+
+    def _file_result(self, file, search_term, tasks_by_id, task_error):
+        """Build a file search result from a search_read row and the bulk-read projects and tasks"""
+        file_size = file.get('file_size') or 0
+        res_model = file.get('res_model')
+        res_id = file.get('res_id')
+        enriched_file = {
+            'id': file['id'],
+            'name': file.get('name'),
+            'mimetype': file.get('mimetype') or 'Unknown',
+            'file_size': file_size,
+            'file_size_human': self.format_file_size(file_size),
+            'create_date': file.get('create_date') or '',
+            'write_date': file.get('write_date') or '',
+            'public': file.get('public', False),
+            'res_model': res_model,
+            'res_id': res_id,
+            'type': 'file',
+            'search_term': search_term
+        }
+        
+        # Add model-specific information from the bulk reads
+        if res_model == 'project.project':
+            project_data = self.project_cache.get(res_id)
+            if project_data:
+                enriched_file.update({
+                    'related_type': 'Project',
+                    'related_name': project_data['name'],
+                    'related_id': project_data['id'],
+                    'project_name': project_data['name'],
+                    'project_id': project_data['id'],
+                    'client': project_data['partner_name']
+                })
+            else:
+                enriched_file.update({
+                    'related_type': 'Project',
+                    'related_name': f'Project {res_id}',
+                    'related_id': res_id,
+                    'error': 'Project record not found'
+                })
+        
+        elif res_model == 'project.task':
+            task = tasks_by_id.get(res_id)
+            if task:
+                user_ids = task.get('user_ids') or []
+                enriched_file.update({
+                    'related_type': 'Task',
+                    'related_name': task['name'],
+                    'related_id': task['id'],
+                    'task_name': task['name'],
+                    'task_id': task['id'],
+                    'project_name': self.m2o_name(task.get('project_id'), 'No project'),
+                    'project_id': self.m2o_id(task.get('project_id')),
+                    'assigned_user': self._get_user_name(user_ids[0]) if user_ids else 'Unassigned'
+                })
+            else:
+                enriched_file.update({
+                    'related_type': 'Task',
+                    'related_name': f'Task {res_id}',
+                    'related_id': res_id,
+                    'error': f'Task lookup failed: {task_error}' if task_error else 'Task record not found'
+                })
+        
+        else:
+            # Handle other models
+            enriched_file.update({
+                'related_type': res_model or 'Unknown',
+                'related_name': f'{res_model} {res_id}' if res_model and res_id else 'No relation',
+                'related_id': res_id,
+                'model_name': res_model or 'Unknown'
+            })
+        
+        return enriched_file
 
     def _enrich_tasks(self, tasks, search_term):
         """Enrich task results with cached data - this method is now only used for message-related tasks"""
-        enriched = []
+        terms_lower = self.lower_terms(search_term)
         
-        for task in tasks:
-            try:
-                # Use unified task enrichment method
-                enriched_task = self.enrich_task_data(task, search_term)
-                enriched.append(enriched_task)
-                
-            except Exception as e:
-                print(f"⚠️ Error enriching task {getattr(task, 'id', 'unknown')}: {e}")
-                continue
+        # Read all tasks in one round trip instead of per-record attribute access
+        task_ids = [task.id for task in tasks]
+        try:
+            rows = self.tasks.read(task_ids, self._read_fields(self.tasks, TASK_FIELDS)) if task_ids else []
+        except Exception as e:
+            print(f"⚠️ Error reading tasks {task_ids}: {e}", file=self.out)
+            return []
         
-        return enriched
+        # Use unified task enrichment method
+        return self._enrich_rows(rows, lambda row: self.enrich_task_row(row, search_term, terms_lower), 'task')
 
     def _enrich_messages(self, messages, search_term):
         """Enrich message results with additional info"""
-        enriched = []
+        # Read all messages in one round trip instead of per-record attribute access
+        message_ids = [message.id for message in messages]
+        try:
+            rows = self.messages.read(message_ids, MESSAGE_FIELDS) if message_ids else []
+        except Exception as e:
+            print(f"⚠️ Error reading messages {message_ids}: {e}", file=self.out)
+            return []
         
-        for message in messages:
-            try:
-                # Get related record info
-                related_name = "Unknown"
-                related_type = message.model
-                
-                if message.model == 'project.project' and message.res_id:
-                    try:
-                        project = self.projects.browse(message.res_id)
-                        related_name = project.name
-                    except:
-                        related_name = f"Project {message.res_id}"
-                        
-                elif message.model == 'project.task' and message.res_id:
-                    try:
-                        task = self.tasks.browse(message.res_id)
-                        related_name = task.name
-                    except:
-                        related_name = f"Task {message.res_id}"
-                
-                enriched_message = {
-                    'id': message.id,
-                    'subject': getattr(message, 'subject', '') or 'No subject',
-                    'body': getattr(message, 'body', '') or '',
-                    'author': message.author_id.name if message.author_id else 'System',
-                    'date': str(message.date) if message.date else '',
-                    'model': message.model,
-                    'res_id': message.res_id,
-                    'related_name': related_name,
-                    'related_type': related_type,
-                    'type': 'message',
-                    'search_term': search_term
-                }
-                enriched.append(enriched_message)
-                
-            except Exception as e:
-                print(f"⚠️ Error enriching message {message.id}: {e}")
-                continue
+        message_data_list = [self._message_data_from_row(row) for row in rows]
         
-        return enriched
+        # Resolve related project/task names with one read() per model
+        related_names = self._batch_related_names(message_data_list)
+        
+        return [
+            self._message_result(message_data, related_names, search_term)
+            for message_data in message_data_list
+        ]
 
     def print_results(self, results, limit=None):
         """Print search results in a tree-like hierarchical format"""
+        # Render everything into a buffer and write it at once, instead of one write per print()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            self._render_results(results, limit)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+    def _render_results(self, results, limit=None):
+        """Print the results summary and hierarchy"""
         total_found = len(results.get('projects', [])) + len(results.get('tasks', [])) + len(results.get('messages', [])) + len(results.get('files', []))
         
         if total_found == 0:
@@ -1249,11 +1148,15 @@ class OdooTextSearch(OdooBase):
         
         print(f"📊 SEARCH RESULTS SUMMARY")
         print(f"=" * 50)
-        print(f"📂 Projects: {len(results.get('projects', []))}")
-        print(f"📋 Tasks: {len(results.get('tasks', []))}")
-        print(f"💬 Messages: {len(results.get('messages', []))}")
-        print(f"📁 Files: {len(results.get('files', []))}")
-        print(f"📊 Total: {total_found}")
+        # Categories cut off by the limit show as "≥N"
+        truncated = results.get('truncated', [])
+        counts = {key: f"{'≥' if key in truncated else ''}{len(results.get(key, []))}"
+                  for key in ['projects', 'tasks', 'messages', 'files']}
+        print(f"📂 Projects: {counts['projects']}")
+        print(f"📋 Tasks: {counts['tasks']}")
+        print(f"💬 Messages: {counts['messages']}")
+        print(f"📁 Files: {counts['files']}")
+        print(f"📊 Total: {'≥' if truncated else ''}{total_found}")
         
         # Build hierarchical structure
         hierarchy = self._build_hierarchy(results, limit)
@@ -1294,6 +1197,25 @@ class OdooTextSearch(OdooBase):
             else:
                 hierarchy['orphaned_tasks'].append(task)
         
+        # Map every found task to its project, so placement below is a dict lookup
+        found_task_projects = {task['id']: task.get('project_id') for task in results.get('tasks', [])}
+        
+        # Look up the projects of message tasks we didn't find in one read(), not one call per message
+        message_task_projects = dict(self.task_project_map)
+        message_task_projects.update(found_task_projects)
+        unknown_task_ids = {
+            message['res_id'] for message in results.get('messages', [])
+            if message.get('related_type') == 'project.task' and message.get('res_id')
+            and message['res_id'] not in message_task_projects
+        }
+        if unknown_task_ids:
+            try:
+                for row in self._read_existing(self.tasks, unknown_task_ids, ['project_id']):
+                    message_task_projects[row['id']] = self.task_project_map[row['id']] = self.m2o_id(row.get('project_id'))
+            except Exception as e:
+                if self.verbose:
+                    print(f"⚠️ Could not lookup tasks {sorted(unknown_task_ids)} for message placement: {e}")
+        
         # Organize messages
         for message in results.get('messages', []):
             placed = False
@@ -1307,45 +1229,10 @@ class OdooTextSearch(OdooBase):
             
             # Try to place under task's project
             elif message.get('related_type') == 'project.task' and message.get('res_id'):
-                task_id = message['res_id']
-                
-                # First check if the task is in our found tasks and get its project
-                task_project_id = None
-                for task in results.get('tasks', []):
-                    if task['id'] == task_id:
-                        task_project_id = task.get('project_id')
-                        break
-                
-                # If we found the task's project in our results, place the message there
+                task_project_id = message_task_projects.get(message['res_id'])
                 if task_project_id and task_project_id in hierarchy['projects']:
                     hierarchy['projects'][task_project_id]['messages'].append(message)
                     placed = True
-                else:
-                    # Fallback: search through all projects' tasks that are already grouped
-                    for project_id, project_data in hierarchy['projects'].items():
-                        for task in project_data['tasks']:
-                            if task['id'] == task_id:
-                                hierarchy['projects'][project_id]['messages'].append(message)
-                                placed = True
-                                break
-                        if placed:
-                            break
-                    
-                    # If still not placed, try to get the task from database to find its project
-                    if not placed:
-                        try:
-                            # Look up the task directly to get its project
-                            task_records = self.tasks.search_records([('id', '=', task_id)])
-                            if task_records:
-                                task = task_records[0]
-                                if hasattr(task, 'project_id') and task.project_id:
-                                    task_project_id = task.project_id.id if hasattr(task.project_id, 'id') else task.project_id
-                                    if task_project_id in hierarchy['projects']:
-                                        hierarchy['projects'][task_project_id]['messages'].append(message)
-                                        placed = True
-                        except Exception as e:
-                            if self.verbose:
-                                print(f"⚠️ Could not lookup task {task_id} for message placement: {e}")
             
             if not placed:
                 hierarchy['orphaned_messages'].append(message)
@@ -1363,16 +1250,11 @@ class OdooTextSearch(OdooBase):
             
             # Try to place under task's project
             elif file.get('related_type') == 'Task' and file.get('related_id'):
-                task_id = file['related_id']
                 # Find which project this task belongs to
-                for project_id, project_data in hierarchy['projects'].items():
-                    for task in project_data['tasks']:
-                        if task['id'] == task_id:
-                            hierarchy['projects'][project_id]['files'].append(file)
-                            placed = True
-                            break
-                    if placed:
-                        break
+                task_project_id = found_task_projects.get(file['related_id'])
+                if task_project_id and task_project_id in hierarchy['projects']:
+                    hierarchy['projects'][task_project_id]['files'].append(file)
+                    placed = True
             
             if not placed:
                 hierarchy['orphaned_files'].append(file)
@@ -1383,6 +1265,11 @@ class OdooTextSearch(OdooBase):
         """Print the hierarchical results"""
         project_count = 0
         
+        # Resolve the item printers once instead of per item
+        print_task_item = self._print_task_item
+        print_message_item = self._print_message_item
+        print_file_item = self._print_file_item
+        
         # Print projects with their children
         for project_id, project_data in hierarchy['projects'].items():
             project_count += 1
@@ -1393,17 +1280,17 @@ class OdooTextSearch(OdooBase):
             # Print project details
             self._print_project_details(project, indent="   ")
             
-            # Determine what sections we have and their order
+            # Determine what sections we have, their order and how their items are printed
             sections = []
             if project_data['tasks']:
-                sections.append(('tasks', f"📋 TASKS ({len(project_data['tasks'])})", project_data['tasks']))
+                sections.append((f"📋 TASKS ({len(project_data['tasks'])})", project_data['tasks'], print_task_item))
             if project_data['messages']:
-                sections.append(('messages', f"💬 MESSAGES ({len(project_data['messages'])})", project_data['messages']))
+                sections.append((f"💬 MESSAGES ({len(project_data['messages'])})", project_data['messages'], print_message_item))
             if project_data['files']:
-                sections.append(('files', f"📁 FILES ({len(project_data['files'])})", project_data['files']))
+                sections.append((f"📁 FILES ({len(project_data['files'])})", project_data['files'], print_file_item))
             
             # Print sections with proper tree structure
-            for section_idx, (section_type, section_title, section_items) in enumerate(sections):
+            for section_idx, (section_title, section_items, print_item) in enumerate(sections):
                 is_last_section = section_idx == len(sections) - 1
                 section_prefix = "   └──" if is_last_section else "   ├──"
                 print(f"{section_prefix} {section_title}")
@@ -1428,31 +1315,29 @@ class OdooTextSearch(OdooBase):
                         item_prefix = "   │  ├──"
                         item_indent = "   │  │  "
                     
-                    if section_type == 'tasks':
-                        self._print_task_item(item, item_prefix, item_indent)
-                    elif section_type == 'messages':
-                        self._print_message_item(item, item_prefix, item_indent)
-                    elif section_type == 'files':
-                        self._print_file_item(item, item_prefix, item_indent)
+                    print_item(item, item_prefix, item_indent)
         
         # Print orphaned items
         if hierarchy['orphaned_tasks']:
             print(f"\n📋 TASKS WITHOUT PROJECTS ({len(hierarchy['orphaned_tasks'])})")
             print("-" * 40)
+            print_task = self._print_task_standalone
             for i, task in enumerate(hierarchy['orphaned_tasks'], 1):
-                self._print_task_standalone(task, i)
+                print_task(task, i)
         
         if hierarchy['orphaned_messages']:
             print(f"\n💬 STANDALONE MESSAGES ({len(hierarchy['orphaned_messages'])})")
             print("-" * 40)
+            print_message = self._print_message_standalone
             for i, message in enumerate(hierarchy['orphaned_messages'], 1):
-                self._print_message_standalone(message, i)
+                print_message(message, i)
         
         if hierarchy['orphaned_files']:
             print(f"\n📁 STANDALONE FILES ({len(hierarchy['orphaned_files'])})")
             print("-" * 40)
+            print_file = self._print_file_standalone
             for i, file in enumerate(hierarchy['orphaned_files'], 1):
-                self._print_file_standalone(file, i)
+                print_file(file, i)
 
     def _format_project_header(self, project):
         """Format project header with link"""
@@ -1460,6 +1345,23 @@ class OdooTextSearch(OdooBase):
         project_link = self.create_terminal_link(project_url, project['name'])
         return f"{project_link} (ID: {project['id']})"
 
+    def _text_snippet(self, text, search_term=None, width=400):
+        """One-line excerpt of at most width characters, moved forward to show the first match of (any) search_term"""
+        start = 0
+        if search_term and len(text) > width:
+            text_lower = text.lower()
+            position = min((found for term in self.lower_terms(search_term) if (found := text_lower.find(term)) >= 0), default=-1)
+            if position > width // 2:
+                start = min(position - width // 2, len(text) - width)
+        
+        snippet = text[start:start + width]
+        if start > 0:
+            snippet = "..." + snippet
+        if start + width < len(text):
+            snippet += "..."
+        # One pass that also collapses runs of whitespace (like blank lines from the markdown) into single spaces
+        return ' '.join(snippet.split())
+
     def _print_project_details(self, project, indent=""):
         """Print project details with proper indentation"""
         # Only show non-empty fields or when verbose
@@ -1477,8 +1379,7 @@ class OdooTextSearch(OdooBase):
         
         # Show description if there's a match
         if project['match_in_description'] and project['description']:
-            desc_snippet = project['description'][:400] + "..." if len(project['description']) > 400 else project['description']
-            desc_snippet = desc_snippet.replace('\n', ' ').strip()
+            desc_snippet = self._text_snippet(project['description'], project.get('search_term'))
             print(f"{indent}📝 Description:")
             print(self._format_wrapped_text(desc_snippet, indent + "   "))
         
@@ -1505,8 +1406,7 @@ class OdooTextSearch(OdooBase):
                 print(f"{indent}✅ Match in description")
         
         if task['match_in_description'] and task['description']:
-            desc_snippet = task['description'][:400] + "..." if len(task['description']) > 400 else task['description']
-            desc_snippet = desc_snippet.replace('\n', ' ').strip()
+            desc_snippet = self._text_snippet(task['description'], task.get('search_term'))
             print(f"{indent}📝 Description:")
             print(self._format_wrapped_text(desc_snippet, indent + "   "))
         
@@ -1516,31 +1416,36 @@ class OdooTextSearch(OdooBase):
         """Print a message item in the hierarchy"""
         message_url = self.get_message_url(message['id'])
         message_link = self.create_terminal_link(message_url, message['subject'])
-        print(f"{prefix} {message_link} (ID: {message['id']})")
+        # Collect the lines of this entry and print them at once
+        lines = [f"{prefix} {message_link} (ID: {message['id']})"]
         
         # Show message details with proper indentation
         if self.verbose or (message['author'] and message['author'] != 'System'):
-            print(f"{indent}👤 {message['author']}")
-        print(f"{indent}📅 {message['date']}")
+            lines.append(f"{indent}👤 {message['author']}")
+        lines.append(f"{indent}📅 {message['date']}")
         
         if message['body']:
-            body_snippet = message['body'][:400] + "..." if len(message['body']) > 400 else message['body']
-            body_snippet = body_snippet.replace('\n', ' ').strip()
-            print(f"{indent}💬 Message:")
-            print(self._format_wrapped_text(body_snippet, indent + "   "))
+            body_snippet = self._text_snippet(message['body'], message.get('search_term'))
+            lines.append(f"{indent}💬 Message:")
+            lines.append(self._format_wrapped_text(body_snippet, indent + "   "))
+        
+        print("\n".join(lines))
 
     def _print_file_item(self, file, prefix, indent):
         """Print a file item in the hierarchy"""
         file_url = self.get_file_url(file['id'])
         file_link = self.create_terminal_link(file_url, file['name'])
-        print(f"{prefix} {file_link} (ID: {file['id']})")
+        # Collect the lines of this entry and print them at once
+        lines = [f"{prefix} {file_link} (ID: {file['id']})"]
         
         # Show file details with proper indentation
         if self.verbose or (file['mimetype'] and file['mimetype'] != 'Unknown'):
-            print(f"{indent}📊 {file['mimetype']}")
+            lines.append(f"{indent}📊 {file['mimetype']}")
         if self.verbose or file.get('file_size', 0) > 0:
-            print(f"{indent}📏 {file['file_size_human']}")
-        print(f"{indent}📅 {file['create_date']}")
+            lines.append(f"{indent}📏 {file['file_size_human']}")
+        lines.append(f"{indent}📅 {file['create_date']}")
+        
+        print("\n".join(lines))
 
     def _print_task_standalone(self, task, index):
         """Print a standalone task (not under a project)"""
@@ -1569,85 +1474,85 @@ class OdooTextSearch(OdooBase):
                 print(f"   ✅ Match in description")
         
         if task['match_in_description'] and task['description']:
-            desc_snippet = task['description'][:400] + "..." if len(task['description']) > 400 else task['description']
-            desc_snippet = desc_snippet.replace('\n', ' ').strip()
+            desc_snippet = self._text_snippet(task['description'], task.get('search_term'))
             print(f"   📝 Description:")
             print(self._format_wrapped_text(desc_snippet, "      "))
         
         print(f"   📅 {task['write_date']}")
 
+    def _related_link(self, related_type, related_id, related_name):
+        """Related record name, as a terminal link when its type has a URL"""
+        builder = RELATED_URL_BUILDERS.get(related_type)
+        if builder and related_id:
+            return self.create_terminal_link(getattr(self, builder)(related_id), related_name)
+        return related_name
+
     def _print_message_standalone(self, message, index):
         """Print a standalone message"""
         message_url = self.get_message_url(message['id'])
         message_link = self.create_terminal_link(message_url, message['subject'])
-        print(f"\n{index}. 💬 {message_link} (ID: {message['id']})")
-        
         # Create link for related record
-        related_link = message['related_name']
-        if message['related_type'] == 'project.project' and message['res_id']:
-            related_url = self.get_project_url(message['res_id'])
-            related_link = self.create_terminal_link(related_url, message['related_name'])
-        elif message['related_type'] == 'project.task' and message['res_id']:
-            related_url = self.get_task_url(message['res_id'])
-            related_link = self.create_terminal_link(related_url, message['related_name'])
+        related_link = self._related_link(message['related_type'], message['res_id'], message['related_name'])
         
-        print(f"   📎 {related_link} ({message['related_type']})")
+        # Collect the lines of this entry and print them at once
+        lines = [
+            f"\n{index}. 💬 {message_link} (ID: {message['id']})",
+            f"   📎 {related_link} ({message['related_type']})"
+        ]
         
         if self.verbose or (message['author'] and message['author'] != 'System'):
-            print(f"   👤 {message['author']}")
-        print(f"   📅 {message['date']}")
+            lines.append(f"   👤 {message['author']}")
+        lines.append(f"   📅 {message['date']}")
         
         if message['body']:
-            body_snippet = message['body'][:400] + "..." if len(message['body']) > 400 else message['body']
-            body_snippet = body_snippet.replace('\n', ' ').strip()
-            print(f"   💬 Message:")
-            print(self._format_wrapped_text(body_snippet, "      "))
+            body_snippet = self._text_snippet(message['body'], message.get('search_term'))
+            lines.append(f"   💬 Message:")
+            lines.append(self._format_wrapped_text(body_snippet, "      "))
+        
+        print("\n".join(lines))
 
     def _print_file_standalone(self, file, index):
         """Print a standalone file"""
         file_url = self.get_file_url(file['id'])
         file_link = self.create_terminal_link(file_url, file['name'])
-        print(f"\n{index}. 📄 {file_link} (ID: {file['id']})")
+        # Collect the lines of this entry and print them at once
+        lines = [f"\n{index}. 📄 {file_link} (ID: {file['id']})"]
         
         if self.verbose or (file['mimetype'] and file['mimetype'] != 'Unknown'):
-            print(f"   📊 {file['mimetype']}")
+            lines.append(f"   📊 {file['mimetype']}")
         if self.verbose or file.get('file_size', 0) > 0:
-            print(f"   📏 {file['file_size_human']}")
+            lines.append(f"   📏 {file['file_size_human']}")
         
         # Create link for related record
         if file.get('related_type') and file.get('related_name'):
-            related_link = file['related_name']
-            if file['related_type'] == 'Project' and file.get('related_id'):
-                related_url = self.get_project_url(file['related_id'])
-                related_link = self.create_terminal_link(related_url, file['related_name'])
-            elif file['related_type'] == 'Task' and file.get('related_id'):
-                related_url = self.get_task_url(file['related_id'])
-                related_link = self.create_terminal_link(related_url, file['related_name'])
+            related_link = self._related_link(file['related_type'], file.get('related_id'), file['related_name'])
             
-            print(f"   📎 {related_link} ({file['related_type']})")
+            lines.append(f"   📎 {related_link} ({file['related_type']})")
         
         if file.get('project_name') and file['related_type'] == 'Task':
             project_link = file['project_name']
             if file.get('project_id'):
                 project_url = self.get_project_url(file['project_id'])
                 project_link = self.create_terminal_link(project_url, file['project_name'])
-            print(f"   📂 {project_link}")
+            lines.append(f"   📂 {project_link}")
         
         if file.get('assigned_user') and not str(file['assigned_user']).startswith('functools.partial'):
             if self.verbose or (file['assigned_user'] != 'Unassigned'):
-                print(f"   👤 {file['assigned_user']}")
+                lines.append(f"   👤 {file['assigned_user']}")
         
         if file.get('client'):
             if self.verbose or (file['client'] != 'No client'):
-                print(f"   🏢 {file['client']}")
+                lines.append(f"   🏢 {file['client']}")
         
-        print(f"   📅 {file['create_date']}")
+        lines.append(f"   📅 {file['create_date']}")
         
         if self.verbose or file.get('public'):
-            print(f"   🔗 {'Yes' if file.get('public') else 'No'}")
+            lines.append(f"   🔗 {'Yes' if file.get('public') else 'No'}")
         
         if file.get('error'):
-            print(f"   ⚠️ Error: {file['error']}")
+            lines.append(f"   ⚠️ Error: {file['error']}")
+        
+        print("\n".join(lines))
 
 
     def _format_wrapped_text(self, text, indent, width=80, prefix="│ "):
@@ -1707,49 +1612,57 @@ class OdooTextSearch(OdooBase):
         if not files:
             return {}
         
-        stats = {
-            'total_files': len(files),
-            'total_size': 0,
-            'by_type': {},
-            'by_project': {},
-            'by_extension': {}
-        }
+        if len(files) == 1:
+            # A single file needs no counting
+            file = files[0]
+            file_size = file.get('file_size', 0)
+            _, dot, extension = file.get('name', '').rpartition('.')
+            return {
+                'total_files': 1,
+                'total_size': file_size,
+                'by_type': {file.get('mimetype', 'Unknown'): {'count': 1, 'size': file_size}},
+                'by_project': {file.get('project_name', 'No project'): 1},
+                'by_extension': {extension.lower(): 1} if dot else {}
+            }
+        
+        total_size = 0
+        by_type = defaultdict(lambda: {'count': 0, 'size': 0})
         
         for file in files:
-            # Total size
-            stats['total_size'] += file.get('file_size', 0)
+            file_size = file.get('file_size', 0)
+            total_size += file_size
             
             # By MIME type
-            mime_type = file.get('mimetype', 'Unknown')
-            if mime_type in stats['by_type']:
-                stats['by_type'][mime_type]['count'] += 1
-                stats['by_type'][mime_type]['size'] += file.get('file_size', 0)
-            else:
-                stats['by_type'][mime_type] = {
-                    'count': 1,
-                    'size': file.get('file_size', 0)
-                }
-            
-            # By project
-            project_name = file.get('project_name', 'No project')
-            if project_name in stats['by_project']:
-                stats['by_project'][project_name] += 1
-            else:
-                stats['by_project'][project_name] = 1
-            
-            # By file extension
-            filename = file.get('name', '')
-            if '.' in filename:
-                extension = filename.split('.')[-1].lower()
-                if extension in stats['by_extension']:
-                    stats['by_extension'][extension] += 1
-                else:
-                    stats['by_extension'][extension] = 1
+            type_stats = by_type[file.get('mimetype', 'Unknown')]
+            type_stats['count'] += 1
+            type_stats['size'] += file_size
+        
+        # By project and by file extension, counted in bulk
+        by_project = Counter(file.get('project_name', 'No project') for file in files)
+        # One reverse scan per name; an empty separator means the name has no extension
+        by_extension = Counter(
+            extension.lower() for _, dot, extension in (file.get('name', '').rpartition('.') for file in files) if dot
+        )
         
-        return stats
+        return {
+            'total_files': len(files),
+            'total_size': total_size,
+            'by_type': dict(by_type),
+            'by_project': dict(by_project),
+            'by_extension': dict(by_extension)
+        }
 
     def print_file_statistics(self, files):
         """Print file statistics in a nice format"""
+        # Render into a buffer and write it at once, like print_results
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            self._render_file_statistics(files)
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+    def _render_file_statistics(self, files):
+        """Print the file statistics summary and top lists"""
         stats = self.get_file_statistics(files)
         
         if not stats:
@@ -1764,8 +1677,8 @@ class OdooTextSearch(OdooBase):
         # Top file types
         if stats['by_type']:
             print(f"\n📈 Top file types:")
-            sorted_types = sorted(stats['by_type'].items(), key=lambda x: x[1]['count'], reverse=True)
-            for i, (mime_type, type_stats) in enumerate(sorted_types[:5], 1):
+            top_types = heapq.nlargest(5, stats['by_type'].items(), key=lambda x: x[1]['count'])
+            for i, (mime_type, type_stats) in enumerate(top_types, 1):
                 percentage = (type_stats['count'] / stats['total_files']) * 100
                 size_human = self.format_file_size(type_stats['size'])
                 print(f"   {i}. {mime_type:<25} {type_stats['count']:3} files ({percentage:4.1f}%) - {size_human}")
@@ -1773,53 +1686,45 @@ class OdooTextSearch(OdooBase):
         # Top projects
         if stats['by_project']:
             print(f"\n📂 Files by project:")
-            sorted_projects = sorted(stats['by_project'].items(), key=lambda x: x[1], reverse=True)
-            for i, (project_name, count) in enumerate(sorted_projects[:5], 1):
+            top_projects = heapq.nlargest(5, stats['by_project'].items(), key=lambda x: x[1])
+            for i, (project_name, count) in enumerate(top_projects, 1):
                 percentage = (count / stats['total_files']) * 100
                 print(f"   {i}. {project_name:<30} {count:3} files ({percentage:4.1f}%)")
         
         # Top extensions
         if stats['by_extension']:
             print(f"\n📄 Top file extensions:")
-            sorted_extensions = sorted(stats['by_extension'].items(), key=lambda x: x[1], reverse=True)
-            for i, (extension, count) in enumerate(sorted_extensions[:5], 1):
+            top_extensions = heapq.nlargest(5, stats['by_extension'].items(), key=lambda x: x[1])
+            for i, (extension, count) in enumerate(top_extensions, 1):
                 percentage = (count / stats['total_files']) * 100
                 print(f"   {i}. .{extension:<10} {count:3} files ({percentage:4.1f}%)")
 
     def export_results(self, results, filename='text_search_results.csv'):
         """Export search results to CSV"""
-        all_results = []
+        # Only the result types that were found contribute columns
+        result_types = [result_type for result_type in EXPORT_COLUMNS if results.get(result_type)]
         
-        # Combine all results
-        for project in results.get('projects', []):
-            all_results.append(project)
-        for task in results.get('tasks', []):
-            all_results.append(task)
-        for message in results.get('messages', []):
-            all_results.append(message)
-        for file in results.get('files', []):
-            all_results.append(file)
-        
-        if not all_results:
+        if not result_types:
             print("❌ No results to export")
             return
         
+        # Columns in declaration order, each once, starting with the shared id/name columns
+        fieldnames = list(dict.fromkeys(field for result_type in result_types for field in EXPORT_COLUMNS[result_type]))
+        
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                # Get all possible fieldnames
-                fieldnames = set()
-                for result in all_results:
-                    fieldnames.update(result.keys())
-                
-                writer = csv.DictWriter(csvfile, fieldnames=sorted(fieldnames))
-                writer.writeheader()
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
                 
-                for result in all_results:
+                # Write rows as we go instead of collecting all results first, chaining the types into one writerows call
+                writer.writerows(
                     # Convert all values to strings for CSV
-                    csv_row = {k: str(v) if v is not None else '' for k, v in result.items()}
-                    writer.writerow(csv_row)
+                    ['' if (value := result.get(field)) is None else str(value) for field in fieldnames]
+                    for result in chain.from_iterable(results[result_type] for result_type in result_types)
+                )
+                exported = sum(len(results[result_type]) for result_type in result_types)
             
-            print(f"✅ {len(all_results)} results exported to {filename}")
+            print(f"✅ {exported} results exported to {filename}")
             
         except Exception as e:
             print(f"❌ Export failed: {e}")
@@ -1848,7 +1753,7 @@ Download files:
         """
     )
     
-    parser.add_argument('search_term', nargs='?', help='Text to search for (optional when using --download)')
+    parser.add_argument('search_term', nargs='*', help='Text to search for; several terms find matches for any of them (optional when using --download)')
     parser.add_argument('--since', help='Time reference (e.g., "1 week", "3 days", "2 months")')
     parser.add_argument('--type', choices=['all', 'projects', 'tasks', 'logs', 'files'], default='all',
                        help='What to search in (default: all). Use "files" to search ALL attachments regardless of model.')
@@ -1908,7 +1813,7 @@ Download files:
         
         # Perform search
         results = searcher.full_text_search(
-            search_term=args.search_term,
+            search_term=args.search_term[0] if len(args.search_term) == 1 else args.search_term,
             since=args.since,
             search_type=args.type,
             include_descriptions=not args.no_descriptions,
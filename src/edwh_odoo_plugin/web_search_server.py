@@ -36,9 +36,9 @@ import hashlib
 import logging
 import re
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, unquote
-import base64
+import gzip
 import mimetypes
 import time
 import warnings
@@ -61,6 +61,17 @@ except ImportError:
     except ImportError:
         from odoo_base import ConfigManager, OdooBase
 
+# Patterns used for every request or every result, compiled once at import. The ASCII ones only
+# ever need to match ASCII digits and whitespace, which is also what the validation intends
+UNSAFE_INPUT_RE = re.compile(r'[<>"\'\x00-\x1f\x7f-\x9f]')
+SINCE_PARAM_RE = re.compile(r'^[a-zA-Z0-9\s]+$', re.ASCII)
+FILE_TYPE_PARAM_RE = re.compile(r'^[a-zA-Z0-9]+$')
+ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+STAGE_PREFIX_RE = re.compile(r'^\d+_', re.ASCII)
+
+# Characters of a description cleaned for its 200 character preview; the margin covers stripped escape codes
+DESCRIPTION_PREVIEW_SOURCE_LENGTH = 2000
+
 
 class WebSearchHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the web search interface with security hardening"""
@@ -113,10 +124,42 @@ class WebSearchHandler(BaseHTTPRequestHandler):
             value = value[:max_length]
         
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[<>"\'\x00-\x1f\x7f-\x9f]', '', value)
+        sanitized = UNSAFE_INPUT_RE.sub('', value)
         
         return sanitized.strip()
     
+    def _accepts_gzip(self):
+        """Check Accept-Encoding for gzip, honouring q-values (gzip;q=0 refuses it)"""
+        qualities = {}
+        for item in self.headers.get('Accept-Encoding', '').split(','):
+            coding, *params = [part.strip() for part in item.split(';')]
+            if not coding:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[coding.lower()] = quality
+        
+        if 'gzip' in qualities:
+            return qualities['gzip'] > 0
+        return qualities.get('*', 0) > 0
+    
+    def _etag_matches(self, etag):
+        """Check If-None-Match, which may list several ETags, be '*' or use weak W/ tags"""
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        # If-None-Match uses weak comparison, so W/"x" matches "x"
+        tags = [tag.strip() for tag in header.split(',')]
+        return any(tag.removeprefix('W/') == etag for tag in tags)
+    
     def _validate_search_params(self, params):
         """Validate search parameters"""
         validated = {}
@@ -129,7 +172,7 @@ class WebSearchHandler(BaseHTTPRequestHandler):
         since = params.get('since', [''])[0]
         if since:
             # Only allow alphanumeric and spaces
-            if re.match(r'^[a-zA-Z0-9\s]+$', since) and len(since) <= 50:
+            if SINCE_PARAM_RE.match(since) and len(since) <= 50:
                 validated['since'] = since
             else:
                 logger.warning(f"Invalid since parameter: {since}")
@@ -154,7 +197,7 @@ class WebSearchHandler(BaseHTTPRequestHandler):
             safe_types = []
             for ft in file_types.split(','):
                 ft = ft.strip()
-                if re.match(r'^[a-zA-Z0-9]+$', ft) and len(ft) <= 10:
+                if FILE_TYPE_PARAM_RE.match(ft) and len(ft) <= 10:
                     safe_types.append(ft)
             validated['file_types'] = ','.join(safe_types[:10])  # Max 10 file types
         else:
@@ -233,10 +276,28 @@ class WebSearchHandler(BaseHTTPRequestHandler):
     
     def serve_main_page(self):
         """Serve the main HTML page with security headers"""
-        html_content = self.get_main_html()
+        use_gzip = self._accepts_gzip()
+        # Each encoding is its own representation, so it gets its own ETag
+        etag = f'"{MAIN_HTML_HASH}-gzip"' if use_gzip else f'"{MAIN_HTML_HASH}"'
+        
+        # The page only changes when the server is restarted, so a matching ETag needs no body
+        if self._etag_matches(etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            return
+        
+        body = MAIN_HTML_GZIP if use_gzip else MAIN_HTML_BYTES
+        
         self.send_response(200)
         self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.send_header('Content-Length', str(len(html_content.encode('utf-8'))))
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
         
         # Security headers
         self.send_header('X-Content-Type-Options', 'nosniff')
@@ -245,7 +306,7 @@ class WebSearchHandler(BaseHTTPRequestHandler):
         self.send_header('Content-Security-Policy', "default-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'")
         
         self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.wfile.write(body)
     
     def handle_search_api(self, query_string):
         """Handle search API requests using background processes with security validation"""
@@ -371,12 +432,12 @@ sys.path.insert(0, "{current_dir}")
 sys.path.insert(0, os.path.join("{current_dir}", "src"))
 
 try:
-    from edwh_odoo_plugin.text_search import OdooTextSearch
+    from edwh_odoo_plugin.text_search import OdooTextSearch, DomainBuilder
 except ImportError:
     try:
-        from src.edwh_odoo_plugin.text_search import OdooTextSearch
+        from src.edwh_odoo_plugin.text_search import OdooTextSearch, DomainBuilder
     except ImportError:
-        from text_search import OdooTextSearch
+        from text_search import OdooTextSearch, DomainBuilder
 
 # Read input with validation
 try:
@@ -389,10 +450,9 @@ try:
     # Create searcher instance
     searcher = OdooTextSearch(verbose=True)
     
-    # Parse time reference
-    since_date = None
-    if params["since"]:
-        since_date = searcher._parse_time_reference(params["since"])
+    # Parse time reference and format it once for all searches
+    since_date = searcher._parse_time_reference(params["since"]) if params["since"] else None
+    since_date = DomainBuilder.format_datetime(since_date)
     
     # Build user and message caches upfront
     searcher._build_user_cache()
@@ -775,6 +835,7 @@ except Exception as e:
     
     def handle_download_api(self, query_string):
         """Handle file download API requests with security validation"""
+        headers_sent = False
         try:
             params = parse_qs(query_string)
             file_id = params.get('id', [''])[0]
@@ -802,7 +863,7 @@ except Exception as e:
                 return
             
             # Get file info first
-            attachment_records = odoo_base.attachments.search_records([('id', '=', file_id_int)])
+            attachment_records = odoo_base.attachments.search_read([('id', '=', file_id_int)], ['name', 'datas'])
             
             if not attachment_records:
                 logger.warning(f"File not found: {file_id_int}")
@@ -810,36 +871,29 @@ except Exception as e:
                 return
             
             attachment = attachment_records[0]
-            file_name = getattr(attachment, 'name', f'file_{file_id}')
+            file_name = attachment.get('name') or f'file_{file_id}'
             
             # Sanitize filename for security
             safe_filename = odoo_base._sanitize_filename(file_name)
             
-            # Get file data using shared method
-            if not hasattr(attachment, 'datas'):
-                self.send_json_response({'error': 'No data available for this file'}, 404)
-                return
-            
-            file_data_b64 = attachment.datas
-            if hasattr(file_data_b64, '__call__'):
-                file_data_b64 = file_data_b64()
+            file_data_b64 = attachment.get('datas')
             
             if not file_data_b64:
                 self.send_json_response({'error': 'File data is empty'}, 404)
                 return
             
-            try:
-                # Decode base64 data
-                file_data = base64.b64decode(file_data_b64)
-            except Exception as e:
-                logger.error(f"Failed to decode file data: {e}")
-                self.send_json_response({'error': 'Invalid file data'}, 500)
+            # Decoded in chunks while sending, so the whole file is never held decoded in memory
+            file_data_b64 = odoo_base.normalize_base64(file_data_b64)
+            if not odoo_base.is_valid_base64(file_data_b64):
+                logger.error(f"Invalid file data for file {file_id_int}")
+                self.send_json_response({'error': 'File data is corrupt'}, 500)
                 return
+            file_size = odoo_base.decoded_base64_size(file_data_b64)
             
             # Validate file size (max 100MB for web downloads)
             max_size = 100 * 1024 * 1024  # 100MB
-            if len(file_data) > max_size:
-                logger.warning(f"File too large for web download: {len(file_data)} bytes")
+            if file_size > max_size:
+                logger.warning(f"File too large for web download: {file_size} bytes")
                 self.send_json_response({'error': 'File too large for web download'}, 413)
                 return
             
@@ -866,16 +920,24 @@ except Exception as e:
             self.send_response(200)
             self.send_header('Content-Type', mime_type)
             self.send_header('Content-Disposition', f'attachment; filename="{safe_filename}"')
-            self.send_header('Content-Length', str(len(file_data)))
+            self.send_header('Content-Length', str(file_size))
             self.send_header('X-Content-Type-Options', 'nosniff')
             self.send_header('X-Frame-Options', 'DENY')
             self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
             self.end_headers()
-            self.wfile.write(file_data)
+            headers_sent = True
+            for chunk in odoo_base.iter_base64_chunks(file_data_b64):
+                self.wfile.write(chunk)
             
-            logger.info(f"File downloaded: {safe_filename} ({len(file_data)} bytes)")
+            logger.info(f"File downloaded: {safe_filename} ({file_size} bytes)")
             
         except Exception as e:
+            if headers_sent:
+                # The 200 response is already on its way; a JSON error would end up inside the file body
+                logger.error(f"Download of file {file_id} aborted after sending headers: {e}")
+                self.close_connection = True
+                return
+            
             import traceback
             error_msg = f"Search error: {str(e)}"
             traceback_msg = traceback.format_exc()
@@ -1246,9 +1308,7 @@ except Exception as e:
         def clean_text(text):
             if not text:
                 return ""
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            return ansi_escape.sub('', str(text))
+            return ANSI_ESCAPE_RE.sub('', str(text))
 
         def normalize_priority(priority_value):
             try:
@@ -1269,8 +1329,7 @@ except Exception as e:
         def clean_stage_name(stage_name):
             if not stage_name or stage_name == 'No Stage':
                 return 'No Stage'
-            import re
-            cleaned = re.sub(r'^\d+_', '', str(stage_name))
+            cleaned = STAGE_PREFIX_RE.sub('', str(stage_name))
             cleaned = cleaned.replace('_', ' ').title()
             stage_mapping = {
                 'Inbox': 'Inbox', 'In Progress': 'In Progress', 'Done': 'Done',
@@ -1307,7 +1366,9 @@ except Exception as e:
         if task_data.get('project_name'):
             node['metadata']['project'] = clean_text(task_data['project_name'])
         if task_data.get('description'):
-            node['metadata']['description'] = clean_text(task_data['description'])[:200] + ('...' if len(clean_text(task_data['description'])) > 200 else '')
+            # Only the first 200 characters are shown, so don't clean the rest of a long description
+            description = clean_text(task_data['description'][:DESCRIPTION_PREVIEW_SOURCE_LENGTH])
+            node['metadata']['description'] = description[:200] + ('...' if len(description) > 200 else '')
         
         # Convert children recursively
         if task_data.get('children'):
@@ -1326,9 +1387,7 @@ except Exception as e:
             if not text:
                 return ""
             # Remove ANSI escape sequences
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            return ansi_escape.sub('', str(text))
+            return ANSI_ESCAPE_RE.sub('', str(text))
 
         def normalize_priority(priority_value):
             """Convert priority to normalized format"""
@@ -1353,8 +1412,7 @@ except Exception as e:
                 return 'No Stage'
             
             # Remove common prefixes like "01_", "04_", etc.
-            import re
-            cleaned = re.sub(r'^\d+_', '', str(stage_name))
+            cleaned = STAGE_PREFIX_RE.sub('', str(stage_name))
             
             # Convert underscores to spaces and title case
             cleaned = cleaned.replace('_', ' ').title()
@@ -1408,7 +1466,9 @@ except Exception as e:
             if task_data.get('project_name'):
                 node['metadata']['project'] = clean_text(task_data['project_name'])
             if task_data.get('description'):
-                node['metadata']['description'] = clean_text(task_data['description'])[:200] + ('...' if len(clean_text(task_data['description'])) > 200 else '')
+                # Only the first 200 characters are shown, so don't clean the rest of a long description
+                description = clean_text(task_data['description'][:DESCRIPTION_PREVIEW_SOURCE_LENGTH])
+                node['metadata']['description'] = description[:200] + ('...' if len(description) > 200 else '')
             
             # Convert children recursively
             if task_data.get('children'):
@@ -1669,8 +1729,16 @@ except Exception as e:
         self.send_error(404, "Static files not implemented")
     
     def get_main_html(self):
-        """Generate the main HTML page"""
-        return r"""<!DOCTYPE html>
+        """Return the main HTML page"""
+        return MAIN_HTML
+
+    def log_message(self, format, *args):
+        """Override to reduce logging noise"""
+        pass
+
+
+# The single-page UI. It is static, so it is encoded, compressed and hashed once at import
+MAIN_HTML = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -3105,6 +3173,8 @@ except Exception as e:
                             <select id="odooProtocol" name="protocol">
                                 <option value="xml-rpcs">xml-rpcs (HTTPS)</option>
                                 <option value="xml-rpc">xml-rpc (HTTP)</option>
+                                <option value="json-rpcs">json-rpcs (HTTPS)</option>
+                                <option value="json-rpc">json-rpc (HTTP)</option>
                             </select>
                         </div>
                     </div>
@@ -3149,6 +3219,32 @@ except Exception as e:
         const savedTheme = localStorage.getItem('theme') || 'light';
         document.documentElement.setAttribute('data-theme', savedTheme);
         
+        // Verbose tracing (per node / per filter toggle) is only emitted when localStorage.EDWH_DEBUG = '1'
+        const DEBUG = localStorage.getItem('EDWH_DEBUG') === '1';
+        
+        // Static elements that are looked up repeatedly; the script runs after they are parsed
+        const MODAL = {
+            root: document.getElementById('customModal'),
+            title: document.getElementById('modalTitle'),
+            body: document.getElementById('modalBody'),
+            confirm: document.getElementById('modalConfirmBtn')
+        };
+        const toastContainer = document.getElementById('toastContainer');
+        const hierarchyContainer = document.getElementById('hierarchyContainer');
+        
+        // Logger for the drag & drop / move code; a no-op unless DEBUG is set
+        const dlog = DEBUG ? console.log.bind(console) : () => {};
+        
+        // Regexes and validators shared by several handlers, compiled once
+        const RE_DIGITS = /^\d+$/;
+        const RE_NON_ALPHANUMERIC = /[^a-zA-Z0-9]/g;
+        const RE_TOGGLE_PIN_ARGS = /togglePin\('([^']+)', '([^']+)'/;
+        const RE_DOUBLE_QUOTE = /"/g;
+        
+        function isValidId(id) {
+            return typeof id === 'string' && RE_DIGITS.test(id);
+        }
+        
         // Search history and results caching management
         function loadSearchHistory() {
             const history = JSON.parse(localStorage.getItem('searchHistory') || '[]');
@@ -3204,7 +3300,7 @@ except Exception as e:
                 file_types: params.file_types || '',
                 limit: params.limit || ''
             };
-            return btoa(JSON.stringify(key)).replace(/[^a-zA-Z0-9]/g, '');
+            return btoa(JSON.stringify(key)).replace(RE_NON_ALPHANUMERIC, '');
         }
         
         function cacheSearchResults(searchTerm, params, results) {
@@ -3717,6 +3813,10 @@ except Exception as e:
             return div.innerHTML;
         }
         
+        function escapeAttribute(text) {
+            return escapeHtml(text).replace(RE_DOUBLE_QUOTE, '&quot;');
+        }
+        
         
         function loadPins() {
             const pins = JSON.parse(localStorage.getItem('pinnedItems') || '[]');
@@ -3898,7 +3998,7 @@ except Exception as e:
             pinButtons.forEach(button => {
                 const onclick = button.getAttribute('onclick');
                 if (onclick) {
-                    const match = onclick.match(/togglePin\('([^']+)', '([^']+)'/);
+                    const match = onclick.match(RE_TOGGLE_PIN_ARGS);
                     if (match) {
                         const itemId = match[1];
                         const itemType = match[2];
@@ -3951,6 +4051,7 @@ except Exception as e:
         
         // Debug function to inspect hierarchy data
         function debugHierarchy(hierarchy) {
+            if (!DEBUG) return;
             console.log('=== HIERARCHY DEBUG ===');
             console.log('Full hierarchy object:', hierarchy);
             console.log('Type:', hierarchy?.type);
@@ -3992,7 +4093,7 @@ except Exception as e:
             }
             
             // If it's a number, treat as ID
-            if (/^\d+$/.test(searchValue)) {
+            if (isValidId(searchValue)) {
                 loadHierarchy(type, searchValue);
             } else {
                 // Search for the item first
@@ -4000,9 +4101,16 @@ except Exception as e:
             }
         }
         
+        function createLoadingMessage(message) {
+            const loading = document.createElement('div');
+            loading.className = 'loading';
+            loading.textContent = message;
+            return loading;
+        }
+        
         function searchForHierarchyItem(searchTerm, type) {
-            const container = document.getElementById('hierarchyContainer');
-            container.innerHTML = '<div class="loading">Searching for ' + type + '...</div>';
+            const container = hierarchyContainer;
+            container.replaceChildren(createLoadingMessage(`Searching for ${type}...`));
             
             // Use existing search API
             const params = new URLSearchParams({
@@ -4039,16 +4147,16 @@ except Exception as e:
                             if (items && items.length > 0) {
                                 showHierarchySearchResults(items, type);
                             } else {
-                                document.getElementById('hierarchyContainer').innerHTML = 
+                                hierarchyContainer.innerHTML = 
                                     '<div class="error">No ' + type + 's found</div>';
                             }
                         } else {
-                            document.getElementById('hierarchyContainer').innerHTML = 
+                            hierarchyContainer.innerHTML = 
                                 '<div class="error">Search failed</div>';
                         }
                     })
                     .catch(error => {
-                        document.getElementById('hierarchyContainer').innerHTML = 
+                        hierarchyContainer.innerHTML = 
                             '<div class="error">Search error: ' + error.message + '</div>';
                     });
             }
@@ -4056,7 +4164,7 @@ except Exception as e:
         }
         
         function showHierarchySearchResults(items, type) {
-            const container = document.getElementById('hierarchyContainer');
+            const container = hierarchyContainer;
             let html = '<div style="padding: 20px;"><h3>Select ' + type + ' to view hierarchy:</h3>';
             
             items.forEach(item => {
@@ -4081,13 +4189,13 @@ except Exception as e:
         }
         
         function loadHierarchy(type, id) {
-            const container = document.getElementById('hierarchyContainer');
-            container.innerHTML = '<div class="loading">Loading ' + type + ' hierarchy...</div>';
+            const container = hierarchyContainer;
+            container.replaceChildren(createLoadingMessage(`Loading ${type} hierarchy...`));
             
             fetch(`/api/hierarchy/${type}/${id}`)
                 .then(response => response.json())
                 .then(data => {
-                    console.log('Hierarchy API response:', data);
+                    if (DEBUG) console.log('Hierarchy API response:', data);
                     if (data.success) {
                         debugHierarchy(data.hierarchy);
                         displayHierarchy(data.hierarchy);
@@ -4102,14 +4210,14 @@ except Exception as e:
         }
         
         function displayHierarchy(hierarchy) {
-            const container = document.getElementById('hierarchyContainer');
+            const container = hierarchyContainer;
             const filtersContainer = document.getElementById('hierarchyFilters');
             
-            console.log('🌳 Displaying hierarchy:', hierarchy);
-            console.log('Hierarchy type:', hierarchy?.type);
-            console.log('Root node:', hierarchy?.root);
-            console.log('Filter data available:', !!hierarchy?.filter_data);
-            console.log('Filter data content:', hierarchy?.filter_data);
+            if (DEBUG) console.log('🌳 Displaying hierarchy:', hierarchy);
+            if (DEBUG) console.log('Hierarchy type:', hierarchy?.type);
+            if (DEBUG) console.log('Root node:', hierarchy?.root);
+            if (DEBUG) console.log('Filter data available:', !!hierarchy?.filter_data);
+            if (DEBUG) console.log('Filter data content:', hierarchy?.filter_data);
             
             if (!hierarchy || !hierarchy.root) {
                 console.error('❌ Invalid hierarchy data:', hierarchy);
@@ -4120,161 +4228,183 @@ except Exception as e:
             // Store hierarchy globally for filtering and drag & drop
             window.currentHierarchy = hierarchy;
             
-            let html = '';
+            const parts = [];
             
             // Add breadcrumb for task hierarchy
             if (hierarchy.type === 'task' && hierarchy.parents && hierarchy.parents.length > 0) {
-                html += '<div class="hierarchy-breadcrumb">';
-                html += '<span>Path: </span>';
-                hierarchy.parents.forEach((parent, index) => {
-                    html += `<span class="breadcrumb-item"><a href="${parent.url}" target="_blank">${escapeHtml(parent.name)}</a></span>`;
+                parts.push('<div class="hierarchy-breadcrumb">', '<span>Path: </span>');
+                hierarchy.parents.forEach(parent => {
+                    parts.push(`<span class="breadcrumb-item"><a href="${parent.url}" target="_blank">${escapeHtml(parent.name)}</a></span>`);
                 });
-                html += `<span class="breadcrumb-item">${escapeHtml(hierarchy.root.name)}</span>`;
-                html += '</div>';
+                parts.push(`<span class="breadcrumb-item">${escapeHtml(hierarchy.root.name)}</span>`, '</div>');
             }
             
             // Render tree
-            html += '<div class="tree-view" id="treeView">';
-            console.log('About to render root node:', hierarchy.root.name, 'with children:', hierarchy.root.children?.length || 0);
-            const rootHtml = renderTreeNode(hierarchy.root, 0, true);
-            if (rootHtml) {
-                html += rootHtml;
-                console.log('Root node rendered successfully');
+            parts.push('<div class="tree-view" id="treeView">');
+            if (DEBUG) console.log('About to render root node:', hierarchy.root.name, 'with children:', hierarchy.root.children?.length || 0);
+            const rootStart = parts.length;
+            renderTreeNodeInto(parts, hierarchy.root, 0, true);
+            if (parts.length > rootStart) {
+                if (DEBUG) console.log('Root node rendered successfully');
             } else {
                 console.error('Root node failed to render');
-                html += '<div class="error">Failed to render hierarchy tree</div>';
+                parts.push('<div class="error">Failed to render hierarchy tree</div>');
             }
-            html += '</div>';
+            parts.push('</div>');
             
-            console.log('Generated HTML length:', html.length);
-            console.log('Generated HTML preview:', html.substring(0, 500) + '...');
+            const html = parts.join('');
+            if (DEBUG) console.log('Generated HTML length:', html.length);
+            if (DEBUG) console.log('Generated HTML preview:', html.substring(0, 500) + '...');
             container.innerHTML = html;
+            invalidateTreeNodes();
             
             // Setup filters AFTER DOM is populated
-            console.log('🔧 Setting up filters after DOM population...');
+            if (DEBUG) console.log('🔧 Setting up filters after DOM population...');
             setupHierarchyFilters(hierarchy);
             filtersContainer.style.display = 'block';
             
             // Setup drag & drop
             setupDragAndDrop();
             
-            // Apply saved filters
-            applySavedFilters();
-            
-            // Restore state if this is a refresh
-            if (HierarchyState.expandedNodes.size > 0) {
-                setTimeout(() => {
-                    HierarchyState.restoreState();
-                }, 100);
-            }
+            // Apply saved filters, then restore state if this is a refresh
+            applySavedFilters().then(() => {
+                if (HierarchyState.expandedNodes.size > 0) {
+                    setTimeout(() => {
+                        HierarchyState.restoreState();
+                    }, 100);
+                }
+            });
         }
         
-        function renderTreeNode(node, depth, isRoot = false) {
+        function renderTreeNode(node, depth, isRoot = false, parentPath = '') {
+            const parts = [];
+            renderTreeNodeInto(parts, node, depth, isRoot, parentPath);
+            return parts.join('');
+        }
+        
+        function renderTreeNodeInto(parts, node, depth, isRoot = false, parentPath = '') {
+            // Appends the node's HTML fragments to `parts`; the whole tree is joined once by the caller
             if (!node) {
                 console.warn('renderTreeNode called with null/undefined node');
-                return '';
+                return;
             }
             
-            console.log('Rendering node:', node.name, 'Type:', node.type, 'Children:', node.children?.length || 0);
+            if (DEBUG) console.log('Rendering node:', node.name, 'Type:', node.type, 'Children:', node.children?.length || 0);
             
             const hasChildren = node.children && Array.isArray(node.children) && node.children.length > 0;
             const nodeId = `node-${node.type}-${node.id}`;
             const isDraggable = node.type === 'task' && !isRoot;
+            const recordId = parseInt(node.id, 10);
+            const recordIdAttr = Number.isNaN(recordId) ? '' : String(recordId);
+            const idAttribute = node.type === 'task'
+                ? `data-task-id="${recordIdAttr}"`
+                : `data-project-id="${recordIdAttr}"`;
+            const nodePath = `${parentPath}/${recordIdAttr}`;
             
             // Get stage and priority for filtering
             const stage = node.stage || 'No Stage';
             const priorityLevel = node.priority ? node.priority.level : 0;
             
-            let html = `<div class="tree-node" data-node-id="${nodeId}" data-task-id="${node.id}" data-stage="${stage}" data-priority="${priorityLevel}" data-type="${node.type}">`;
+            parts.push(`<div class="tree-node" data-node-id="${nodeId}" ${idAttribute} data-stage="${stage}" data-priority="${priorityLevel}" data-type="${node.type}" data-path="${nodePath}" data-name="${escapeAttribute(node.name)}">`);
             
             // Drop indicator (for drag & drop)
-            html += '<div class="drop-indicator"></div>';
+            parts.push('<div class="drop-indicator"></div>');
             
-            html += `<div class="tree-node-content ${isDraggable ? 'draggable' : ''}" ${isDraggable ? 'draggable="true"' : ''}>`;
+            parts.push(`<div class="tree-node-content ${isDraggable ? 'draggable' : ''}" ${isDraggable ? 'draggable="true"' : ''}>`);
             
             // Drag handle (only for tasks)
             if (isDraggable) {
-                html += '<span class="drag-handle" title="Drag to move">⋮⋮</span>';
+                parts.push('<span class="drag-handle" title="Drag to move">⋮⋮</span>');
             }
             
             // Toggle button
             if (hasChildren) {
-                html += '<button class="tree-toggle" onclick="toggleTreeNode(\'' + nodeId + '\')" title="Expand/Collapse">▼</button>';
+                parts.push('<button class="tree-toggle" onclick="toggleTreeNode(\'' + nodeId + '\')" title="Expand/Collapse">▼</button>');
             } else {
-                html += '<span class="tree-toggle"></span>';
+                parts.push('<span class="tree-toggle"></span>');
             }
             
             // Icon
             const icon = node.type === 'project' ? '📂' : '📋';
-            html += '<span class="tree-icon">' + icon + '</span>';
+            parts.push('<span class="tree-icon">', icon, '</span>');
             
             // Label with link
-            html += '<span class="tree-label">';
-            html += '<a href="' + node.url + '" target="_blank">' + escapeHtml(node.name) + '</a>';
-            html += ' <small>(ID: ' + node.id + ')</small>';
-            html += '</span>';
+            parts.push(
+                '<span class="tree-label">',
+                '<a href="', node.url, '" target="_blank">', escapeHtml(node.name), '</a>',
+                ' <small>(ID: ', node.id, ')</small>',
+                '</span>'
+            );
             
             // Metadata with enhanced display
             if (node.type === 'task') {
-                html += '<div class="tree-metadata">';
+                parts.push('<div class="tree-metadata">');
                 
                 // Stage badge
                 if (node.stage && node.stage !== 'No Stage') {
                     const stageClass = getStageClass(node.stage);
-                    html += `<span class="stage-badge ${stageClass}">${escapeHtml(node.stage)}</span>`;
+                    parts.push(`<span class="stage-badge ${stageClass}">${escapeHtml(node.stage)}</span>`);
                 }
                 
                 // Priority stars
                 if (node.priority && node.priority.level > 0) {
                     const stars = '★'.repeat(node.priority.stars);
-                    html += `<span class="priority-stars" title="${node.priority.name}">${stars}</span>`;
+                    parts.push(`<span class="priority-stars" title="${node.priority.name}">${stars}</span>`);
                 }
                 
                 // User
                 if (node.metadata && node.metadata.user) {
-                    html += '<span>👤 ' + escapeHtml(node.metadata.user) + '</span>';
+                    parts.push('<span>👤 ', escapeHtml(node.metadata.user), '</span>');
                 }
                 
-                html += '</div>';
+                parts.push('</div>');
             } else if (node.metadata && Object.keys(node.metadata).length > 0) {
-                html += '<div class="tree-metadata">';
+                parts.push('<div class="tree-metadata">');
                 
                 if (node.metadata.manager) {
-                    html += '<span>👤 ' + escapeHtml(node.metadata.manager) + '</span>';
+                    parts.push('<span>👤 ', escapeHtml(node.metadata.manager), '</span>');
                 }
                 if (node.metadata.total_tasks) {
-                    html += '<span>📊 ' + node.metadata.total_tasks + ' tasks</span>';
+                    parts.push('<span>📊 ', node.metadata.total_tasks, ' tasks</span>');
                 }
                 
-                html += '</div>';
+                parts.push('</div>');
             }
             
-            html += '</div>';
+            parts.push('</div>');
             
             // Children
             if (hasChildren) {
-                html += '<div class="tree-children" id="children-' + nodeId + '">';
-                console.log(`Rendering ${node.children.length} children for ${node.name}`);
+                parts.push('<div class="tree-children" id="children-', nodeId, '">');
+                if (DEBUG) console.log(`Rendering ${node.children.length} children for ${node.name}`);
                 node.children.forEach((child, index) => {
                     if (child && typeof child === 'object') {
-                        console.log(`  Child ${index + 1}:`, child.name || 'Unnamed', 'Type:', child.type || 'Unknown');
-                        const childHtml = renderTreeNode(child, depth + 1);
-                        if (childHtml) {
-                            html += childHtml;
-                        } else {
+                        if (DEBUG) console.log(`  Child ${index + 1}:`, child.name || 'Unnamed', 'Type:', child.type || 'Unknown');
+                        const childStart = parts.length;
+                        renderTreeNodeInto(parts, child, depth + 1, false, nodePath);
+                        if (parts.length === childStart) {
                             console.warn(`  Child ${index + 1} rendered empty HTML`);
                         }
                     } else {
                         console.warn(`  Child ${index + 1} is invalid:`, child);
                     }
                 });
-                html += '</div>';
+                parts.push('</div>');
             } else {
-                console.log(`No children for ${node.name} (hasChildren: ${hasChildren}, children:`, node.children, ')');
+                if (DEBUG) console.log(`No children for ${node.name} (hasChildren: ${hasChildren}, children:`, node.children, ')');
             }
             
-            html += '</div>';
-            return html;
+            parts.push('</div>');
+        }
+        
+        function refreshNodePaths(node) {
+            // Recompute data-path for a node that moved in the DOM, and for its subtree
+            if (!node) return;
+            [node, ...node.querySelectorAll('.tree-node')].forEach(current => {
+                const parent = current.parentElement?.closest('.tree-node');
+                const recordId = current.dataset.taskId || current.dataset.projectId;
+                current.dataset.path = `${parent?.dataset.path || ''}/${recordId}`;
+            });
         }
         
         function getStageClass(stage) {
@@ -4336,9 +4466,9 @@ except Exception as e:
         
         // Hierarchy Filtering System
         function setupHierarchyFilters(hierarchy) {
-            console.log('🔧 Setting up hierarchy filters...');
-            console.log('Hierarchy object:', hierarchy);
-            console.log('Filter data:', hierarchy?.filter_data);
+            if (DEBUG) console.log('🔧 Setting up hierarchy filters...');
+            if (DEBUG) console.log('Hierarchy object:', hierarchy);
+            if (DEBUG) console.log('Filter data:', hierarchy?.filter_data);
             
             const stageFilters = document.getElementById('stageFilters');
             const prioritySlider = document.getElementById('prioritySlider');
@@ -4357,31 +4487,31 @@ except Exception as e:
             // Primary: Use hierarchy.filter_data.stages
             if (hierarchy?.filter_data?.stages && Array.isArray(hierarchy.filter_data.stages)) {
                 stages = hierarchy.filter_data.stages;
-                console.log('✅ Using hierarchy.filter_data.stages:', stages);
+                if (DEBUG) console.log('✅ Using hierarchy.filter_data.stages:', stages);
             } else {
                 console.warn('⚠️ hierarchy.filter_data.stages not available, using fallback');
                 // Fallback: Scan DOM for actual stage values
                 stages = extractStagesFromDOM();
-                console.log('🔄 Extracted stages from DOM:', stages);
+                if (DEBUG) console.log('🔄 Extracted stages from DOM:', stages);
             }
             
             // Emergency fallback: Scan hierarchy data directly
             if (stages.length === 0) {
                 console.warn('⚠️ No stages found in DOM, scanning hierarchy data directly');
                 stages = extractStagesFromHierarchyData(hierarchy);
-                console.log('🔍 Extracted stages from hierarchy data:', stages);
+                if (DEBUG) console.log('🔍 Extracted stages from hierarchy data:', stages);
             }
             
             // Final fallback: Common stage names
             if (stages.length === 0) {
                 console.warn('⚠️ No stages found anywhere, using default stages');
                 stages = ['No Stage', 'Inbox', 'In Progress', 'Done', 'Cancelled'];
-                console.log('📋 Using default stages:', stages);
+                if (DEBUG) console.log('📋 Using default stages:', stages);
             }
             
             // Remove duplicates and sort
             stages = [...new Set(stages)].sort();
-            console.log('📊 Final stages list:', stages);
+            if (DEBUG) console.log('📊 Final stages list:', stages);
             
             // Create stage filter toggles
             stages.forEach(stage => {
@@ -4392,7 +4522,7 @@ except Exception as e:
                 toggle.onclick = () => toggleStageFilter(stage, toggle);
                 toggle.title = `Toggle ${stage} tasks`;
                 stageFilters.appendChild(toggle);
-                console.log(`➕ Added stage filter: ${stage}`);
+                if (DEBUG) console.log(`➕ Added stage filter: ${stage}`);
             });
             
             // Setup priority filter
@@ -4405,20 +4535,20 @@ except Exception as e:
             // Apply filters immediately to ensure all stages are visible initially
             applyFilters();
             
-            console.log('✅ Hierarchy filters setup complete');
+            if (DEBUG) console.log('✅ Hierarchy filters setup complete');
         }
         
         function extractStagesFromDOM() {
             const stages = new Set();
             const taskNodes = document.querySelectorAll('.tree-node[data-type="task"]');
             
-            console.log(`🔍 Scanning ${taskNodes.length} task nodes for stages...`);
+            if (DEBUG) console.log(`🔍 Scanning ${taskNodes.length} task nodes for stages...`);
             
             taskNodes.forEach(node => {
                 const stage = node.dataset.stage;
                 if (stage && stage.trim()) {
                     stages.add(stage.trim());
-                    console.log(`  Found stage: "${stage}"`);
+                    if (DEBUG) console.log(`  Found stage: "${stage}"`);
                 }
             });
             
@@ -4433,7 +4563,7 @@ except Exception as e:
                 
                 if (node.type === 'task' && node.stage) {
                     stages.add(node.stage);
-                    console.log(`  Found stage in hierarchy data: "${node.stage}"`);
+                    if (DEBUG) console.log(`  Found stage in hierarchy data: "${node.stage}"`);
                 }
                 
                 if (node.children && Array.isArray(node.children)) {
@@ -4442,7 +4572,7 @@ except Exception as e:
             }
             
             if (hierarchy?.root) {
-                console.log('🔍 Scanning hierarchy root for stages...');
+                if (DEBUG) console.log('🔍 Scanning hierarchy root for stages...');
                 scanNode(hierarchy.root);
             }
             
@@ -4490,10 +4620,10 @@ except Exception as e:
             const activeStages = Array.from(stageToggles).map(t => t.dataset.stage);
             const minPriority = parseInt(document.getElementById('prioritySlider').value || 0);
             
-            console.log('Applying filters - Active stages:', activeStages, 'Min priority:', minPriority);
+            if (DEBUG) console.log('Applying filters - Active stages:', activeStages, 'Min priority:', minPriority);
             
             const allNodes = document.querySelectorAll('.tree-node[data-type="task"]');
-            console.log('Found', allNodes.length, 'task nodes to filter');
+            if (DEBUG) console.log('Found', allNodes.length, 'task nodes to filter');
             
             allNodes.forEach(node => {
                 const stage = node.dataset.stage;
@@ -4502,7 +4632,7 @@ except Exception as e:
                 const stageMatch = activeStages.length === 0 || activeStages.includes(stage);
                 const priorityMatch = priority >= minPriority;
                 
-                console.log(`Task ${node.dataset.taskId}: stage="${stage}" (match: ${stageMatch}), priority=${priority} (match: ${priorityMatch})`);
+                if (DEBUG) console.log(`Task ${node.dataset.taskId}: stage="${stage}" (match: ${stageMatch}), priority=${priority} (match: ${priorityMatch})`);
                 
                 if (stageMatch && priorityMatch) {
                     node.classList.remove('filtered-hidden');
@@ -4514,7 +4644,7 @@ except Exception as e:
             // Handle parent visibility (show parents if they have visible children)
             updateParentVisibility();
             
-            console.log('Filter application complete');
+            if (DEBUG) console.log('Filter application complete');
         }
         
         function updateParentVisibility() {
@@ -4553,7 +4683,7 @@ except Exception as e:
             
             let text = '';
             
-            console.log(`📊 Updating filter summary: ${activeStages.length}/${allStages.length} stages active`);
+            if (DEBUG) console.log(`📊 Updating filter summary: ${activeStages.length}/${allStages.length} stages active`);
             
             if (activeStages.length === 0) {
                 text += 'No stages selected';
@@ -4566,10 +4696,77 @@ except Exception as e:
             text += ` | Priority: ${priorityLabels[minPriority] || 'Normal'}+`;
             
             summary.textContent = text;
-            console.log(`📊 Filter summary updated: "${text}"`);
+            if (DEBUG) console.log(`📊 Filter summary updated: "${text}"`);
+        }
+        
+        // Filter state storage: IndexedDB (async) with a localStorage fallback
+        let filterDbPromise = null;
+        
+        function openFilterDb() {
+            if (!filterDbPromise) {
+                filterDbPromise = new Promise(resolve => {
+                    try {
+                        if (!window.indexedDB) {
+                            resolve(null);
+                            return;
+                        }
+                        const request = indexedDB.open('edwhOdooSearch', 1);
+                        request.onupgradeneeded = () => request.result.createObjectStore('filters');
+                        request.onsuccess = () => resolve(request.result);
+                        request.onerror = () => resolve(null);
+                        request.onblocked = () => resolve(null);
+                    } catch (e) {
+                        resolve(null);
+                    }
+                });
+            }
+            return filterDbPromise;
+        }
+        
+        function idbRequest(db, storeName, mode, action) {
+            return new Promise((resolve, reject) => {
+                const transaction = db.transaction(storeName, mode);
+                const request = action(transaction.objectStore(storeName));
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        
+        function localStorageGet(storeName, key) {
+            const saved = localStorage.getItem(`hierarchy_${storeName}_${key}`);
+            return saved ? JSON.parse(saved) : undefined;
+        }
+        
+        async function idbGet(storeName, key) {
+            const db = await openFilterDb();
+            if (!db) return localStorageGet(storeName, key);
+            
+            const value = await idbRequest(db, storeName, 'readonly', store => store.get(key));
+            if (value !== undefined) return value;
+            
+            // Filters saved before IndexedDB was used still live in localStorage: move them over once
+            const legacy = localStorageGet(storeName, key);
+            if (legacy !== undefined) {
+                try {
+                    await idbRequest(db, storeName, 'readwrite', store => store.put(legacy, key));
+                    localStorage.removeItem(`hierarchy_${storeName}_${key}`);
+                } catch (e) {
+                    console.warn('⚠️ Failed to migrate saved filters to IndexedDB:', e);
+                }
+            }
+            return legacy;
         }
         
-        function saveFilterState() {
+        async function idbPut(storeName, key, value) {
+            const db = await openFilterDb();
+            if (!db) {
+                localStorage.setItem(`hierarchy_${storeName}_${key}`, JSON.stringify(value));
+                return;
+            }
+            return idbRequest(db, storeName, 'readwrite', store => store.put(value, key));
+        }
+        
+        async function saveFilterState() {
             if (!window.currentHierarchy) return;
             
             const hierarchyId = window.currentHierarchy.root.id;
@@ -4580,27 +4777,42 @@ except Exception as e:
                 priority: parseInt(document.getElementById('prioritySlider').value)
             };
             
-            localStorage.setItem(`hierarchy_filters_${hierarchyType}_${hierarchyId}`, JSON.stringify(state));
+            try {
+                await idbPut('filters', `${hierarchyType}_${hierarchyId}`, state);
+            } catch (e) {
+                console.warn('⚠️ Failed to save filter state:', e);
+            }
         }
         
-        function applySavedFilters() {
+        async function applySavedFilters() {
             if (!window.currentHierarchy) {
-                console.log('📋 No current hierarchy, skipping saved filters');
+                if (DEBUG) console.log('📋 No current hierarchy, skipping saved filters');
                 return;
             }
             
-            const hierarchyId = window.currentHierarchy.root.id;
-            const hierarchyType = window.currentHierarchy.type;
+            const hierarchy = window.currentHierarchy;
+            const hierarchyId = hierarchy.root.id;
+            const hierarchyType = hierarchy.type;
+            
+            let state;
+            let loadError = null;
+            try {
+                state = await idbGet('filters', `${hierarchyType}_${hierarchyId}`);
+            } catch (e) {
+                loadError = e;
+            }
             
-            const saved = localStorage.getItem(`hierarchy_filters_${hierarchyType}_${hierarchyId}`);
-            if (!saved) {
-                console.log('📋 No saved filters found, using defaults (all stages active)');
+            // Another hierarchy was loaded while we were waiting for storage
+            if (window.currentHierarchy !== hierarchy) return;
+            
+            if (!state && !loadError) {
+                if (DEBUG) console.log('📋 No saved filters found, using defaults (all stages active)');
                 // Ensure all stages are active by default
                 const stageToggles = document.querySelectorAll('.stage-toggle');
-                console.log(`📋 Found ${stageToggles.length} stage toggles to activate`);
+                if (DEBUG) console.log(`📋 Found ${stageToggles.length} stage toggles to activate`);
                 stageToggles.forEach(toggle => {
                     toggle.classList.add('active');
-                    console.log(`  ✅ Activated stage: ${toggle.dataset.stage}`);
+                    if (DEBUG) console.log(`  ✅ Activated stage: ${toggle.dataset.stage}`);
                 });
                 applyFilters();
                 updateFilterSummary();
@@ -4608,20 +4820,20 @@ except Exception as e:
             }
             
             try {
-                const state = JSON.parse(saved);
-                console.log('📋 Applying saved filter state:', state);
+                if (loadError) throw loadError;
+                if (DEBUG) console.log('📋 Applying saved filter state:', state);
                 
                 // Apply stage filters
                 const stageToggles = document.querySelectorAll('.stage-toggle');
-                console.log(`📋 Found ${stageToggles.length} stage toggles to configure`);
+                if (DEBUG) console.log(`📋 Found ${stageToggles.length} stage toggles to configure`);
                 stageToggles.forEach(toggle => {
                     const stage = toggle.dataset.stage;
                     if (state.stages && state.stages.includes(stage)) {
                         toggle.classList.add('active');
-                        console.log(`  ✅ Activated saved stage: ${stage}`);
+                        if (DEBUG) console.log(`  ✅ Activated saved stage: ${stage}`);
                     } else {
                         toggle.classList.remove('active');
-                        console.log(`  ❌ Deactivated stage: ${stage}`);
+                        if (DEBUG) console.log(`  ❌ Deactivated stage: ${stage}`);
                     }
                 });
                 
@@ -4630,7 +4842,7 @@ except Exception as e:
                 if (prioritySlider) {
                     prioritySlider.value = state.priority || 0;
                     updatePriorityLabel(state.priority || 0);
-                    console.log(`📋 Set priority filter to: ${state.priority || 0}`);
+                    if (DEBUG) console.log(`📋 Set priority filter to: ${state.priority || 0}`);
                 }
                 
                 // Apply filters
@@ -4640,10 +4852,10 @@ except Exception as e:
                 console.warn('⚠️ Failed to load saved filter state:', e);
                 // Fallback to showing all stages
                 const stageToggles = document.querySelectorAll('.stage-toggle');
-                console.log(`📋 Fallback: activating all ${stageToggles.length} stage toggles`);
+                if (DEBUG) console.log(`📋 Fallback: activating all ${stageToggles.length} stage toggles`);
                 stageToggles.forEach(toggle => {
                     toggle.classList.add('active');
-                    console.log(`  ✅ Fallback activated stage: ${toggle.dataset.stage}`);
+                    if (DEBUG) console.log(`  ✅ Fallback activated stage: ${toggle.dataset.stage}`);
                 });
                 applyFilters();
                 updateFilterSummary();
@@ -4655,30 +4867,63 @@ except Exception as e:
         let draggedTaskId = null;
         let lastMoveOperation = null;
         let dragEnterTimeout = null;
-        let dragLeaveTimeout = null;
+        let pendingDragLeave = null;
+        let pendingLeaveRaf = 0;
         let currentDropTarget = null;
+        let pendingOverTarget = null;
+        let pendingDragRaf = 0;
+        let draggedPathPrefix = null;
+        const highlightedNodes = new Set();
+        let dragController = null;
+        
+        // Reused "moving" indicator; lives next to the container so tree re-renders don't remove it
+        const moveIndicator = createLoadingMessage('Moving task...');
+        moveIndicator.hidden = true;
+        hierarchyContainer.before(moveIndicator);
+        
+        // All .tree-node elements of the current render; only changes when the tree does
+        let treeNodesCache = null;
+        
+        function getTreeNodes() {
+            if (!treeNodesCache) {
+                treeNodesCache = Array.from(document.querySelectorAll('.tree-node'));
+            }
+            return treeNodesCache;
+        }
+        
+        function invalidateTreeNodes() {
+            treeNodesCache = null;
+        }
         
         function setupDragAndDrop() {
-            const draggableElements = document.querySelectorAll('.tree-node-content.draggable');
-            const dropTargets = document.querySelectorAll('.tree-node');
+            // Delegate all drag events to the hierarchy container, which outlives every tree render
+            const container = hierarchyContainer;
+            if (!container) return;
             
-            // Setup drag events
-            draggableElements.forEach(element => {
-                element.addEventListener('dragstart', handleDragStart);
-                element.addEventListener('dragend', handleDragEnd);
-            });
+            // Drop the listeners (and any drag state) of the previous render before binding again
+            if (dragController) {
+                dragController.abort();
+            }
+            if (draggedElement) {
+                handleDragEnd();
+            }
             
-            // Setup drop events with improved handling
-            dropTargets.forEach(target => {
-                target.addEventListener('dragover', handleDragOver);
-                target.addEventListener('dragenter', handleDragEnter);
-                target.addEventListener('dragleave', handleDragLeave);
-                target.addEventListener('drop', handleDrop);
-            });
+            dragController = new AbortController();
+            const options = { signal: dragController.signal };
+            container.addEventListener('dragstart', handleDragStart, options);
+            container.addEventListener('dragend', handleDragEnd, options);
+            container.addEventListener('dragover', handleDragOver, options);
+            container.addEventListener('dragenter', handleDragEnter, options);
+            container.addEventListener('dragleave', handleDragLeave, options);
+            container.addEventListener('drop', handleDrop, options);
         }
         
         function handleDragStart(e) {
-            draggedElement = e.target.closest('.tree-node');
+            const dragSource = e.target.closest('.tree-node-content.draggable');
+            if (!dragSource) return;
+            
+            draggedElement = dragSource.closest('.tree-node');
+            draggedPathPrefix = draggedElement.dataset.path ? draggedElement.dataset.path + '/' : null;
             
             // Try multiple ways to get the task ID
             let taskId = null;
@@ -4701,6 +4946,9 @@ except Exception as e:
                 draggedElement.classList.remove('dragging');
             }
             
+            // Drop any highlight update that has not been painted yet
+            cancelPendingDragTarget();
+            
             // Clean up all drag classes
             clearAllDropZoneHighlighting();
             
@@ -4709,40 +4957,66 @@ except Exception as e:
                 clearTimeout(dragEnterTimeout);
                 dragEnterTimeout = null;
             }
-            if (dragLeaveTimeout) {
-                clearTimeout(dragLeaveTimeout);
-                dragLeaveTimeout = null;
-            }
+            cancelPendingDragLeave();
             
             draggedElement = null;
+            draggedPathPrefix = null;
             draggedTaskId = null;
             currentDropTarget = null;
         }
         
         function handleDragOver(e) {
+            if (!draggedElement) return;
             e.preventDefault();
             e.dataTransfer.dropEffect = 'move';
         }
         
         function handleDragEnter(e) {
+            if (!draggedElement) return;
             e.preventDefault();
             const targetNode = e.target.closest('.tree-node');
             
             if (!targetNode || targetNode === draggedElement) return;
             
-            // Clear any pending leave timeout
-            if (dragLeaveTimeout) {
-                clearTimeout(dragLeaveTimeout);
-                dragLeaveTimeout = null;
+            // Entering a node supersedes any leave that has not been evaluated yet
+            cancelPendingDragLeave();
+            
+            // Nothing to repaint if this node is already (about to be) the highlighted target
+            if (targetNode === pendingOverTarget || (!pendingDragRaf && targetNode === currentDropTarget)) return;
+            
+            // Coalesce highlighting to at most one update per animation frame
+            pendingOverTarget = targetNode;
+            if (!pendingDragRaf) {
+                pendingDragRaf = requestAnimationFrame(flushDragTarget);
             }
+        }
+        
+        function flushDragTarget() {
+            pendingDragRaf = 0;
+            const targetNode = pendingOverTarget;
+            pendingOverTarget = null;
+            
+            if (!targetNode || !draggedElement || targetNode === currentDropTarget) return;
             
             // Clear previous target highlighting
-            if (currentDropTarget && currentDropTarget !== targetNode) {
+            if (currentDropTarget) {
                 clearActiveDropTargetClasses(currentDropTarget);
             }
             
             currentDropTarget = targetNode;
-            
+            applyDropClasses(targetNode);
+        }
+        
+        function cancelPendingDragTarget() {
+            if (pendingDragRaf) {
+                cancelAnimationFrame(pendingDragRaf);
+                pendingDragRaf = 0;
+            }
+            pendingOverTarget = null;
+        }
+        
+        function applyDropClasses(targetNode) {
+            highlightedNodes.add(targetNode);
             // Add appropriate visual feedback with more stable highlighting
             if (isValidDropTarget(targetNode)) {
                 targetNode.classList.remove('potential-drop-zone', 'invalid-drop-target');
@@ -4754,37 +5028,53 @@ except Exception as e:
         }
         
         function handleDragLeave(e) {
+            if (!draggedElement) return;
             const targetNode = e.target.closest('.tree-node');
             if (!targetNode) return;
             
+            // Evaluate at most one leave per animation frame, using the latest pointer position
+            pendingDragLeave = { x: e.clientX, y: e.clientY, target: targetNode };
+            if (!pendingLeaveRaf) {
+                pendingLeaveRaf = requestAnimationFrame(processDragLeave);
+            }
+        }
+        
+        function processDragLeave() {
+            pendingLeaveRaf = 0;
+            const leave = pendingDragLeave;
+            pendingDragLeave = null;
+            
+            if (!leave || leave.target !== currentDropTarget) return;
+            
             // Only clear if we're actually leaving the node (not just moving to a child)
-            const rect = targetNode.getBoundingClientRect();
-            const x = e.clientX;
-            const y = e.clientY;
+            const rect = leave.target.getBoundingClientRect();
             
             // Check if we're still within the node bounds
             const stillInside = (
-                x >= rect.left && 
-                x <= rect.right && 
-                y >= rect.top && 
-                y <= rect.bottom
+                leave.x >= rect.left && 
+                leave.x <= rect.right && 
+                leave.y >= rect.top && 
+                leave.y <= rect.bottom
             );
             
             if (!stillInside) {
-                // Use a small timeout to prevent flickering
-                dragLeaveTimeout = setTimeout(() => {
-                    if (targetNode === currentDropTarget) {
-                        clearActiveDropTargetClasses(targetNode);
-                        // Restore potential drop zone highlighting
-                        if (isValidDropTarget(targetNode)) {
-                            targetNode.classList.add('potential-drop-zone');
-                        }
-                        currentDropTarget = null;
-                    }
-                }, 100);
+                clearActiveDropTargetClasses(leave.target);
+                // Restore potential drop zone highlighting
+                if (isValidDropTarget(leave.target)) {
+                    leave.target.classList.add('potential-drop-zone');
+                }
+                currentDropTarget = null;
             }
         }
         
+        function cancelPendingDragLeave() {
+            if (pendingLeaveRaf) {
+                cancelAnimationFrame(pendingLeaveRaf);
+                pendingLeaveRaf = 0;
+            }
+            pendingDragLeave = null;
+        }
+        
         function clearDropTargetClasses(node) {
             if (node) {
                 node.classList.remove('drag-over', 'valid-drop-target', 'invalid-drop-target', 'potential-drop-zone');
@@ -4798,24 +5088,34 @@ except Exception as e:
         }
         
         function highlightPotentialDropZones() {
-            // Highlight all nodes that could potentially be drop targets
-            const allNodes = document.querySelectorAll('.tree-node');
-            allNodes.forEach(node => {
-                if (node !== draggedElement && isValidDropTarget(node)) {
-                    node.classList.add('potential-drop-zone');
-                }
+            // Collect all nodes that could potentially be drop targets first,
+            // then apply the classes in one batch on the next frame
+            const toHighlight = getTreeNodes().filter(node => node !== draggedElement && isValidDropTarget(node));
+            toHighlight.forEach(node => highlightedNodes.add(node));
+            requestAnimationFrame(() => {
+                toHighlight.forEach(node => node.classList.add('potential-drop-zone'));
             });
         }
         
         function clearAllDropZoneHighlighting() {
-            const allNodes = document.querySelectorAll('.tree-node');
-            allNodes.forEach(node => {
-                clearDropTargetClasses(node);
+            // Only nodes that actually received a drop-zone class need cleaning up
+            const toClear = Array.from(highlightedNodes);
+            highlightedNodes.clear();
+            requestAnimationFrame(() => {
+                toClear.forEach(node => clearDropTargetClasses(node));
             });
         }
         
+        // Confirmation texts for a drop, keyed by the target node's data-type
+        const MOVE_MESSAGES = Object.freeze({
+            project: (taskName, targetName) => `Move "${taskName}" to become a main task in project "${targetName}"?`,
+            task: (taskName, targetName) => `Move "${taskName}" to become a subtask of "${targetName}"?`
+        });
+        
         async function handleDrop(e) {
+            if (!draggedElement) return;
             e.preventDefault();
+            cancelPendingDragTarget();
             const targetNode = e.target.closest('.tree-node');
             
             // Capture the draggedTaskId and oldParentId immediately before any async operations
@@ -4823,7 +5123,7 @@ except Exception as e:
             const oldParentId = draggedElement.closest('.tree-node[data-type="task"]')?.dataset.taskId || 'root';
             
             if (!targetNode || !draggedElement || targetNode === draggedElement) {
-                console.log('Drop cancelled: invalid target or same element');
+                dlog('Drop cancelled: invalid target or same element');
                 return;
             }
             
@@ -4837,38 +5137,8 @@ except Exception as e:
             const targetType = targetNode.dataset.type;
             
             if (targetType === 'task') {
-                // Try multiple methods to get target task ID
+                // data-task-id is always rendered as an integer string for task nodes
                 targetTaskId = targetNode.dataset.taskId;
-                
-                if (!targetTaskId || targetTaskId === 'null' || targetTaskId === 'undefined' || targetTaskId === 'unknown') {
-                    const nodeId = targetNode.dataset.nodeId;
-                    if (nodeId) {
-                        const match = nodeId.match(/node-task-(\d+)/);
-                        if (match) {
-                            targetTaskId = match[1];
-                        }
-                    }
-                }
-                
-                if (!targetTaskId || targetTaskId === 'null' || targetTaskId === 'undefined' || targetTaskId === 'unknown') {
-                    const labelElement = targetNode.querySelector('.tree-label small');
-                    if (labelElement) {
-                        const match = labelElement.textContent.match(/ID:\s*(\d+)/);
-                        if (match) {
-                            targetTaskId = match[1];
-                        }
-                    }
-                }
-                
-                if (!targetTaskId || targetTaskId === 'null' || targetTaskId === 'undefined' || targetTaskId === 'unknown') {
-                    const linkElement = targetNode.querySelector('.tree-label a');
-                    if (linkElement && linkElement.href) {
-                        const match = linkElement.href.match(/id=(\d+)/);
-                        if (match) {
-                            targetTaskId = match[1];
-                        }
-                    }
-                }
             }
             
             // Determine new parent ID
@@ -4880,26 +5150,21 @@ except Exception as e:
             }
             
             // Validate we have valid IDs
-            if (!taskIdToMove || !/^\d+$/.test(taskIdToMove)) {
+            if (!isValidId(taskIdToMove)) {
                 showToast('Cannot move task: Invalid source task ID', 'error');
                 console.error('Invalid taskIdToMove:', taskIdToMove);
                 return;
             }
             
-            if (targetType === 'task' && (!newParentId || !/^\d+$/.test(newParentId))) {
+            if (targetType === 'task' && !isValidId(newParentId)) {
                 showToast('Cannot move task: Invalid target task ID', 'error');
                 console.error('Invalid newParentId:', newParentId);
                 return;
             }
             
             // Show confirmation with custom modal
-            const draggedTaskName = draggedElement.querySelector('.tree-label a').textContent;
-            const targetName = targetNode.querySelector('.tree-label a').textContent;
-            
-            const message = targetType === 'project' 
-                ? `Move "${draggedTaskName}" to become a main task in project "${targetName}"?`
-                : `Move "${draggedTaskName}" to become a subtask of "${targetName}"?`;
-            
+            const messageTemplate = MOVE_MESSAGES[targetType] || MOVE_MESSAGES.task;
+            const message = messageTemplate(draggedElement.dataset.name, targetNode.dataset.name);
             
             const confirmed = await showModal('Move Task', message, 'Move', 'Cancel');
             
@@ -4922,6 +5187,15 @@ except Exception as e:
         }
         
         function isDescendant(potentialDescendant, ancestor) {
+            // Nodes carry their materialized path (data-path), so containment is a prefix check
+            const ancestorPrefix = ancestor === draggedElement
+                ? draggedPathPrefix
+                : (ancestor.dataset.path ? ancestor.dataset.path + '/' : null);
+            const path = potentialDescendant.dataset.path;
+            if (ancestorPrefix && path) {
+                return path.startsWith(ancestorPrefix);
+            }
+            
             let current = potentialDescendant.parentElement;
             
             while (current) {
@@ -4947,7 +5221,7 @@ except Exception as e:
                 });
                 
                 // Capture scroll position
-                const container = document.getElementById('hierarchyContainer');
+                const container = hierarchyContainer;
                 this.scrollPosition = container ? container.scrollTop : 0;
                 
                 // Capture active filters
@@ -4956,7 +5230,7 @@ except Exception as e:
                     priority: parseInt(document.getElementById('prioritySlider')?.value || 0)
                 };
                 
-                console.log('📸 State captured:', {
+                dlog('📸 State captured:', {
                     expandedNodes: Array.from(this.expandedNodes),
                     scrollPosition: this.scrollPosition,
                     activeFilters: this.activeFilters
@@ -4976,7 +5250,7 @@ except Exception as e:
                 });
                 
                 // Restore scroll position
-                const container = document.getElementById('hierarchyContainer');
+                const container = hierarchyContainer;
                 if (container) {
                     container.scrollTop = this.scrollPosition;
                 }
@@ -5004,22 +5278,27 @@ except Exception as e:
                 applyFilters();
                 updateFilterSummary();
                 
-                console.log('🔄 State restored');
+                dlog('🔄 State restored');
             }
         };
 
-        function performTaskMove(taskId, newParentId, targetTaskId, oldParentId) {
+        // Moves are server-side writes, so they are never aborted; a sequence number tells
+        // whether a response still belongs to the newest move
+        let moveSequence = 0;
+        let pendingMoves = 0;
+        
+        async function performTaskMove(taskId, newParentId, targetTaskId, oldParentId) {
             // Validate inputs before making API call
-            console.log('🔄 performTaskMove called with:', { taskId, newParentId, targetTaskId, oldParentId });
+            dlog('🔄 performTaskMove called with:', { taskId, newParentId, targetTaskId, oldParentId });
             
             // Strict validation
-            if (!taskId || taskId === 'null' || taskId === 'undefined' || taskId === 'unknown' || !/^\d+$/.test(taskId)) {
+            if (!isValidId(taskId)) {
                 console.error('❌ Invalid taskId for move operation:', taskId);
                 showToast('Error: Invalid task ID for move operation', 'error');
                 return;
             }
             
-            if (!newParentId || (newParentId !== 'root' && (newParentId === 'null' || newParentId === 'undefined' || newParentId === 'unknown' || !/^\d+$/.test(newParentId)))) {
+            if (newParentId !== 'root' && !isValidId(newParentId)) {
                 console.error('❌ Invalid newParentId for move operation:', newParentId);
                 showToast('Error: Invalid parent ID for move operation', 'error');
                 return;
@@ -5032,61 +5311,112 @@ except Exception as e:
             const rollbackData = performOptimisticMove(taskId, newParentId, oldParentId);
             
             // Prepare API call with partial update support
-            const params = new URLSearchParams({
-                task_id: taskId,
-                new_parent_id: newParentId,
-                old_parent_id: oldParentId || '',
-                partial: 'true'
-            });
+            const apiUrl = new URL('/api/move-task', location.origin);
+            apiUrl.searchParams.set('task_id', taskId);
+            apiUrl.searchParams.set('new_parent_id', newParentId);
+            apiUrl.searchParams.set('old_parent_id', oldParentId || '');
+            apiUrl.searchParams.set('partial', 'true');
             
             // Add project ID if moving to project root
-            if (newParentId === 'root' && window.currentHierarchy && window.currentHierarchy.type === 'project') {
-                params.append('project_id', window.currentHierarchy.root.id);
+            if (newParentId === 'root' && window.currentHierarchy?.type === 'project') {
+                apiUrl.searchParams.set('project_id', window.currentHierarchy.root.id);
             }
             
-            const apiUrl = '/api/move-task?' + params.toString();
-            fetch(apiUrl)
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        if (data.partial_update && data.updates) {
-                            // Apply server-side partial updates
-                            applyPartialUpdates(data.updates);
-                            
-                            // Restore state
-                            HierarchyState.restoreState();
-                            
-                            // Store for undo
-                            lastMoveOperation = {
-                                taskId: taskId,
-                                oldParentId: oldParentId,
-                                newParentId: newParentId,
-                                timestamp: Date.now(),
-                                operationId: data.operation_id
-                            };
-                            
-                            showToast(data.message || 'Task moved successfully', 'success');
-                        } else {
-                            // Fallback to full refresh for legacy response
-                            refreshCurrentHierarchy();
-                            showToast(data.message || 'Task moved successfully', 'success');
-                        }
+            const sequence = ++moveSequence;
+            pendingMoves++;
+            moveIndicator.hidden = false;
+            
+            // Undo a failed move: the saved DOM only matches if no newer move changed the tree since
+            const undoFailedMove = () => {
+                if (sequence === moveSequence) {
+                    rollbackOptimisticMove(rollbackData);
+                } else {
+                    refreshCurrentHierarchy();
+                }
+            };
+            
+            let response;
+            try {
+                response = await fetch(apiUrl);
+            } catch (error) {
+                // The request may or may not have reached the server; reload to show what it did
+                console.error('❌ Move API error:', error);
+                refreshCurrentHierarchy();
+                showToast('Move status unknown, reloaded the hierarchy: ' + error.message, 'error');
+                moveSettled();
+                return;
+            }
+            
+            try {
+                if (!response.ok) {
+                    // Error bodies are small JSON objects; only read them for the message
+                    const errorData = await response.json().catch(() => ({}));
+                    undoFailedMove();
+                    showToast('Move failed: ' + (errorData.error || `HTTP ${response.status}`), 'error');
+                    return;
+                }
+                
+                const data = await response.json();
+                if (data.success) {
+                    if (sequence !== moveSequence) {
+                        // A newer move is under way; its response carries the newer tree, so
+                        // applying these updates could undo its optimistic change
+                        clearOptimisticFeedback(taskId);
+                        showToast(data.message || 'Task moved successfully', 'success');
+                    } else if (data.partial_update && data.updates) {
+                        // Apply server-side partial updates
+                        applyPartialUpdates(data.updates);
+                        
+                        // Restore state
+                        HierarchyState.restoreState();
+                        
+                        // Store for undo
+                        lastMoveOperation = {
+                            taskId: taskId,
+                            oldParentId: oldParentId,
+                            newParentId: newParentId,
+                            timestamp: Date.now(),
+                            operationId: data.operation_id
+                        };
+                        
+                        showToast(data.message || 'Task moved successfully', 'success');
                     } else {
-                        // Rollback optimistic changes
-                        rollbackOptimisticMove(rollbackData);
-                        showToast('Move failed: ' + (data.error || 'Unknown error'), 'error');
+                        // Fallback to full refresh for legacy response
+                        refreshCurrentHierarchy();
+                        showToast(data.message || 'Task moved successfully', 'success');
                     }
-                })
-                .catch(error => {
+                } else {
                     // Rollback optimistic changes
-                    rollbackOptimisticMove(rollbackData);
-                    console.error('❌ Move API error:', error);
-                    showToast('Move failed: ' + error.message, 'error');
-                });
+                    undoFailedMove();
+                    showToast('Move failed: ' + (data.error || 'Unknown error'), 'error');
+                }
+            } catch (error) {
+                // The server answered 2xx but the body was unreadable, so the outcome is unknown
+                console.error('❌ Move API error:', error);
+                refreshCurrentHierarchy();
+                showToast('Move status unknown, reloaded the hierarchy: ' + error.message, 'error');
+            } finally {
+                moveSettled();
+            }
+        }
+        
+        function moveSettled() {
+            pendingMoves--;
+            if (pendingMoves === 0) {
+                moveIndicator.hidden = true;
+            }
+        }
+        
+        function clearOptimisticFeedback(taskId) {
+            const node = document.querySelector(`[data-task-id="${taskId}"]`);
+            if (node) {
+                node.style.opacity = '';
+                node.style.transform = '';
+            }
         }
 
         function performOptimisticMove(taskId, newParentId, oldParentId) {
-            console.log('⚡ Performing optimistic move:', { taskId, newParentId, oldParentId });
+            dlog('⚡ Performing optimistic move:', { taskId, newParentId, oldParentId });
             
             const draggedNode = document.querySelector(`[data-task-id="${taskId}"]`);
             if (!draggedNode) {
@@ -5112,12 +5442,14 @@ except Exception as e:
                 const projectChildren = document.querySelector('.tree-view > .tree-node .tree-children');
                 if (projectChildren) {
                     projectChildren.appendChild(draggedNode);
+                    refreshNodePaths(draggedNode);
                 }
             } else {
                 // Moving to another task
                 const newParentChildren = document.getElementById(`children-node-task-${newParentId}`);
                 if (newParentChildren) {
                     newParentChildren.appendChild(draggedNode);
+                    refreshNodePaths(draggedNode);
                 }
             }
             
@@ -5127,7 +5459,7 @@ except Exception as e:
         function rollbackOptimisticMove(rollbackData) {
             if (!rollbackData) return;
             
-            console.log('🔄 Rolling back optimistic move');
+            dlog('🔄 Rolling back optimistic move');
             
             // Find current node and remove it
             const currentNode = document.querySelector(`[data-task-id="${rollbackData.node.dataset.taskId}"]`);
@@ -5141,6 +5473,8 @@ except Exception as e:
             } else {
                 rollbackData.originalParent.appendChild(rollbackData.node);
             }
+            refreshNodePaths(rollbackData.node);
+            invalidateTreeNodes();
             
             // Remove visual feedback
             rollbackData.node.style.opacity = '';
@@ -5149,7 +5483,7 @@ except Exception as e:
         }
 
         function applyPartialUpdates(updates) {
-            console.log('🔧 Applying partial updates:', updates);
+            dlog('🔧 Applying partial updates:', updates);
             
             try {
                 // Handle removal from old parent
@@ -5165,6 +5499,7 @@ except Exception as e:
                         setTimeout(() => {
                             if (nodeToRemove.parentElement) {
                                 nodeToRemove.remove();
+                                invalidateTreeNodes();
                             }
                         }, 300);
                     }
@@ -5198,15 +5533,14 @@ except Exception as e:
                         newNode.style.transition = 'all 0.3s ease';
                         
                         targetContainer.appendChild(newNode);
+                        refreshNodePaths(newNode);
+                        invalidateTreeNodes();
                         
                         // Trigger entrance animation
                         setTimeout(() => {
                             newNode.style.opacity = '1';
                             newNode.style.transform = 'scale(1)';
                         }, 50);
-                        
-                        // Setup drag & drop for new node
-                        setupDragAndDrop();
                     }
                 }
                 
@@ -5221,13 +5555,13 @@ except Exception as e:
                             const metadata = node.querySelector('.tree-metadata');
                             if (metadata) {
                                 // This would update task count displays if they exist
-                                console.log(`Updated child count for ${node_id} by ${nodeUpdates.child_count_change}`);
+                                dlog(`Updated child count for ${node_id} by ${nodeUpdates.child_count_change}`);
                             }
                         }
                     });
                 }
                 
-                console.log('✅ Partial updates applied successfully');
+                dlog('✅ Partial updates applied successfully');
                 
             } catch (error) {
                 console.error('❌ Error applying partial updates:', error);
@@ -5246,10 +5580,11 @@ except Exception as e:
             const hierarchyType = window.currentHierarchy.type;
             const hierarchyId = window.currentHierarchy.root.id;
             
-            console.log('🔄 Refreshing hierarchy (fallback)');
+            dlog('🔄 Refreshing hierarchy (fallback)');
             
             // Capture state before refresh
             HierarchyState.captureState();
+            invalidateTreeNodes();
             
             // Reload the hierarchy
             loadHierarchy(hierarchyType, hierarchyId);
@@ -5260,17 +5595,17 @@ except Exception as e:
         
         function showModal(title, message, confirmText = 'Confirm', cancelText = 'Cancel') {
             return new Promise((resolve) => {
-                document.getElementById('modalTitle').textContent = title;
-                document.getElementById('modalBody').textContent = message;
-                document.getElementById('modalConfirmBtn').textContent = confirmText;
+                MODAL.title.textContent = title;
+                MODAL.body.textContent = message;
+                MODAL.confirm.textContent = confirmText;
                 
                 modalCallback = resolve;
-                document.getElementById('customModal').classList.add('show');
+                MODAL.root.classList.add('show');
             });
         }
         
         function closeModal() {
-            document.getElementById('customModal').classList.remove('show');
+            MODAL.root.classList.remove('show');
             if (modalCallback) {
                 modalCallback(false);
                 modalCallback = null;
@@ -5278,7 +5613,7 @@ except Exception as e:
         }
         
         function confirmModal() {
-            document.getElementById('customModal').classList.remove('show');
+            MODAL.root.classList.remove('show');
             if (modalCallback) {
                 modalCallback(true);
                 modalCallback = null;
@@ -5286,35 +5621,61 @@ except Exception as e:
         }
         
         // Toast Notification System
+        const TOAST_ICONS = Object.freeze({
+            'success': '✅',
+            'error': '❌',
+            'warning': '⚠️',
+            'info': 'ℹ️'
+        });
+        
+        // Toasts created within the same frame are revealed by one shared double-rAF
+        let toastsToReveal = [];
+        
+        function revealToast(toast) {
+            toastsToReveal.push(toast);
+            if (toastsToReveal.length > 1) return;
+            
+            requestAnimationFrame(() => requestAnimationFrame(() => {
+                const batch = toastsToReveal;
+                toastsToReveal = [];
+                batch.forEach(item => item.classList.add('show'));
+            }));
+        }
+        
         function showToast(message, type = 'success', duration = 3000) {
-            const container = document.getElementById('toastContainer');
+            const container = toastContainer;
             const toast = document.createElement('div');
             toast.className = `toast ${type}`;
             
             const toastId = 'toast-' + Date.now();
             toast.id = toastId;
             
-            const icon = {
-                'success': '✅',
-                'error': '❌',
-                'warning': '⚠️',
-                'info': 'ℹ️'
-            }[type] || '✅';
-            
-            toast.innerHTML = `
-                <div class="toast-header">
-                    <div class="toast-title">${icon} ${type.charAt(0).toUpperCase() + type.slice(1)}</div>
-                    <button class="toast-close" onclick="closeToast('${toastId}')">&times;</button>
-                </div>
-                <div class="toast-body">${message}</div>
-            `;
+            const icon = TOAST_ICONS[type] || '✅';
+            
+            // Build the DOM directly: no HTML parsing, and the message is always treated as text
+            const header = document.createElement('div');
+            header.className = 'toast-header';
+            
+            const title = document.createElement('div');
+            title.className = 'toast-title';
+            title.textContent = `${icon} ${type.charAt(0).toUpperCase() + type.slice(1)}`;
+            
+            const closeButton = document.createElement('button');
+            closeButton.className = 'toast-close';
+            closeButton.textContent = '×';
+            closeButton.onclick = () => closeToast(toastId);
+            
+            const body = document.createElement('div');
+            body.className = 'toast-body';
+            body.textContent = message;
+            
+            header.append(title, closeButton);
+            toast.append(header, body);
             
             container.appendChild(toast);
             
-            // Trigger animation
-            setTimeout(() => {
-                toast.classList.add('show');
-            }, 10);
+            // Trigger animation once the toast has been painted in its initial state
+            revealToast(toast);
             
             // Auto-remove
             if (duration > 0) {
@@ -5344,9 +5705,18 @@ except Exception as e:
 </body>
 </html>"""
 
-    def log_message(self, format, *args):
-        """Override to reduce logging noise"""
-        pass
+MAIN_HTML_BYTES = MAIN_HTML.encode('utf-8')
+MAIN_HTML_GZIP = gzip.compress(MAIN_HTML_BYTES, 9)
+MAIN_HTML_HASH = hashlib.sha1(MAIN_HTML_BYTES).hexdigest()
+
+
+class WebSearchHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for the bursts of parallel fetches the UI makes"""
+    
+    # One thread per request, so a slow move/search API call doesn't block the UI's other requests
+    daemon_threads = True
+    # Default listen backlog is 5; the hierarchy/move flow can open more connections than that at once
+    request_queue_size = 128
 
 
 class WebSearchServer:
@@ -5360,7 +5730,7 @@ class WebSearchServer:
     def start(self, open_browser=True):
         """Start the web server"""
         try:
-            self.server = HTTPServer((self.host, self.port), WebSearchHandler)
+            self.server = WebSearchHTTPServer((self.host, self.port), WebSearchHandler)
             
             print(f"🚀 Odoo Web Search Server starting...")
             print(f"📍 Server running at: http://{self.host}:{self.port}")
@@ -0,0 +1,150 @@
+from itertools import product
+
+import pytest
+
+from edwh_odoo_plugin.odoo_base import DomainBuilder
+
+A = ('a', '=', 1)
+B = ('b', '=', 1)
+C = ('c', '=', 1)
+D = ('d', '=', 1)
+
+
+def evaluate(domain, record):
+    """Evaluate a domain of (field, '=', value) leaves the way Odoo does, implicit ANDs included"""
+    arity = {'!': 1, '&': 2, '|': 2}
+
+    def parse(position):
+        token = domain[position]
+        if isinstance(token, tuple):
+            field, _, value = token
+            return record[field] == value, position + 1
+        values = []
+        position += 1
+        for _ in range(arity[token]):
+            value, position = parse(position)
+            values.append(value)
+        if token == '!':
+            return not values[0], position
+        return (all(values) if token == '&' else any(values)), position
+
+    results = []
+    position = 0
+    while position < len(domain):
+        value, position = parse(position)
+        results.append(value)
+    return all(results)
+
+
+def records():
+    """Every combination of the fields used in A, B, C and D matching or not"""
+    for values in product([0, 1], repeat=4):
+        yield dict(zip('abcd', values))
+
+
+def assert_prefix(domain):
+    """A normalized domain is exactly one complete prefix expression"""
+    arity = {'!': 1, '&': 2, '|': 2}
+    expected = 1
+    for token in domain:
+        assert expected > 0, f"trailing terms in {domain}"
+        expected += -1 if isinstance(token, tuple) else arity[token] - 1
+    assert expected == 0, f"incomplete domain {domain}"
+
+
+@pytest.mark.parametrize('domain, normalized', [
+    ([], []),
+    ([A], [A]),
+    ([A, B], ['&', A, B]),
+    ([A, B, C], ['&', '&', A, B, C]),
+    (['|', A, B], ['|', A, B]),
+    (['|', A, B, C], ['&', '|', A, B, C]),
+    ([A, '|', B, C], ['&', A, '|', B, C]),
+    (['!', A, B], ['&', '!', A, B]),
+    (['|', '!', A, B], ['|', '!', A, B]),
+    (['&', A, '|', B, '!', C], ['&', A, '|', B, '!', C]),
+    (['|', '&', A, B, '!', C, D], ['&', '|', '&', A, B, '!', C, D]),
+])
+def test_normalize_domain(domain, normalized):
+    assert DomainBuilder.normalize_domain(domain) == normalized
+    if domain:
+        assert_prefix(normalized)
+        for record in records():
+            assert evaluate(normalized, record) == evaluate(domain, record)
+
+
+def test_and_domains_skips_empty_parts():
+    assert DomainBuilder.and_domains() == []
+    assert DomainBuilder.and_domains([], None, []) == []
+    assert DomainBuilder.and_domains([], [A], []) == [A]
+    assert DomainBuilder.and_domains([A, B], []) == ['&', A, B]
+
+
+@pytest.mark.parametrize('parts', [
+    ([A], [B]),
+    ([A, B], [C]),
+    (['|', A, B], [C, D]),
+    (['!', A], ['|', B, C], [D]),
+])
+def test_and_domains(parts):
+    combined = DomainBuilder.and_domains(*parts)
+    assert_prefix(combined)
+    for record in records():
+        assert evaluate(combined, record) == all(evaluate(part, record) for part in parts)
+
+
+def test_or_domains_skips_empty_parts():
+    assert DomainBuilder.or_domains() == []
+    assert DomainBuilder.or_domains([], []) == []
+    assert DomainBuilder.or_domains([A], []) == [A]
+
+
+@pytest.mark.parametrize('parts', [
+    ([A], [B]),
+    ([A], [], [B, C], [D]),
+    (['|', A, B], ['!', C]),
+    ([A, B], [C, D]),
+])
+def test_or_domains(parts):
+    combined = DomainBuilder.or_domains(*parts)
+    assert_prefix(combined)
+    for record in records():
+        assert evaluate(combined, record) == any(evaluate(part, record) for part in parts if part)
+
+
+def test_or_domains_keeps_nested_ands():
+    assert DomainBuilder.or_domains([A], [B, C], [D]) == ['|', '|', A, '&', B, C, D]
+
+
+def test_combine_with_and():
+    # A base domain with several implicit terms gets an '&' for each of them
+    assert DomainBuilder.combine_with_and([A, B], C) == ['&', '&', A, B, C]
+    assert DomainBuilder.combine_with_and([A], None, C) == ['&', A, C]
+    assert DomainBuilder.combine_with_and([], C) == [C]
+    assert DomainBuilder.combine_with_and([A]) == [A]
+    assert DomainBuilder.combine_with_and([]) == []
+
+
+def test_combine_with_and_keeps_meaning():
+    combined = DomainBuilder.combine_with_and(['|', A, B], C, D)
+    assert_prefix(combined)
+    for record in records():
+        assert evaluate(combined, record) == ((record['a'] or record['b']) and record['c'] and record['d'])
+
+
+def test_combine_with_or():
+    assert DomainBuilder.combine_with_or([A], [B], [C]) == ['|', '|', A, B, C]
+    assert DomainBuilder.combine_with_or([A], []) == [A]
+    assert DomainBuilder.combine_with_or() == []
+
+
+def test_text_search_domain():
+    assert DomainBuilder.text_search_domain('x', ['name']) == [('name', 'ilike', 'x')]
+    assert DomainBuilder.text_search_domain(['x', 'y'], ['name', 'description']) == [
+        '|', '|', '|',
+        ('name', 'ilike', 'x'), ('name', 'ilike', 'y'),
+        ('description', 'ilike', 'x'), ('description', 'ilike', 'y'),
+    ]
+    assert DomainBuilder.text_search_domain('x', ['name', 'description'], include_descriptions=False) == [
+        ('name', 'ilike', 'x'),
+    ]
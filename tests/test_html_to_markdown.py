@@ -0,0 +1,100 @@
+import pytest
+
+from edwh_odoo_plugin.odoo_base import MarkdownConverter, OdooBase
+
+
+@pytest.fixture
+def base():
+    """An OdooBase without a connection, html_to_markdown needs none"""
+    base = OdooBase.__new__(OdooBase)
+    base.verbose = False
+    return base
+
+
+@pytest.mark.parametrize('html, markdown', [
+    ('<h1>Title</h1>', '# Title'),
+    ('<h2>Title</h2>', '## Title'),
+    ('<h3>Title</h3>', '### Title'),
+    ('<h6>Title</h6>', '###### Title'),
+    ('<strong>s</strong> <b>b</b>', '**s** **b**'),
+    ('<em>e</em> <i>i</i>', '*e* *i*'),
+    ('<u>u</u>', '_u_'),
+    ('<code>c</code>', '`c`'),
+    ('<blockquote>quote</blockquote>', '> quote'),
+    ('<p>a</p><p>b</p>', 'a\nb'),
+    ('<div>a<br/>b</div>', 'a\nb'),
+    ('plain text', 'plain text'),
+    ('a < b', 'a < b'),
+])
+def test_tag_table(base, html, markdown):
+    assert base.html_to_markdown(html) == markdown
+
+
+def test_heading_followed_by_break_leaves_blank_line(base):
+    # The heading's own newline plus the <br> gives a paragraph break
+    assert base.html_to_markdown('<h1>Title</h1><br>text') == '# Title\n\ntext'
+
+
+@pytest.mark.parametrize('html', ['', None])
+def test_empty_input(base, html):
+    assert base.html_to_markdown(html) == ''
+
+
+def test_unclosed_tags_are_closed(base):
+    assert base.html_to_markdown('<b>unclosed') == '**unclosed**'
+
+
+@pytest.mark.parametrize('html, markdown', [
+    ('caf&eacute; &amp; co', 'café & co'),
+    ('a&nbsp;b', 'a\xa0b'),
+    ('&#233;&#xe9;', 'éé'),
+])
+def test_entities_are_decoded(base, html, markdown):
+    assert base.html_to_markdown(html) == markdown
+
+
+def test_escaped_markup_stays_literal_text(base):
+    # Escaped markup was text in the source and is returned as that text, not parsed or dropped
+    assert base.html_to_markdown('plain &lt;b&gt;') == 'plain <b>'
+    assert base.html_to_markdown('&lt;script&gt;alert(1)&lt;/script&gt;') == '<script>alert(1)</script>'
+
+
+@pytest.mark.parametrize('html', [
+    '<script>alert(1)</script>ok',
+    '<style>p { color: red }</style>ok',
+])
+def test_script_and_style_are_dropped(base, html):
+    assert base.html_to_markdown(html) == 'ok'
+
+
+@pytest.mark.parametrize('html, markdown', [
+    ('<ul><li>one</li><li>two</li></ul>', '- one\n- two'),
+    ('<ol><li>one</li><li>two</li></ol>', '- one\n- two'),
+    ('<ul><li>one<li>two</ul>', '- one\n- two'),
+    ('<p>intro</p><ul><li>one</li></ul>', 'intro\n\n- one'),
+    ('<ul><li>a<ul><li>b</ul><li>c</ul>', '- a\n- b\n\n- c'),
+])
+def test_lists(base, html, markdown):
+    assert base.html_to_markdown(html) == markdown
+
+
+def test_implicitly_closed_paragraphs(base):
+    assert base.html_to_markdown('<p>a<p>b') == 'a\nb'
+
+
+@pytest.mark.parametrize('html, markdown', [
+    ('<a href="https://example.nl">link</a>', '[link](https://example.nl)'),
+    ('<a href="https://example.nl/?a=1&amp;b=2">link</a>', '[link](https://example.nl/?a=1&b=2)'),
+    ('<a>no href</a>', 'no href'),
+])
+def test_links(base, html, markdown):
+    assert base.html_to_markdown(html) == markdown
+
+
+def test_pre_code_keeps_whitespace(base):
+    assert base.html_to_markdown('<pre><code>x = 1\n  y</code></pre>') == '`x = 1\n  y`'
+
+
+def test_converter_matches_html_to_markdown(base):
+    html = '<h2>Title</h2><p>Some <b>bold</b> text</p>'
+    assert MarkdownConverter().convert(html).strip() == base.html_to_markdown(html)